@@ -16,6 +16,9 @@ if str(SRC_PATH) not in sys.path:
 
 from reservas_api.infrastructure.db.models import (  # noqa: E402,F401
     OfficeModel,
+    ProviderIdempotencyKeyModel,
+    ProviderOutboxDeadLetterModel,
+    ProviderOutboxEventArchiveModel,
     ProviderOutboxEventModel,
     ReservationContactModel,
     ReservationModel,
@@ -0,0 +1,82 @@
+"""add outbox retry scheduling columns and dead-letter table
+
+Revision ID: 20261019_0003
+Revises: 20260213_0002
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0003"
+down_revision: str = "20260213_0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "provider_outbox_events",
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.add_column(
+        "provider_outbox_events",
+        sa.Column(
+            "next_attempt_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+    )
+    op.execute("UPDATE provider_outbox_events SET next_attempt_at = created_at")
+    op.create_index(
+        "ix_provider_outbox_events_status_next_attempt_at",
+        "provider_outbox_events",
+        ["status", "next_attempt_at"],
+        unique=False,
+    )
+
+    op.create_table(
+        "provider_outbox_dead_letters",
+        sa.Column("id", sa.Integer(), nullable=False, autoincrement=True),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("aggregate_id", sa.String(length=64), nullable=False),
+        sa.Column("event_type", sa.String(length=80), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.String(length=500), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "dead_lettered_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("event_id"),
+    )
+    op.create_index(
+        "ix_provider_outbox_dead_letters_aggregate_id",
+        "provider_outbox_dead_letters",
+        ["aggregate_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_provider_outbox_dead_letters_aggregate_id",
+        table_name="provider_outbox_dead_letters",
+    )
+    op.drop_table("provider_outbox_dead_letters")
+
+    op.drop_index(
+        "ix_provider_outbox_events_status_next_attempt_at",
+        table_name="provider_outbox_events",
+    )
+    op.drop_column("provider_outbox_events", "next_attempt_at")
+    op.drop_column("provider_outbox_events", "attempts")
@@ -0,0 +1,37 @@
+"""move outbox last_error out of the payload JSON into its own column
+
+Revision ID: 20261019_0004
+Revises: 20261019_0003
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0004"
+down_revision: str = "20261019_0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "provider_outbox_events",
+        sa.Column("last_error", sa.String(length=500), nullable=True),
+    )
+    op.execute(
+        """
+        UPDATE provider_outbox_events
+        SET last_error = LEFT(JSON_UNQUOTE(JSON_EXTRACT(payload, '$.last_error')), 500),
+            payload = JSON_REMOVE(payload, '$.last_error')
+        WHERE JSON_CONTAINS_PATH(payload, 'one', '$.last_error')
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("provider_outbox_events", "last_error")
@@ -0,0 +1,64 @@
+"""add archive table for processed outbox events
+
+Revision ID: 20261019_0005
+Revises: 20261019_0004
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0005"
+down_revision: str = "20261019_0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "provider_outbox_events_archive",
+        sa.Column("id", sa.Integer(), nullable=False, autoincrement=False),
+        sa.Column("aggregate_id", sa.String(length=64), nullable=False),
+        sa.Column("event_type", sa.String(length=80), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_error", sa.String(length=500), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "archived_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_provider_outbox_events_archive_aggregate_id",
+        "provider_outbox_events_archive",
+        ["aggregate_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_provider_outbox_events_archive_archived_at",
+        "provider_outbox_events_archive",
+        ["archived_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_provider_outbox_events_archive_archived_at",
+        table_name="provider_outbox_events_archive",
+    )
+    op.drop_index(
+        "ix_provider_outbox_events_archive_aggregate_id",
+        table_name="provider_outbox_events_archive",
+    )
+    op.drop_table("provider_outbox_events_archive")
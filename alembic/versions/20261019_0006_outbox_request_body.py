@@ -0,0 +1,34 @@
+"""store the encoded gateway request body with outbox events
+
+Revision ID: 20261019_0006
+Revises: 20261019_0005
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0006"
+down_revision: str = "20261019_0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+OUTBOX_TABLES = (
+    "provider_outbox_events",
+    "provider_outbox_events_archive",
+    "provider_outbox_dead_letters",
+)
+
+
+def upgrade() -> None:
+    for table_name in OUTBOX_TABLES:
+        op.add_column(table_name, sa.Column("request_body", sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    for table_name in OUTBOX_TABLES:
+        op.drop_column(table_name, "request_body")
@@ -0,0 +1,67 @@
+"""add timestamps to provider idempotency keys
+
+Revision ID: 20261019_0007
+Revises: 20261019_0006
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0007"
+down_revision: str = "20261019_0006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLE_NAME = "provider_idempotency_keys"
+
+
+def _timestamp_columns() -> list[sa.Column]:
+    return [
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    # The table belongs to the provider catalog schema (tablas_provider.md); only create it
+    # with that DDL when this database does not have it yet.
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(TABLE_NAME):
+        op.create_table(
+            TABLE_NAME,
+            sa.Column("id", sa.Integer(), nullable=False, autoincrement=True),
+            sa.Column("idem_key", sa.String(length=128), nullable=False),
+            sa.Column("request_hash", sa.String(length=64), nullable=False),
+            sa.Column("response_body", sa.JSON(), nullable=True),
+            sa.Column("status", sa.String(length=20), nullable=True),
+            *_timestamp_columns(),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index(
+            "ix_provider_idempotency_keys_idem_key",
+            TABLE_NAME,
+            ["idem_key"],
+            unique=False,
+        )
+        return
+
+    existing_columns = {column["name"] for column in inspector.get_columns(TABLE_NAME)}
+    for column in _timestamp_columns():
+        if column.name not in existing_columns:
+            op.add_column(TABLE_NAME, column)
+
+
+def downgrade() -> None:
+    # Leave the provider-owned table in place; only drop what this revision added to it.
+    op.drop_column(TABLE_NAME, "updated_at")
+    op.drop_column(TABLE_NAME, "created_at")
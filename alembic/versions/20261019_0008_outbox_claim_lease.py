@@ -0,0 +1,34 @@
+"""add claim lease columns to outbox events
+
+Revision ID: 20261019_0008
+Revises: 20261019_0007
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0008"
+down_revision: str = "20261019_0007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "provider_outbox_events",
+        sa.Column("locked_by", sa.String(length=64), nullable=True),
+    )
+    op.add_column(
+        "provider_outbox_events",
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("provider_outbox_events", "locked_until")
+    op.drop_column("provider_outbox_events", "locked_by")
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from reservas_api.infrastructure.resilience import CircuitBreaker, SlidingWindowCircuitBreaker
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure per-call overhead of the circuit breaker implementations."
+    )
+    parser.add_argument("--calls", type=int, default=200_000, help="Calls per scenario.")
+    parser.add_argument("--concurrency", type=int, default=100, help="Concurrent callers.")
+    return parser.parse_args()
+
+
+async def _noop() -> None:
+    return None
+
+
+async def _measure(
+    call: Callable[[Callable[[], Awaitable[None]]], Awaitable[None]] | None,
+    calls: int,
+    concurrency: int,
+) -> float:
+    per_worker = calls // concurrency
+
+    async def _worker() -> None:
+        if call is None:
+            for _ in range(per_worker):
+                await _noop()
+        else:
+            for _ in range(per_worker):
+                await call(_noop)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(_worker() for _ in range(concurrency)))
+    return (time.perf_counter() - started_at) / (per_worker * concurrency)
+
+
+async def _run(args: argparse.Namespace) -> None:
+    baseline = await _measure(None, args.calls, args.concurrency)
+    scenarios = {
+        "CircuitBreaker": CircuitBreaker().call,
+        "SlidingWindow": SlidingWindowCircuitBreaker().call,
+    }
+    print(f"{'breaker':<18}{'ns/call':>10}{'overhead ns':>14}")
+    print(f"{'none':<18}{baseline * 1e9:>10.0f}{0:>14.0f}")
+    for name, call in scenarios.items():
+        per_call = await _measure(call, args.calls, args.concurrency)
+        print(f"{name:<18}{per_call * 1e9:>10.0f}{(per_call - baseline) * 1e9:>14.0f}")
+
+
+def main() -> int:
+    asyncio.run(_run(parse_args()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
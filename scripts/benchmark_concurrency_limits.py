@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+from reservas_api.infrastructure.resilience import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyLimitExceededError,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare a fixed outbound concurrency limit with the adaptive limiter "
+            "against a stand-in upstream whose capacity changes over time."
+        )
+    )
+    parser.add_argument("--rate", type=float, default=800.0, help="Offered requests per second.")
+    parser.add_argument("--phase-seconds", type=float, default=3.0, help="Duration of each phase.")
+    parser.add_argument(
+        "--capacities",
+        default="40,8,25",
+        help="Comma separated upstream capacity (concurrent requests served at full speed) per phase.",
+    )
+    parser.add_argument("--service-ms", type=float, default=20.0, help="Latency below capacity.")
+    parser.add_argument("--timeout-ms", type=float, default=500.0, help="Client request timeout.")
+    parser.add_argument(
+        "--fixed-limit", type=int, default=100, help="Fixed limit, e.g. HTTP_MAX_CONNECTIONS."
+    )
+    return parser.parse_args()
+
+
+class StandInUpstream:
+    """Processor-sharing upstream: latency grows once concurrency exceeds capacity."""
+
+    def __init__(self, args: argparse.Namespace, started_at: float) -> None:
+        self._capacities = [int(value) for value in args.capacities.split(",")]
+        self._phase_seconds = args.phase_seconds
+        self._service_seconds = args.service_ms / 1000
+        self._timeout_seconds = args.timeout_ms / 1000
+        self._started_at = started_at
+        self._in_flight = 0
+
+    def capacity(self) -> int:
+        phase = int((time.perf_counter() - self._started_at) / self._phase_seconds)
+        return self._capacities[min(phase, len(self._capacities) - 1)]
+
+    async def call(self) -> None:
+        self._in_flight += 1
+        try:
+            latency = self._service_seconds * max(1.0, self._in_flight / self.capacity())
+            if latency > self._timeout_seconds:
+                await asyncio.sleep(self._timeout_seconds)
+                raise TimeoutError
+            await asyncio.sleep(latency)
+        finally:
+            self._in_flight -= 1
+
+
+async def _run_scenario(
+    args: argparse.Namespace,
+    name: str,
+    wrap: Callable[[Callable[[], Awaitable[None]]], Awaitable[None]],
+) -> None:
+    started_at = time.perf_counter()
+    upstream = StandInUpstream(args, started_at)
+    duration = args.phase_seconds * len(args.capacities.split(","))
+    latencies: list[float] = []
+    timeouts = 0
+    shed = 0
+
+    async def _request() -> None:
+        nonlocal timeouts, shed
+        request_started_at = time.perf_counter()
+        try:
+            await asyncio.wait_for(wrap(upstream.call), timeout=args.timeout_ms / 1000)
+        except ConcurrencyLimitExceededError:
+            shed += 1
+            return
+        except TimeoutError:
+            timeouts += 1
+            return
+        latencies.append(time.perf_counter() - request_started_at)
+
+    tasks: list[asyncio.Task[None]] = []
+    interval = 1 / args.rate
+    sent = 0
+    while time.perf_counter() - started_at < duration:
+        due = int((time.perf_counter() - started_at) / interval)
+        for _ in range(due - sent):
+            tasks.append(asyncio.create_task(_request()))
+        sent = due
+        await asyncio.sleep(0.001)
+    await asyncio.gather(*tasks)
+
+    cut_points = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0.0] * 99
+    print(
+        f"{name:<10}{len(latencies) / duration:>10.1f}{cut_points[49] * 1000:>10.1f}"
+        f"{cut_points[98] * 1000:>10.1f}{timeouts:>10}{shed:>8}"
+    )
+
+
+async def _run(args: argparse.Namespace) -> None:
+    fixed = asyncio.Semaphore(args.fixed_limit)
+
+    async def _fixed(call: Callable[[], Awaitable[None]]) -> None:
+        async with fixed:
+            await call()
+
+    limiter = AdaptiveConcurrencyLimiter(
+        initial_limit=min(20, args.fixed_limit),
+        max_limit=args.fixed_limit,
+        queue_timeout_seconds=args.timeout_ms / 1000 / 2,
+    )
+
+    print(f"{'limiter':<10}{'ok/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'timeouts':>10}{'shed':>8}")
+    await _run_scenario(args, "fixed", _fixed)
+    await _run_scenario(args, "adaptive", limiter.call)
+
+
+def main() -> int:
+    asyncio.run(_run(parse_args()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+from reservas_api.application.use_cases import (
+    AddonItem,
+    CreateReservationRequest,
+    CreateReservationUseCase,
+    GenerateReservationCodeUseCase,
+)
+from reservas_api.domain.entities import Reservation, ReservationAddon
+from reservas_api.domain.value_objects import ReservationCode
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare sequential and concurrent code generation + add-on lookup in "
+            "CreateReservationUseCase against stand-in adapters with simulated query latency."
+        )
+    )
+    parser.add_argument("--requests", type=int, default=1000, help="Reservations per scenario.")
+    parser.add_argument("--concurrency", type=int, default=10, help="Reservations in flight.")
+    parser.add_argument("--addons", type=int, default=2, help="Add-ons per reservation.")
+    # Stand-in latencies are exponentially distributed around these means.
+    parser.add_argument("--code-check-ms", type=float, default=2.0, help="exists_code latency.")
+    parser.add_argument("--catalog-ms", type=float, default=2.0, help="Catalog query latency.")
+    parser.add_argument("--write-ms", type=float, default=4.0, help="Reservation+outbox write.")
+    return parser.parse_args()
+
+
+def _latency(mean_ms: float) -> float:
+    return random.expovariate(1000 / mean_ms) if mean_ms > 0 else 0.0
+
+
+class StandInReservationRepository:
+    def __init__(self, mean_ms: float) -> None:
+        self._mean_ms = mean_ms
+
+    async def exists_code(self, code: ReservationCode) -> bool:
+        await asyncio.sleep(_latency(self._mean_ms))
+        return False
+
+
+class StandInAddonCatalog:
+    def __init__(self, mean_ms: float) -> None:
+        self._mean_ms = mean_ms
+
+    async def get_active_addons_by_codes(self, codes: list[str]) -> dict[str, dict[str, str]]:
+        await asyncio.sleep(_latency(self._mean_ms))
+        return {code: {"name": code, "category": "equipment"} for code in codes}
+
+
+class StandInOutboxWriter:
+    def __init__(self, mean_ms: float) -> None:
+        self._mean_ms = mean_ms
+
+    async def save_reservation_with_outbox(
+        self,
+        reservation: Reservation,
+        events=None,
+    ) -> Reservation:
+        await asyncio.sleep(_latency(self._mean_ms))
+        return reservation
+
+
+class SequentialCreateReservationUseCase(CreateReservationUseCase):
+    """Previous behaviour: generate the code, then resolve the add-ons."""
+
+    async def _lookup(
+        self,
+        addon_items: list[AddonItem],
+        unit_of_work=None,
+    ) -> tuple[ReservationCode, list[ReservationAddon]]:
+        code = await self._generate_code(unit_of_work)
+        return code, await self._resolve_addons(addon_items)
+
+
+def _build_request(addon_count: int) -> CreateReservationRequest:
+    pickup = datetime(2026, 4, 1, 10, 0, tzinfo=UTC)
+    return CreateReservationRequest(
+        supplier_code="SUP01",
+        pickup_office_code="OFF001",
+        dropoff_office_code="OFF002",
+        pickup_datetime=pickup,
+        dropoff_datetime=pickup + timedelta(days=2),
+        total_amount=Decimal("180.50"),
+        customer={"first_name": "Ana", "last_name": "Perez", "email": "ana@example.com"},
+        vehicle={"vehicle_code": "VH001", "model": "Corolla", "category": "Economy"},
+        addons=[
+            AddonItem(addon_code=f"A{index:02d}", quantity=1, unit_price=Decimal("5.00"))
+            for index in range(addon_count)
+        ],
+    )
+
+
+async def _run_scenario(
+    args: argparse.Namespace,
+    name: str,
+    use_case_class: type[CreateReservationUseCase],
+) -> None:
+    use_case = use_case_class(
+        generate_code_use_case=GenerateReservationCodeUseCase(
+            StandInReservationRepository(args.code_check_ms)
+        ),
+        outbox_writer=StandInOutboxWriter(args.write_ms),
+        addon_catalog=StandInAddonCatalog(args.catalog_ms),
+    )
+    request = _build_request(args.addons)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: list[float] = []
+
+    async def _create() -> None:
+        async with semaphore:
+            started_at = time.perf_counter()
+            await use_case.execute(request)
+            latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(_create() for _ in range(args.requests)))
+    elapsed = time.perf_counter() - started_at
+
+    cut_points = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<12}{len(latencies) / elapsed:>10.1f}{cut_points[49] * 1000:>10.2f}"
+        f"{cut_points[94] * 1000:>10.2f}"
+    )
+
+
+async def _run(args: argparse.Namespace) -> None:
+    print(f"{'lookups':<12}{'ok/s':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    await _run_scenario(args, "sequential", SequentialCreateReservationUseCase)
+    await _run_scenario(args, "concurrent", CreateReservationUseCase)
+
+
+def main() -> int:
+    asyncio.run(_run(parse_args()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+import statistics
+import time
+
+import httpx
+
+from reservas_api.infrastructure.gateways import HttpClientWarmer
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare HTTP/1.1 and HTTP/2, cold and pre-warmed, against a local TLS "
+            "stand-in for the Stripe/provider APIs."
+        )
+    )
+    parser.add_argument(
+        "--base-url", required=True, help="Stand-in server, e.g. https://localhost:8443"
+    )
+    parser.add_argument("--path", default="/payments", help="Path requested by every call.")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per scenario.")
+    parser.add_argument("--concurrency", type=int, default=100, help="Requests in flight.")
+    parser.add_argument(
+        "--prewarm-connections",
+        type=int,
+        default=20,
+        help="Connections opened before the burst in pre-warmed scenarios.",
+    )
+    parser.add_argument("--max-connections", type=int, default=100)
+    parser.add_argument(
+        "--insecure",
+        action="store_true",
+        help="Skip TLS verification for self-signed stand-in certificates.",
+    )
+    return parser.parse_args()
+
+
+async def _run_scenario(args: argparse.Namespace, http2: bool, prewarm: bool) -> dict[str, float]:
+    async with httpx.AsyncClient(
+        base_url=args.base_url,
+        http2=http2,
+        verify=not args.insecure,
+        limits=httpx.Limits(max_connections=args.max_connections),
+    ) as client:
+        if prewarm:
+            await HttpClientWarmer(
+                [client], connections_per_client=args.prewarm_connections
+            ).prewarm()
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+        latencies: list[float] = []
+        errors = 0
+
+        async def _call() -> None:
+            nonlocal errors
+            async with semaphore:
+                started_at = time.perf_counter()
+                try:
+                    response = await client.post(args.path, content=b"{}")
+                    response.raise_for_status()
+                except httpx.HTTPError:
+                    errors += 1
+                    return
+                latencies.append(time.perf_counter() - started_at)
+
+        started_at = time.perf_counter()
+        await asyncio.gather(*(_call() for _ in range(args.requests)))
+        elapsed = time.perf_counter() - started_at
+
+    cut_points = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0.0] * 99
+    return {
+        "throughput_rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": cut_points[49] * 1000,
+        "p95_ms": cut_points[94] * 1000,
+        "p99_ms": cut_points[98] * 1000,
+        "errors": float(errors),
+    }
+
+
+async def _run(args: argparse.Namespace) -> None:
+    protocols = [False]
+    if importlib.util.find_spec("h2") is not None:
+        protocols.append(True)
+    else:
+        print("h2 is not installed; install the 'http2' extra to benchmark HTTP/2.")
+
+    print(f"{'scenario':<22}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for http2 in protocols:
+        for prewarm in (False, True):
+            result = await _run_scenario(args, http2=http2, prewarm=prewarm)
+            name = f"{'http2' if http2 else 'http1.1'} {'prewarmed' if prewarm else 'cold'}"
+            print(
+                f"{name:<22}{result['throughput_rps']:>10.1f}{result['p50_ms']:>10.2f}"
+                f"{result['p95_ms']:>10.2f}{result['p99_ms']:>10.2f}{int(result['errors']):>8}"
+            )
+
+
+def main() -> int:
+    asyncio.run(_run(parse_args()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
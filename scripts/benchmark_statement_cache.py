@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import func, or_
+from sqlalchemy.dialects import mysql
+from sqlmodel import select
+
+from reservas_api.infrastructure.db.models import (
+    ProviderOutboxEventModel,
+    ReservationModel,
+    ReservationProviderRequestModel,
+)
+from reservas_api.infrastructure.db.statements import (
+    DUE_OUTBOX_EVENTS,
+    DUE_OUTBOX_EVENTS_FOR_SHARD,
+    RESERVATION_BY_CODE,
+    RESERVATION_CODE_COUNT,
+    SUCCESSFUL_PROVIDER_REQUEST_COUNT,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measure the Python-side cost per execution of the hot queries: building the "
+            "statement and its cache key on every call, reusing the module-level statement, "
+            "and compiling it for MySQL (what a compiled-cache miss pays)."
+        )
+    )
+    parser.add_argument("--iterations", type=int, default=20000, help="Calls per measurement.")
+    return parser.parse_args()
+
+
+def _exists_code() -> Any:
+    return select(func.count(ReservationModel.id)).where(
+        ReservationModel.reservation_code == "AB12CD34"
+    )
+
+
+def _reservation_by_code() -> Any:
+    return select(ReservationModel).where(ReservationModel.reservation_code == "AB12CD34")
+
+
+def _has_successful_request() -> Any:
+    return select(func.count(ReservationProviderRequestModel.id)).where(
+        ReservationProviderRequestModel.reservation_code == "AB12CD34",
+        ReservationProviderRequestModel.request_type == "PAYMENT",
+        ReservationProviderRequestModel.status == "SUCCESS",
+    )
+
+
+def _outbox_poll(sharded: bool) -> Callable[[], Any]:
+    def _build() -> Any:
+        query = (
+            select(ProviderOutboxEventModel)
+            .where(
+                ProviderOutboxEventModel.status.in_(["PENDING", "FAILED"]),
+                ProviderOutboxEventModel.next_attempt_at <= datetime.now(UTC),
+                or_(
+                    ProviderOutboxEventModel.locked_until.is_(None),
+                    ProviderOutboxEventModel.locked_until <= datetime.now(UTC),
+                ),
+            )
+            .order_by(ProviderOutboxEventModel.id)
+            .limit(50)
+            .with_for_update(skip_locked=True)
+        )
+        if sharded:
+            query = query.where(func.crc32(ProviderOutboxEventModel.aggregate_id) % 4 == 1)
+        return query
+
+    return _build
+
+
+QUERIES: list[tuple[str, Callable[[], Any], Any]] = [
+    ("exists_code", _exists_code, RESERVATION_CODE_COUNT),
+    ("find_by_code", _reservation_by_code, RESERVATION_BY_CODE),
+    ("has_successful_request", _has_successful_request, SUCCESSFUL_PROVIDER_REQUEST_COUNT),
+    ("outbox_poll", _outbox_poll(sharded=False), DUE_OUTBOX_EVENTS),
+    ("outbox_poll_sharded", _outbox_poll(sharded=True), DUE_OUTBOX_EVENTS_FOR_SHARD),
+]
+
+
+def _per_call_us(func_: Callable[[], Any], iterations: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        func_()
+    return (time.perf_counter() - started_at) / iterations * 1_000_000
+
+
+def main() -> int:
+    args = parse_args()
+    dialect = mysql.dialect()
+    compile_iterations = max(args.iterations // 10, 1)
+    print(f"{'query':<24}{'rebuild us':>12}{'cached us':>12}{'compile us':>12}")
+    for name, build, statement in QUERIES:
+        # Executing a statement derives its cache key; the key is memoized on the construct.
+        rebuild = _per_call_us(lambda build=build: build()._generate_cache_key(), args.iterations)
+        cached = _per_call_us(
+            lambda statement=statement: statement._generate_cache_key(), args.iterations
+        )
+        compiled = _per_call_us(
+            lambda statement=statement: statement.compile(dialect=dialect), compile_iterations
+        )
+        print(f"{name:<24}{rebuild:>12.1f}{cached:>12.2f}{compiled:>12.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
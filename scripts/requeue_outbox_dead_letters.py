@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from reservas_api.infrastructure.outbox import OutboxDeadLetterQueue
+from reservas_api.shared.config import ApplicationContainer, settings
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="List or requeue outbox events moved to the dead-letter table."
+    )
+    parser.add_argument(
+        "--event-id",
+        type=int,
+        action="append",
+        dest="event_ids",
+        help="Original outbox event id to requeue. Can be repeated.",
+    )
+    parser.add_argument(
+        "--aggregate-id",
+        action="append",
+        dest="aggregate_ids",
+        help="Reservation code whose dead-lettered events are requeued. Can be repeated.",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Requeue the oldest dead letters up to --limit.",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=100,
+        help="Maximum dead letters listed or requeued with --all.",
+    )
+    return parser.parse_args()
+
+
+async def _run(args: argparse.Namespace) -> None:
+    container = ApplicationContainer(settings)
+    try:
+        queue = OutboxDeadLetterQueue(container.worker_session_factory)
+        if args.event_ids or args.aggregate_ids or args.all:
+            requeued = await queue.requeue(
+                event_ids=args.event_ids,
+                limit=args.limit,
+                aggregate_ids=args.aggregate_ids,
+            )
+            print(f"Requeued events: {requeued}")
+            return
+
+        entries = await queue.list_entries(limit=args.limit)
+        for entry in entries:
+            print(
+                f"event_id={entry.event_id} type={entry.event_type} "
+                f"aggregate={entry.aggregate_id} attempts={entry.attempts} "
+                f"dead_lettered_at={entry.dead_lettered_at.isoformat()} "
+                f"error={entry.last_error or ''}"
+            )
+        print(f"Dead letters listed: {len(entries)}")
+    finally:
+        await container.shutdown()
+
+
+def main() -> int:
+    asyncio.run(_run(parse_args()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import signal
+
+from reservas_api.shared.config import ApplicationContainer, settings
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Archive processed outbox events older than the retention window."
+    )
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Archive every expired event in batches and exit.",
+    )
+    parser.add_argument(
+        "--max-batches",
+        type=int,
+        default=None,
+        help="Maximum batches archived with --once.",
+    )
+    return parser.parse_args()
+
+
+async def _run(args: argparse.Namespace) -> None:
+    container = ApplicationContainer(settings)
+    try:
+        archiver = container.create_outbox_archiver()
+        if args.once:
+            archived = await archiver.archive_pending(max_batches=args.max_batches)
+            print(f"Archived events: {archived}")
+            return
+
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, archiver.stop)
+            except NotImplementedError:
+                pass
+        await archiver.run_forever()
+    finally:
+        await container.shutdown()
+
+
+def main() -> int:
+    try:
+        asyncio.run(_run(parse_args()))
+        return 0
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,10 +2,23 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import json
+import logging
+import multiprocessing
+import os
 import signal
+import time
+from pathlib import Path
 
-from reservas_api.infrastructure.outbox import OutboxEventProcessor
-from reservas_api.shared.config import ApplicationContainer, settings
+from reservas_api.infrastructure.outbox import OutboxMetrics
+from reservas_api.shared.config import WORKER_PROCESS_ROLE, ApplicationContainer, settings
+
+SUPERVISOR_POLL_SECONDS = 1.0
+SHARD_RESTART_BASE_DELAY_SECONDS = 1.0
+SHARD_RESTART_MAX_DELAY_SECONDS = 60.0
+SHARD_STABLE_RUN_SECONDS = 60.0
+
+logger = logging.getLogger(__name__)
 
 
 def parse_args() -> argparse.Namespace:
@@ -19,32 +32,99 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--batch-size",
         type=int,
-        default=100,
+        default=settings.outbox_batch_size,
         help="Maximum events processed per poll cycle.",
     )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=settings.outbox_max_attempts,
+        help="Attempts per event before it is moved to the dead-letter table.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes; each owns the events whose aggregate_id hashes to its shard.",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        type=Path,
+        default=None,
+        help="JSON file where backlog, throughput and latency metrics are written.",
+    )
+    parser.add_argument(
+        "--metrics-interval-seconds",
+        type=float,
+        default=10.0,
+        help="How often the metrics file is rewritten.",
+    )
     parser.add_argument(
         "--once",
         action="store_true",
         help="Process one batch and exit.",
     )
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.workers <= 0:
+        parser.error("--workers must be greater than zero")
+    return args
+
+
+def _write_metrics(metrics: OutboxMetrics, path: Path) -> None:
+    """Replace the metrics file atomically so readers never see partial JSON."""
+    temporary_path = path.with_name(f"{path.name}.tmp")
+    temporary_path.write_text(json.dumps(metrics.snapshot(), indent=2), encoding="utf-8")
+    os.replace(temporary_path, path)
+
+
+async def _export_metrics(
+    metrics: OutboxMetrics,
+    path: Path,
+    interval_seconds: float,
+    stop_event: asyncio.Event,
+) -> None:
+    while not stop_event.is_set():
+        _write_metrics(metrics, path)
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=interval_seconds)
+        except TimeoutError:
+            continue
+    _write_metrics(metrics, path)
+
+
+def _shard_metrics_file(path: Path | None, shard_index: int, shard_count: int) -> Path | None:
+    if path is None or shard_count == 1:
+        return path
+    return path.with_name(f"{path.stem}.shard{shard_index}{path.suffix}")
 
 
-async def _run_worker(args: argparse.Namespace) -> None:
-    container = ApplicationContainer(settings)
+async def _run_worker(
+    args: argparse.Namespace,
+    shard_index: int = 0,
+    shard_count: int = 1,
+) -> None:
+    # The standalone worker is the processor; never start the embedded one over the whole table
+    # as well, which would ignore shard ownership.
+    container = ApplicationContainer(
+        settings.model_copy(update={"outbox_embedded_worker_enabled": False}),
+        process_role=WORKER_PROCESS_ROLE,
+    )
     await container.startup()
+    metrics_file = _shard_metrics_file(args.metrics_file, shard_index, shard_count)
     try:
-        processor = OutboxEventProcessor(
-            session_factory=container.session_factory,
-            payment_gateway=container.create_payment_gateway(),
-            provider_gateway=container.create_provider_gateway(),
+        processor = container.create_outbox_event_processor(
             poll_interval_seconds=args.poll_interval_seconds,
             batch_size=args.batch_size,
+            max_attempts=args.max_attempts,
+            shard_index=shard_index,
+            shard_count=shard_count,
         )
 
         if args.once:
             processed = await processor.process_pending_once(limit=args.batch_size)
             print(f"Processed events: {processed}")
+            if metrics_file is not None:
+                _write_metrics(container.outbox_metrics, metrics_file)
             return
 
         stop_event = asyncio.Event()
@@ -61,14 +141,115 @@ async def _run_worker(args: argparse.Namespace) -> None:
                 pass
 
         worker_task = asyncio.create_task(processor.run_forever())
+        metrics_task = None
+        if metrics_file is not None:
+            metrics_task = asyncio.create_task(
+                _export_metrics(
+                    container.outbox_metrics,
+                    metrics_file,
+                    args.metrics_interval_seconds,
+                    stop_event,
+                )
+            )
         await stop_event.wait()
         await worker_task
+        if metrics_task is not None:
+            await metrics_task
     finally:
         await container.shutdown()
 
 
+def _run_shard(args: argparse.Namespace, shard_index: int) -> None:
+    """Process entry point for one shard of the multi-process worker."""
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    try:
+        asyncio.run(_run_worker(args, shard_index=shard_index, shard_count=args.workers))
+    except KeyboardInterrupt:
+        pass
+
+
+def _start_shard(args: argparse.Namespace, shard_index: int) -> multiprocessing.Process:
+    process = multiprocessing.Process(
+        target=_run_shard,
+        args=(args, shard_index),
+        name=f"outbox-worker-shard-{shard_index}",
+    )
+    process.start()
+    return process
+
+
+def _restart_delay_seconds(consecutive_failures: int) -> float:
+    """Return the exponential backoff before restarting a shard that keeps exiting."""
+    return min(
+        SHARD_RESTART_BASE_DELAY_SECONDS * 2 ** max(consecutive_failures - 1, 0),
+        SHARD_RESTART_MAX_DELAY_SECONDS,
+    )
+
+
+def _supervise(args: argparse.Namespace) -> int:
+    """Run one process per shard and restart shards that exit unexpectedly.
+
+    A shard that exits again before `SHARD_STABLE_RUN_SECONDS` is restarted
+    with exponential backoff instead of on every supervisor poll.
+    """
+    processes = {index: _start_shard(args, index) for index in range(args.workers)}
+    if args.once:
+        for process in processes.values():
+            process.join()
+        return max((process.exitcode or 0) for process in processes.values())
+
+    stopping = False
+
+    def _request_stop(signum: int, frame: object) -> None:
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGINT, _request_stop)
+    signal.signal(signal.SIGTERM, _request_stop)
+
+    started_at = dict.fromkeys(processes, time.monotonic())
+    failures = dict.fromkeys(processes, 0)
+    restart_at: dict[int, float] = {}
+    while not stopping:
+        time.sleep(SUPERVISOR_POLL_SECONDS)
+        for index, process in list(processes.items()):
+            if stopping:
+                break
+            now = time.monotonic()
+            if index in restart_at:
+                if now >= restart_at[index]:
+                    del restart_at[index]
+                    processes[index] = _start_shard(args, index)
+                    started_at[index] = now
+                continue
+            if process.is_alive():
+                continue
+            if now - started_at[index] >= SHARD_STABLE_RUN_SECONDS:
+                failures[index] = 0
+            failures[index] += 1
+            delay = _restart_delay_seconds(failures[index])
+            logger.warning(
+                "Outbox shard %s exited with code %s; restarting in %.1fs",
+                index,
+                process.exitcode,
+                delay,
+            )
+            restart_at[index] = now + delay
+
+    for process in processes.values():
+        if process.is_alive():
+            process.terminate()
+    for process in processes.values():
+        process.join()
+    return 0
+
+
 def main() -> int:
+    logging.basicConfig(level=logging.INFO)
     args = parse_args()
+    if args.workers > 1:
+        return _supervise(args)
     try:
         asyncio.run(_run_worker(args))
         return 0
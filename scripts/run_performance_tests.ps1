@@ -19,7 +19,7 @@ function Wait-ApiReady {
     )
 
     $deadline = (Get-Date).AddSeconds($TimeoutSeconds)
-    $healthUri = "$HostBase/api/v1/health"
+    $healthUri = "$HostBase/api/v1/health/ready"
     while ((Get-Date) -lt $deadline) {
         try {
             $response = Invoke-WebRequest -Uri $healthUri -UseBasicParsing -TimeoutSec 2
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from reservas_api.infrastructure.resilience import HedgingPolicy
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Simulate provider bookings against a heavy-tailed stand-in and compare "
+            "tail latency with and without hedged requests."
+        )
+    )
+    parser.add_argument("--requests", type=int, default=5000, help="Bookings per scenario.")
+    parser.add_argument("--concurrency", type=int, default=200, help="Bookings in flight.")
+    parser.add_argument("--median-ms", type=float, default=20.0, help="Median stand-in latency.")
+    parser.add_argument(
+        "--slow-probability",
+        type=float,
+        default=0.02,
+        help="Share of calls that hit a Pareto-distributed stall.",
+    )
+    parser.add_argument("--pareto-alpha", type=float, default=1.5, help="Tail index of stalls.")
+    parser.add_argument("--percentile", type=float, default=0.95, help="Hedge trigger percentile.")
+    parser.add_argument("--budget-ratio", type=float, default=0.1, help="Max extra load ratio.")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def _latency_seconds(args: argparse.Namespace, rng: random.Random) -> float:
+    latency_ms = rng.lognormvariate(0.0, 0.25) * args.median_ms
+    if rng.random() < args.slow_probability:
+        latency_ms += args.median_ms * rng.paretovariate(args.pareto_alpha) * 10
+    return min(latency_ms, 5000.0) / 1000
+
+
+async def _run_scenario(args: argparse.Namespace, hedging: bool) -> dict[str, float]:
+    rng = random.Random(args.seed)
+    policy = HedgingPolicy(percentile=args.percentile, budget_ratio=args.budget_ratio)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: list[float] = []
+    upstream_calls = 0
+
+    async def _stand_in() -> None:
+        nonlocal upstream_calls
+        upstream_calls += 1
+        await asyncio.sleep(_latency_seconds(args, rng))
+
+    async def _booking() -> None:
+        async with semaphore:
+            started_at = time.perf_counter()
+            if hedging:
+                await policy.execute(_stand_in)
+            else:
+                await _stand_in()
+            latencies.append(time.perf_counter() - started_at)
+
+    await asyncio.gather(*(_booking() for _ in range(args.requests)))
+    cut_points = statistics.quantiles(latencies, n=1000)
+    return {
+        "p50_ms": cut_points[499] * 1000,
+        "p95_ms": cut_points[949] * 1000,
+        "p99_ms": cut_points[989] * 1000,
+        "p999_ms": cut_points[998] * 1000,
+        "extra_load_pct": (upstream_calls / args.requests - 1) * 100,
+    }
+
+
+async def _run(args: argparse.Namespace) -> None:
+    print(
+        f"{'scenario':<12}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'p99.9 ms':>10}{'extra %':>10}"
+    )
+    for hedging in (False, True):
+        result = await _run_scenario(args, hedging=hedging)
+        name = "hedged" if hedging else "baseline"
+        print(
+            f"{name:<12}{result['p50_ms']:>10.1f}{result['p95_ms']:>10.1f}"
+            f"{result['p99_ms']:>10.1f}{result['p999_ms']:>10.1f}{result['extra_load_pct']:>10.1f}"
+        )
+
+
+def main() -> int:
+    asyncio.run(_run(parse_args()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
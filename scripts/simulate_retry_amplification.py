@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+
+from reservas_api.infrastructure.resilience import RetryBudget, RetryPolicy
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Simulate upstream load amplification from retries through a healthy, "
+            "outage and recovery phase, with and without a retry budget."
+        )
+    )
+    parser.add_argument("--rate", type=float, default=200.0, help="Requests per simulated second.")
+    parser.add_argument(
+        "--phase-seconds", type=int, default=60, help="Simulated seconds per phase."
+    )
+    parser.add_argument(
+        "--failure-rates",
+        default="0.01,1.0,0.3",
+        help="Comma separated upstream failure probability per phase.",
+    )
+    parser.add_argument("--max-retries", type=int, default=3)
+    parser.add_argument("--budget-ratio", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+class SimulatedClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _no_sleep(_: float) -> None:
+    return None
+
+
+async def _run_scenario(args: argparse.Namespace, with_budget: bool) -> list[float]:
+    rng = random.Random(args.seed)
+    clock = SimulatedClock()
+    budget = RetryBudget(ratio=args.budget_ratio, time_provider=clock) if with_budget else None
+    policy = RetryPolicy(
+        max_retries=args.max_retries,
+        sleep_func=_no_sleep,
+        full_jitter=True,
+        budget=budget,
+    )
+    amplification: list[float] = []
+    for failure_rate in (float(value) for value in args.failure_rates.split(",")):
+        attempts = 0
+
+        async def _upstream(failure_rate: float = failure_rate) -> None:
+            nonlocal attempts
+            attempts += 1
+            if rng.random() < failure_rate:
+                raise ConnectionError("upstream unavailable")
+
+        requests = int(args.rate * args.phase_seconds)
+        for _ in range(requests):
+            clock.now += 1 / args.rate
+            try:
+                await policy.execute(_upstream)
+            except ConnectionError:
+                pass
+        amplification.append(attempts / requests)
+    return amplification
+
+
+async def _run(args: argparse.Namespace) -> None:
+    phases = args.failure_rates.split(",")
+    header = "".join(f"{'fail=' + phase:>12}" for phase in phases)
+    print(f"{'scenario':<14}{header}")
+    for with_budget in (False, True):
+        amplification = await _run_scenario(args, with_budget=with_budget)
+        name = "retry budget" if with_budget else "no budget"
+        print(f"{name:<14}" + "".join(f"{value:>11.2f}x" for value in amplification))
+
+
+def main() -> int:
+    asyncio.run(_run(parse_args()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -12,6 +12,7 @@ from reservas_api.api.middleware import (
 )
 from reservas_api.api.routers.addons import router as addons_router
 from reservas_api.api.routers.health import router as health_router
+from reservas_api.api.routers.metrics import router as metrics_router
 from reservas_api.api.routers.reservations import router as reservations_router
 from reservas_api.shared.config import ApplicationContainer, settings
 
@@ -25,6 +26,7 @@ def create_app() -> FastAPI:
         """Initialize and release shared app resources."""
         app.state.container = container
         app.state.session_factory = container.session_factory
+        app.state.session_router = container.session_router
         app.state.create_reservation_use_case_factory = container.create_create_reservation_use_case
         await container.startup()
         try:
@@ -58,6 +60,7 @@ def create_app() -> FastAPI:
     app.add_middleware(ErrorHandlerMiddleware)
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
     app.include_router(health_router, prefix="/api/v1")
+    app.include_router(metrics_router, prefix="/api/v1")
     app.include_router(addons_router, prefix="/api/v1")
     app.include_router(reservations_router, prefix="/api/v1")
     return app
@@ -10,7 +10,10 @@ router = APIRouter(prefix="/addons", tags=["addons"])
 
 
 def _get_catalog(request: Request) -> MySQLAddonCatalogRepository:
-    return MySQLAddonCatalogRepository(request.app.state.session_factory)
+    return MySQLAddonCatalogRepository(
+        request.app.state.session_factory,
+        getattr(request.app.state, "session_router", None),
+    )
 
 
 @router.get(
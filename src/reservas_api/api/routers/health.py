@@ -1,4 +1,6 @@
-from fastapi import APIRouter
+from typing import Any
+
+from fastapi import APIRouter, Request, Response, status
 
 router = APIRouter(tags=["health"])
 
@@ -7,3 +9,22 @@ router = APIRouter(tags=["health"])
 async def health_check() -> dict[str, str]:
     """Return service health status."""
     return {"status": "ok"}
+
+
+@router.get(
+    "/health/ready",
+    summary="Readiness check",
+    responses={
+        503: {"description": "Warm-up still running or no DB connection could be opened yet"}
+    },
+)
+async def readiness_check(request: Request, response: Response) -> dict[str, Any]:
+    """Report ready once startup warm-up has opened DB connections; `warming` or `degraded` before."""
+    container = getattr(request.app.state, "container", None)
+    if container is None:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "warming"}
+    if not container.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": container.warmup_status}
+    return {"status": "ready", "warmed_connections": container.warmup_connections}
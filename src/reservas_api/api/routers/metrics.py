@@ -0,0 +1,15 @@
+from typing import Any
+
+from fastapi import APIRouter, Request
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", summary="Outbox pipeline and connection pool metrics")
+async def outbox_metrics(request: Request) -> dict[str, Any]:
+    """Return outbox backlog, drain rate, dispatch latency and pool checkout wait metrics."""
+    container = request.app.state.container
+    return {
+        "outbox": container.outbox_metrics.snapshot(),
+        "db_pools": container.pool_metrics.snapshot(),
+    }
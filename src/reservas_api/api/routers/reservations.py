@@ -20,6 +20,7 @@ from reservas_api.infrastructure.repositories import (
     MySQLAddonCatalogRepository,
     MySQLReservationRepository,
 )
+from reservas_api.infrastructure.unit_of_work import SQLUnitOfWork
 
 router = APIRouter(prefix="/reservations", tags=["reservations"])
 
@@ -31,16 +32,18 @@ def _build_default_create_reservation_use_case_factory(
 ) -> CreateReservationUseCaseFactory:
     """Build default use-case factory from app container/session resources."""
     session_factory = request.app.state.session_factory
+    session_router = getattr(request.app.state, "session_router", None)
 
     def _factory() -> CreateReservationUseCase:
-        repository = MySQLReservationRepository(session_factory)
+        repository = MySQLReservationRepository(session_factory, session_router)
         generate_code_use_case = GenerateReservationCodeUseCase(repository=repository)
-        outbox_writer = OutboxEventPublisher(session_factory)
-        addon_catalog = MySQLAddonCatalogRepository(session_factory)
+        outbox_writer = OutboxEventPublisher(session_factory, session_router=session_router)
+        addon_catalog = MySQLAddonCatalogRepository(session_factory, session_router)
         return CreateReservationUseCase(
             generate_code_use_case=generate_code_use_case,
             outbox_writer=outbox_writer,
             addon_catalog=addon_catalog,
+            unit_of_work_factory=lambda: SQLUnitOfWork(session_factory, session_router),
         )
 
     return _factory
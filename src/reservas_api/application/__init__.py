@@ -2,6 +2,7 @@ from reservas_api.application.use_cases import (
     AddonItem,
     CreateReservationPersistenceError,
     CreateReservationRequest,
+    CreateReservationUnitOfWork,
     CreateReservationUseCase,
     ExternalRequestType,
     GenerateReservationCodeUseCase,
@@ -16,6 +17,7 @@ __all__ = [
     "AddonItem",
     "CreateReservationPersistenceError",
     "CreateReservationRequest",
+    "CreateReservationUnitOfWork",
     "CreateReservationUseCase",
     "ExternalRequestType",
     "GenerateReservationCodeUseCase",
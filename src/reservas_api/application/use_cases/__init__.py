@@ -2,6 +2,7 @@ from reservas_api.application.use_cases.create_reservation_use_case import (
     AddonItem,
     CreateReservationPersistenceError,
     CreateReservationRequest,
+    CreateReservationUnitOfWork,
     CreateReservationUseCase,
     ReservationOutboxWriter,
 )
@@ -21,6 +22,7 @@ __all__ = [
     "AddonItem",
     "CreateReservationPersistenceError",
     "CreateReservationRequest",
+    "CreateReservationUnitOfWork",
     "CreateReservationUseCase",
     "GenerateReservationCodeUseCase",
     "ExternalRequestType",
@@ -1,14 +1,17 @@
-from collections.abc import Iterable
+import asyncio
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Protocol
+from types import TracebackType
+from typing import Any, Protocol, Self
 
 from reservas_api.application.use_cases.generate_reservation_code_use_case import (
     GenerateReservationCodeUseCase,
 )
 from reservas_api.domain.entities import Reservation, ReservationAddon
-from reservas_api.domain.ports import DomainEvent
+from reservas_api.domain.ports import DomainEvent, ReservationRepository
+from reservas_api.domain.value_objects import ReservationCode
 from reservas_api.shared.security import (
     enforce_pci_storage_rules,
     sanitize_and_validate_payload,
@@ -42,6 +45,30 @@ class ReservationOutboxWriter(Protocol):
     ) -> Reservation: ...
 
 
+class CreateReservationUnitOfWork(Protocol):
+    """Port for one transaction spanning a whole reservation creation.
+
+    `reservations` and `outbox_writer` share the unit of work's session and
+    nothing is persisted until `commit`. `addon_catalog` must be safe to call
+    concurrently with `reservations`.
+    """
+
+    reservations: ReservationRepository
+    addon_catalog: AddonCatalogReader
+    outbox_writer: ReservationOutboxWriter
+
+    async def __aenter__(self) -> Self: ...
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None: ...
+
+    async def commit(self) -> None: ...
+
+
 class CreateReservationAuditLogger(Protocol):
     """Port for audit events emitted during reservation creation."""
 
@@ -123,21 +150,32 @@ class CreateReservationUseCase:
         outbox_writer: ReservationOutboxWriter,
         addon_catalog: AddonCatalogReader | None = None,
         audit_logger: CreateReservationAuditLogger | None = None,
+        unit_of_work_factory: Callable[[], CreateReservationUnitOfWork] | None = None,
     ) -> None:
+        """Create the use case; a `unit_of_work_factory` runs each call in one transaction.
+
+        With a unit of work, the code check, the add-on lookup and the
+        reservation+outbox write use its adapters instead of `outbox_writer`
+        and `addon_catalog`.
+        """
         self._generate_code_use_case = generate_code_use_case
         self._outbox_writer = outbox_writer
         self._addon_catalog = addon_catalog
         self._audit_logger = audit_logger
+        self._unit_of_work_factory = unit_of_work_factory
 
     async def _resolve_addons(
-        self, addon_items: list[AddonItem]
+        self,
+        addon_items: list[AddonItem],
+        addon_catalog: AddonCatalogReader | None = None,
     ) -> list[ReservationAddon]:
         """Resolve add-on items against catalog and build domain snapshots."""
         if not addon_items:
             return []
         codes = [item.addon_code for item in addon_items]
-        if self._addon_catalog is not None:
-            catalog = await self._addon_catalog.get_active_addons_by_codes(codes)
+        addon_catalog = addon_catalog or self._addon_catalog
+        if addon_catalog is not None:
+            catalog = await addon_catalog.get_active_addons_by_codes(codes)
         else:
             catalog = {}
         addons: list[ReservationAddon] = []
@@ -157,9 +195,49 @@ class CreateReservationUseCase:
             )
         return addons
 
+    async def _generate_code(
+        self,
+        unit_of_work: CreateReservationUnitOfWork | None = None,
+    ) -> ReservationCode:
+        if unit_of_work is None:
+            return await self._generate_code_use_case.execute()
+        return await self._generate_code_use_case.execute(unit_of_work.reservations)
+
+    async def _lookup(
+        self,
+        addon_items: list[AddonItem],
+        unit_of_work: CreateReservationUnitOfWork | None = None,
+    ) -> tuple[ReservationCode, list[ReservationAddon]]:
+        """Generate the code and resolve add-ons concurrently.
+
+        The first failure cancels the other lookup and is raised unwrapped.
+        """
+        if not addon_items:
+            return await self._generate_code(unit_of_work), []
+        addon_catalog = unit_of_work.addon_catalog if unit_of_work is not None else None
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                code_task = task_group.create_task(self._generate_code(unit_of_work))
+                addons_task = task_group.create_task(
+                    self._resolve_addons(addon_items, addon_catalog)
+                )
+        except ExceptionGroup as group:
+            raise group.exceptions[0] from group
+        return code_task.result(), addons_task.result()
+
     async def execute(self, request: CreateReservationRequest) -> Reservation:
         """Create and persist a reservation from validated input."""
-        reservation_code = await self._generate_code_use_case.execute()
+        if self._unit_of_work_factory is None:
+            return await self._create(request, self._outbox_writer)
+        async with self._unit_of_work_factory() as unit_of_work:
+            return await self._create(request, unit_of_work.outbox_writer, unit_of_work)
+
+    async def _create(
+        self,
+        request: CreateReservationRequest,
+        outbox_writer: ReservationOutboxWriter,
+        unit_of_work: CreateReservationUnitOfWork | None = None,
+    ) -> Reservation:
         supplier_code = sanitize_and_validate_text(request.supplier_code)
         pickup_office_code = sanitize_and_validate_text(request.pickup_office_code)
         dropoff_office_code = sanitize_and_validate_text(request.dropoff_office_code)
@@ -169,7 +247,7 @@ class CreateReservationUseCase:
         vehicle_snapshot = enforce_pci_storage_rules(
             sanitize_and_validate_payload(dict(request.vehicle))
         )
-        resolved_addons = await self._resolve_addons(request.addons)
+        reservation_code, resolved_addons = await self._lookup(request.addons, unit_of_work)
         reservation = Reservation(
             reservation_code=reservation_code,
             supplier_code=supplier_code,
@@ -183,7 +261,9 @@ class CreateReservationUseCase:
             addons=resolved_addons,
         )
         try:
-            saved = await self._outbox_writer.save_reservation_with_outbox(reservation)
+            saved = await outbox_writer.save_reservation_with_outbox(reservation)
+            if unit_of_work is not None:
+                await unit_of_work.commit()
             if self._audit_logger is not None:
                 self._audit_logger.log_reservation_created(
                     reservation_code=saved.reservation_code.value,
@@ -37,15 +37,20 @@ class GenerateReservationCodeUseCase:
         self._code_generator = code_generator or self._generate_random_code
         self._max_retries = max_retries
 
-    async def execute(self) -> ReservationCode:
-        """Return a unique reservation code, retrying on collisions."""
+    async def execute(self, repository: ReservationRepository | None = None) -> ReservationCode:
+        """Return a unique reservation code, retrying on collisions.
+
+        `repository` overrides the configured one, e.g. to check uniqueness
+        inside the caller's unit of work.
+        """
+        repository = repository or self._repository
         for _ in range(self._max_retries):
             try:
                 code = ReservationCode(value=self._code_generator())
             except ValueError:
                 continue
 
-            if not await self._repository.exists_code(code):
+            if not await repository.exists_code(code):
                 return code
 
         raise ReservationCodeGenerationError(
@@ -1,6 +1,7 @@
 from reservas_api.domain.entities import Reservation, ReservationStatusChange
 from reservas_api.domain.enums import ReservationStatus
 from reservas_api.domain.ports import (
+    Deadline,
     DomainEvent,
     EventPublisher,
     PaymentGateway,
@@ -12,6 +13,7 @@ from reservas_api.domain.ports import (
 from reservas_api.domain.value_objects import ReservationCode
 
 __all__ = [
+    "Deadline",
     "DomainEvent",
     "EventPublisher",
     "PaymentGateway",
@@ -25,6 +25,16 @@ class DomainEvent:
     event_type: str
     aggregate_id: str
     payload: dict[str, Any] | None = None
+    request_body: bytes | None = None
+
+
+class Deadline(Protocol):
+    """Time budget of one outbound operation, shared by all of its attempts."""
+
+    @property
+    def expired(self) -> bool: ...
+
+    def remaining_seconds(self) -> float: ...
 
 
 class ReservationRepository(Protocol):
@@ -40,10 +50,25 @@ class ReservationRepository(Protocol):
 class PaymentGateway(Protocol):
     async def process_payment(self, reservation: Reservation) -> PaymentResult: ...
 
+    async def process_payment_request(
+        self,
+        body: bytes,
+        idempotency_key: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> PaymentResult: ...
+
 
 class ProviderGateway(Protocol):
     async def create_booking(self, reservation: Reservation) -> ProviderResult: ...
 
+    async def create_booking_request(
+        self,
+        body: bytes,
+        supplier_code: str | None = None,
+        idempotency_key: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> ProviderResult: ...
+
 
 class EventPublisher(Protocol):
     async def publish(self, event: DomainEvent) -> None: ...
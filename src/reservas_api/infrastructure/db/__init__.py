@@ -1,13 +1,21 @@
+from reservas_api.infrastructure.db.instrumented_pool import InstrumentedAsyncQueuePool
 from reservas_api.infrastructure.db.models import (
     ProviderOutboxEventModel,
     ReservationContactModel,
     ReservationModel,
     ReservationProviderRequestModel,
 )
+from reservas_api.infrastructure.db.pool_metrics import PoolMetrics
+from reservas_api.infrastructure.db.pool_warmer import DatabasePoolWarmer
+from reservas_api.infrastructure.db.session_router import SessionRouter
 
 __all__ = [
+    "DatabasePoolWarmer",
+    "InstrumentedAsyncQueuePool",
+    "PoolMetrics",
     "ProviderOutboxEventModel",
     "ReservationContactModel",
     "ReservationModel",
     "ReservationProviderRequestModel",
+    "SessionRouter",
 ]
@@ -0,0 +1,36 @@
+from time import perf_counter
+from typing import Self
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from reservas_api.infrastructure.db.pool_metrics import PoolMetrics
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that times each checkout, including the wait for a free slot.
+
+    `pool_name` and `metrics` are set once the engine is built and survive
+    `recreate()`, so a disposed engine keeps reporting under the same name.
+    """
+
+    pool_name: str = "default"
+    metrics: PoolMetrics | None = None
+
+    def connect(self) -> PoolProxiedConnection:
+        if self.metrics is None:
+            return super().connect()
+        started_at = perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.metrics.record_timeout(self.pool_name, perf_counter() - started_at)
+            raise
+        self.metrics.record_checkout(self.pool_name, perf_counter() - started_at)
+        return connection
+
+    def recreate(self) -> Self:
+        pool = super().recreate()
+        pool.pool_name = self.pool_name
+        pool.metrics = self.metrics
+        return pool
@@ -1,5 +1,8 @@
 from reservas_api.infrastructure.db.models.reservation_models import (
     OfficeModel,
+    ProviderIdempotencyKeyModel,
+    ProviderOutboxDeadLetterModel,
+    ProviderOutboxEventArchiveModel,
     ProviderOutboxEventModel,
     RentalAddonModel,
     ReservationAddonModel,
@@ -12,6 +15,9 @@ from reservas_api.infrastructure.db.models.reservation_models import (
 
 __all__ = [
     "OfficeModel",
+    "ProviderIdempotencyKeyModel",
+    "ProviderOutboxDeadLetterModel",
+    "ProviderOutboxEventArchiveModel",
     "ProviderOutboxEventModel",
     "RentalAddonModel",
     "ReservationAddonModel",
@@ -2,7 +2,17 @@ from datetime import UTC, datetime
 from decimal import Decimal
 from typing import Any
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Numeric, String, func
+from sqlalchemy import (
+    JSON,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    Numeric,
+    String,
+    func,
+)
 from sqlalchemy import Enum as SAEnum
 from sqlmodel import Column, Field, SQLModel
 
@@ -229,12 +239,34 @@ class ReservationAddonModel(SQLModel, table=True):
 
 class ProviderOutboxEventModel(SQLModel, table=True):
     __tablename__ = "provider_outbox_events"
+    __table_args__ = (
+        Index("ix_provider_outbox_events_status_next_attempt_at", "status", "next_attempt_at"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     aggregate_id: str = Field(sa_column=Column(String(64), nullable=False, index=True))
     event_type: str = Field(sa_column=Column(String(80), nullable=False))
     payload: dict[str, Any] | None = Field(default=None, sa_column=Column(JSON))
+    request_body: bytes | None = Field(default=None, sa_column=Column(LargeBinary, nullable=True))
     status: str = Field(default="PENDING", sa_column=Column(String(20), nullable=False, index=True))
+    attempts: int = Field(
+        default=0,
+        sa_column=Column(Integer, nullable=False, server_default="0"),
+    )
+    next_attempt_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_column=Column(
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=func.now(),
+        ),
+    )
+    last_error: str | None = Field(default=None, sa_column=Column(String(500), nullable=True))
+    locked_by: str | None = Field(default=None, sa_column=Column(String(64), nullable=True))
+    locked_until: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+    )
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(UTC),
         sa_column=Column(
@@ -244,3 +276,70 @@ class ProviderOutboxEventModel(SQLModel, table=True):
             index=True,
         ),
     )
+
+
+class ProviderOutboxEventArchiveModel(SQLModel, table=True):
+    __tablename__ = "provider_outbox_events_archive"
+
+    id: int = Field(sa_column=Column(Integer, primary_key=True, autoincrement=False))
+    aggregate_id: str = Field(sa_column=Column(String(64), nullable=False, index=True))
+    event_type: str = Field(sa_column=Column(String(80), nullable=False))
+    payload: dict[str, Any] | None = Field(default=None, sa_column=Column(JSON))
+    request_body: bytes | None = Field(default=None, sa_column=Column(LargeBinary, nullable=True))
+    status: str = Field(sa_column=Column(String(20), nullable=False))
+    attempts: int = Field(sa_column=Column(Integer, nullable=False))
+    next_attempt_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
+    last_error: str | None = Field(default=None, sa_column=Column(String(500), nullable=True))
+    created_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
+    archived_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_column=Column(
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=func.now(),
+            index=True,
+        ),
+    )
+
+
+class ProviderOutboxDeadLetterModel(SQLModel, table=True):
+    __tablename__ = "provider_outbox_dead_letters"
+
+    id: int | None = Field(default=None, primary_key=True)
+    event_id: int = Field(sa_column=Column(Integer, nullable=False, unique=True))
+    aggregate_id: str = Field(sa_column=Column(String(64), nullable=False, index=True))
+    event_type: str = Field(sa_column=Column(String(80), nullable=False))
+    payload: dict[str, Any] | None = Field(default=None, sa_column=Column(JSON))
+    request_body: bytes | None = Field(default=None, sa_column=Column(LargeBinary, nullable=True))
+    attempts: int = Field(sa_column=Column(Integer, nullable=False))
+    last_error: str | None = Field(default=None, sa_column=Column(String(500), nullable=True))
+    created_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
+    dead_lettered_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_column=Column(
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=func.now(),
+        ),
+    )
+
+
+# `provider_idempotency_keys` already exists in the provider catalog schema (see
+# tablas_provider.md) with a non-unique `idem_key` index; only the timestamps are added here.
+class ProviderIdempotencyKeyModel(SQLModel, table=True):
+    __tablename__ = "provider_idempotency_keys"
+
+    id: int | None = Field(default=None, primary_key=True)
+    idem_key: str = Field(sa_column=Column(String(128), nullable=False, index=True))
+    request_hash: str = Field(sa_column=Column(String(64), nullable=False))
+    response_body: dict[str, Any] | None = Field(default=None, sa_column=Column(JSON))
+    status: str | None = Field(default=None, sa_column=Column(String(20), nullable=True))
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_column=Column(
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=func.now(),
+        ),
+    )
+    updated_at: datetime | None = Field(default=None, sa_column=Column(DateTime(timezone=True)))
@@ -0,0 +1,179 @@
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from reservas_api.shared.metrics import LatencyHistogram
+
+POOL_WAIT_BUCKETS_SECONDS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    5.0,
+    30.0,
+)
+CONNECTION_LIFETIME_BUCKETS_SECONDS = (1.0, 10.0, 60.0, 300.0, 900.0, 1800.0, 3600.0, 14400.0)
+
+_OPENED_AT = "pool_metrics_opened_at"
+_CHECKED_OUT_AT = "pool_metrics_checked_out_at"
+
+
+class _PoolStats:
+    __slots__ = (
+        "checkout_wait",
+        "checkout_hold",
+        "connection_lifetime",
+        "pool_size",
+        "in_use",
+        "peak_in_use",
+        "open_connections",
+        "connections_opened",
+        "connections_closed",
+        "invalidations",
+        "timeouts",
+        "compiled_cache",
+        "statement_cache_hits",
+        "statement_cache_misses",
+        "statement_cache_uncached",
+    )
+
+    def __init__(self) -> None:
+        self.checkout_wait = LatencyHistogram(POOL_WAIT_BUCKETS_SECONDS)
+        self.checkout_hold = LatencyHistogram()
+        self.connection_lifetime = LatencyHistogram(CONNECTION_LIFETIME_BUCKETS_SECONDS)
+        self.pool_size = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.open_connections = 0
+        self.connections_opened = 0
+        self.connections_closed = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.compiled_cache: Any = None
+        self.statement_cache_hits = 0
+        self.statement_cache_misses = 0
+        self.statement_cache_uncached = 0
+
+
+class PoolMetrics:
+    """In-memory metrics per named connection pool.
+
+    Checkout wait is timed by `InstrumentedAsyncQueuePool`; in-use, overflow,
+    hold time and connection lifetime come from SQLAlchemy pool events
+    registered by `instrument`, and compiled-statement cache hits from its
+    cursor events. Every pool keeps a fixed set of counters and histograms,
+    so recording is O(1).
+    """
+
+    def __init__(self, time_provider: Callable[[], float] | None = None) -> None:
+        self._time_provider = time_provider or perf_counter
+        self._pools: dict[str, _PoolStats] = {}
+
+    def instrument(self, engine: AsyncEngine, pool_name: str) -> None:
+        """Listen to the pool events of `engine`; they survive `engine.dispose()`."""
+        stats = self._stats(pool_name)
+        size = getattr(engine.sync_engine.pool, "size", None)
+        stats.pool_size = size() if callable(size) else 0
+        stats.compiled_cache = getattr(engine.sync_engine, "_compiled_cache", None)
+        now = self._time_provider
+
+        def on_connect(_: Any, record: Any) -> None:
+            record.info[_OPENED_AT] = now()
+            stats.open_connections += 1
+            stats.connections_opened += 1
+
+        def on_checkout(_: Any, record: Any, __: Any) -> None:
+            record.info[_CHECKED_OUT_AT] = now()
+            stats.in_use += 1
+            stats.peak_in_use = max(stats.peak_in_use, stats.in_use)
+
+        def on_checkin(_: Any, record: Any) -> None:
+            checked_out_at = record.info.pop(_CHECKED_OUT_AT, None)
+            if checked_out_at is None:
+                return
+            stats.in_use -= 1
+            stats.checkout_hold.observe(now() - checked_out_at)
+
+        def on_close(_: Any, record: Any) -> None:
+            opened_at = record.info.pop(_OPENED_AT, None)
+            if opened_at is None:
+                return
+            stats.open_connections -= 1
+            stats.connections_closed += 1
+            stats.connection_lifetime.observe(now() - opened_at)
+
+        def on_invalidate(_: Any, __: Any, ___: BaseException | None) -> None:
+            stats.invalidations += 1
+
+        def on_cursor_execute(*args: Any) -> None:
+            cache_hit = getattr(args[4], "cache_hit", None)
+            if cache_hit is CacheStats.CACHE_HIT:
+                stats.statement_cache_hits += 1
+            elif cache_hit is CacheStats.CACHE_MISS:
+                stats.statement_cache_misses += 1
+            else:
+                stats.statement_cache_uncached += 1
+
+        target = engine.sync_engine
+        event.listen(target, "connect", on_connect)
+        event.listen(target, "checkout", on_checkout)
+        event.listen(target, "checkin", on_checkin)
+        event.listen(target, "close", on_close)
+        event.listen(target, "invalidate", on_invalidate)
+        event.listen(target, "after_cursor_execute", on_cursor_execute)
+
+    def record_checkout(self, pool_name: str, wait_seconds: float) -> None:
+        self._stats(pool_name).checkout_wait.observe(wait_seconds)
+
+    def record_timeout(self, pool_name: str, wait_seconds: float) -> None:
+        stats = self._stats(pool_name)
+        stats.checkout_wait.observe(wait_seconds)
+        stats.timeouts += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            pool_name: {
+                "pool_size": stats.pool_size,
+                "in_use": stats.in_use,
+                "peak_in_use": stats.peak_in_use,
+                "open_connections": stats.open_connections,
+                "overflow": max(stats.open_connections - stats.pool_size, 0),
+                "connections_opened": stats.connections_opened,
+                "connections_closed": stats.connections_closed,
+                "invalidations": stats.invalidations,
+                "timeouts": stats.timeouts,
+                "checkout_wait": stats.checkout_wait.snapshot(),
+                "checkout_hold": stats.checkout_hold.snapshot(),
+                "connection_lifetime": stats.connection_lifetime.snapshot(),
+                "statement_cache": self._statement_cache_snapshot(stats),
+            }
+            for pool_name, stats in sorted(self._pools.items())
+        }
+
+    @staticmethod
+    def _statement_cache_snapshot(stats: _PoolStats) -> dict[str, int]:
+        cache = stats.compiled_cache
+        return {
+            "capacity": cache.capacity if cache is not None else 0,
+            "entries": len(cache) if cache is not None else 0,
+            "hits": stats.statement_cache_hits,
+            "misses": stats.statement_cache_misses,
+            "uncached": stats.statement_cache_uncached,
+        }
+
+    def _stats(self, pool_name: str) -> _PoolStats:
+        stats = self._pools.get(pool_name)
+        if stats is None:
+            stats = self._pools[pool_name] = _PoolStats()
+        return stats
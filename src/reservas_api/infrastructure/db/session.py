@@ -1,10 +1,26 @@
+from dataclasses import dataclass
 from urllib.parse import quote_plus
 
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from reservas_api.infrastructure.db.instrumented_pool import InstrumentedAsyncQueuePool
+from reservas_api.infrastructure.db.pool_metrics import PoolMetrics
+from reservas_api.infrastructure.db.session_router import SessionRouter
 from reservas_api.shared.config.settings import Settings, settings
 
+API_WRITE_POOL = "api_write"
+API_READ_POOL = "api_read"
+WORKER_POOL = "worker"
+REPLICA_POOL = "replica"
+
+
+@dataclass(slots=True, frozen=True)
+class PoolSettings:
+    size: int
+    max_overflow: int
+    timeout_seconds: float
+
 
 def build_database_url(app_settings: Settings) -> str:
     """Build async SQLAlchemy URL from explicit URL or MySQL settings."""
@@ -20,17 +36,83 @@ def build_database_url(app_settings: Settings) -> str:
     )
 
 
+def pool_settings(app_settings: Settings, pool_name: str) -> PoolSettings:
+    """Return the sizing of a workload pool; unknown names use the write pool sizing."""
+    if pool_name in (API_READ_POOL, REPLICA_POOL):
+        return PoolSettings(
+            size=app_settings.db_read_pool_size,
+            max_overflow=app_settings.db_read_max_overflow,
+            timeout_seconds=app_settings.db_read_pool_timeout_seconds,
+        )
+    if pool_name == WORKER_POOL:
+        return PoolSettings(
+            size=app_settings.db_worker_pool_size,
+            max_overflow=app_settings.db_worker_max_overflow,
+            timeout_seconds=app_settings.db_worker_pool_timeout_seconds,
+        )
+    return PoolSettings(
+        size=app_settings.db_pool_size,
+        max_overflow=app_settings.db_max_overflow,
+        timeout_seconds=app_settings.db_pool_timeout_seconds,
+    )
+
+
 def create_session_factory(
     app_settings: Settings = settings,
+    database_url: str | None = None,
+    pool_name: str = API_WRITE_POOL,
+    pool_metrics: PoolMetrics | None = None,
 ) -> async_sessionmaker[AsyncSession]:
-    """Create async SQLModel session factory configured for MySQL."""
+    """Create async SQLModel session factory configured for MySQL.
+
+    Each `pool_name` gets its own engine sized by `pool_settings`, so one
+    workload cannot exhaust the connections of another. With `pool_metrics`
+    its checkouts, pool events and compiled-statement cache hits are recorded
+    under that name.
+    `database_url` overrides the primary URL, e.g. to open the read replica.
+    """
+    sizing = pool_settings(app_settings, pool_name)
     engine = create_async_engine(
-        build_database_url(app_settings),
+        database_url or build_database_url(app_settings),
         echo=app_settings.app_debug,
+        poolclass=InstrumentedAsyncQueuePool,
         pool_pre_ping=True,
-        pool_size=app_settings.db_pool_size,
-        max_overflow=app_settings.db_max_overflow,
-        pool_timeout=app_settings.db_pool_timeout_seconds,
+        pool_size=sizing.size,
+        max_overflow=sizing.max_overflow,
+        pool_timeout=sizing.timeout_seconds,
         pool_recycle=app_settings.db_pool_recycle_seconds,
+        query_cache_size=app_settings.db_query_cache_size,
+        pool_logging_name=pool_name,
     )
+    pool = engine.sync_engine.pool
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        pool.pool_name = pool_name
+        pool.metrics = pool_metrics
+    if pool_metrics is not None:
+        pool_metrics.instrument(engine, pool_name)
     return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def create_session_router(
+    primary: async_sessionmaker[AsyncSession],
+    app_settings: Settings = settings,
+    pool_metrics: PoolMetrics | None = None,
+) -> SessionRouter:
+    """Create the read router, with a replica engine when `DATABASE_REPLICA_URL` is set."""
+    replica = (
+        create_session_factory(
+            app_settings,
+            database_url=app_settings.database_replica_url,
+            pool_name=REPLICA_POOL,
+            pool_metrics=pool_metrics,
+        )
+        if app_settings.database_replica_url
+        else None
+    )
+    return SessionRouter(
+        primary,
+        replica,
+        max_replica_lag_seconds=app_settings.db_replica_max_lag_seconds,
+        lag_check_interval_seconds=app_settings.db_replica_lag_check_interval_seconds,
+        read_your_writes_seconds=app_settings.db_read_your_writes_seconds,
+    )
@@ -0,0 +1,146 @@
+import logging
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from time import monotonic
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+ReplicaLagProbe = Callable[[AsyncSession], Awaitable[float | None]]
+
+
+async def mysql_replica_lag_seconds(session: AsyncSession) -> float | None:
+    """Return `Seconds_Behind_Source` of a MySQL replica, or None when unknown."""
+    result = await session.execute(text("SHOW REPLICA STATUS"))
+    row = result.mappings().first()
+    if row is None:
+        return None
+    lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+    return float(lag) if lag is not None else None
+
+
+class SessionRouter:
+    """Route read-only queries to an optional replica and writes to the primary.
+
+    Reads fall back to the primary when no replica is configured, when the
+    last lag probe failed or exceeded `max_replica_lag_seconds`, and for keys
+    written by this process in the last `read_your_writes_seconds`. The lag is
+    probed at most once per `lag_check_interval_seconds`.
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker[AsyncSession],
+        replica: async_sessionmaker[AsyncSession] | None = None,
+        max_replica_lag_seconds: float = 2.0,
+        lag_check_interval_seconds: float = 5.0,
+        read_your_writes_seconds: float = 5.0,
+        max_tracked_writes: int = 10_000,
+        lag_probe: ReplicaLagProbe | None = None,
+        time_provider: Callable[[], float] | None = None,
+    ) -> None:
+        if max_replica_lag_seconds < 0:
+            raise ValueError("max_replica_lag_seconds must be greater than or equal to zero")
+        if lag_check_interval_seconds <= 0:
+            raise ValueError("lag_check_interval_seconds must be greater than zero")
+        if read_your_writes_seconds < 0:
+            raise ValueError("read_your_writes_seconds must be greater than or equal to zero")
+        if max_tracked_writes <= 0:
+            raise ValueError("max_tracked_writes must be greater than zero")
+
+        self._primary = primary
+        self._replica = replica
+        self._max_replica_lag_seconds = max_replica_lag_seconds
+        self._lag_check_interval_seconds = lag_check_interval_seconds
+        self._read_your_writes_seconds = read_your_writes_seconds
+        self._max_tracked_writes = max_tracked_writes
+        self._lag_probe = lag_probe or mysql_replica_lag_seconds
+        self._time_provider = time_provider or monotonic
+        self._recent_writes: OrderedDict[str, float] = OrderedDict()
+        self._replica_lag_seconds: float | None = None
+        self._lag_checked_at: float | None = None
+        self._replica_reads = 0
+        self._primary_reads = 0
+
+    @property
+    def primary(self) -> async_sessionmaker[AsyncSession]:
+        return self._primary
+
+    @property
+    def replica(self) -> async_sessionmaker[AsyncSession] | None:
+        return self._replica
+
+    @property
+    def replica_lag_seconds(self) -> float | None:
+        return self._replica_lag_seconds
+
+    @property
+    def replica_reads(self) -> int:
+        return self._replica_reads
+
+    @property
+    def primary_reads(self) -> int:
+        return self._primary_reads
+
+    def record_write(self, key: str) -> None:
+        """Pin reads of `key` to the primary until the replica has caught up."""
+        if self._replica is None:
+            return
+        self._recent_writes[key] = self._time_provider()
+        self._recent_writes.move_to_end(key)
+        while len(self._recent_writes) > self._max_tracked_writes:
+            self._recent_writes.popitem(last=False)
+
+    async def reader(self, key: str | None = None) -> async_sessionmaker[AsyncSession]:
+        """Return the session factory that should serve a read of `key`."""
+        if self._replica is None or self._written_recently(key):
+            self._primary_reads += 1
+            return self._primary
+        lag = await self._current_lag()
+        if lag is None or lag > self._max_replica_lag_seconds:
+            self._primary_reads += 1
+            return self._primary
+        self._replica_reads += 1
+        return self._replica
+
+    async def refresh_replica_lag(self) -> float | None:
+        """Probe the replica now; a failed probe counts as unknown lag."""
+        if self._replica is None:
+            return None
+        self._lag_checked_at = self._time_provider()
+        try:
+            async with self._replica() as session:
+                self._replica_lag_seconds = await self._lag_probe(session)
+        except Exception:
+            logger.warning("replica_lag_probe_failed", exc_info=True)
+            self._replica_lag_seconds = None
+        return self._replica_lag_seconds
+
+    async def dispose(self) -> None:
+        """Dispose the replica engine; the primary is owned by its creator."""
+        if self._replica is None:
+            return
+        engine = self._replica.kw.get("bind")
+        if engine is not None:
+            await engine.dispose()
+
+    async def _current_lag(self) -> float | None:
+        checked_at = self._lag_checked_at
+        now = self._time_provider()
+        if checked_at is None or now - checked_at >= self._lag_check_interval_seconds:
+            return await self.refresh_replica_lag()
+        return self._replica_lag_seconds
+
+    def _written_recently(self, key: str | None) -> bool:
+        if key is None:
+            return False
+        written_at = self._recent_writes.get(key)
+        if written_at is None:
+            return False
+        if self._time_provider() - written_at < self._read_your_writes_seconds:
+            return True
+        del self._recent_writes[key]
+        return False
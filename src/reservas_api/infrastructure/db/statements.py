@@ -0,0 +1,114 @@
+from sqlalchemy import Integer, bindparam, func, or_, update
+from sqlmodel import select
+
+from reservas_api.infrastructure.db.models import (
+    ProviderOutboxEventModel,
+    ReservationAddonModel,
+    ReservationModel,
+    ReservationProviderRequestModel,
+)
+
+# Hot-path statements are built once: executing one skips rebuilding the expression and its
+# cache key (memoized on the construct), and its compiled SQL comes from the engine's
+# `query_cache_size` LRU cache. Values are passed as named bind parameters.
+RESERVATION_BY_CODE = select(ReservationModel).where(
+    ReservationModel.reservation_code == bindparam("reservation_code")
+)
+
+RESERVATION_ADDONS_BY_CODE = select(ReservationAddonModel).where(
+    ReservationAddonModel.reservation_code == bindparam("reservation_code")
+)
+
+RESERVATION_CODE_COUNT = select(func.count(ReservationModel.id)).where(
+    ReservationModel.reservation_code == bindparam("reservation_code")
+)
+
+SUCCESSFUL_PROVIDER_REQUEST_COUNT = select(func.count(ReservationProviderRequestModel.id)).where(
+    ReservationProviderRequestModel.reservation_code == bindparam("reservation_code"),
+    ReservationProviderRequestModel.request_type == bindparam("request_type"),
+    ReservationProviderRequestModel.status == "SUCCESS",
+)
+
+# Due events whose claim lease is free or expired. Rows are locked with SKIP LOCKED so concurrent
+# processors claim disjoint batches instead of waiting on each other.
+_DUE_OUTBOX_EVENTS = select(ProviderOutboxEventModel).where(
+    ProviderOutboxEventModel.status.in_(["PENDING", "FAILED"]),
+    ProviderOutboxEventModel.next_attempt_at <= bindparam("now"),
+    or_(
+        ProviderOutboxEventModel.locked_until.is_(None),
+        ProviderOutboxEventModel.locked_until <= bindparam("now"),
+    ),
+)
+
+DUE_OUTBOX_EVENTS = (
+    _DUE_OUTBOX_EVENTS.order_by(ProviderOutboxEventModel.id)
+    .limit(bindparam("limit", type_=Integer))
+    .with_for_update(skip_locked=True)
+)
+
+# Ownership is keyed by `aggregate_id`, so every event of a reservation is handled by one shard.
+DUE_OUTBOX_EVENTS_FOR_SHARD = (
+    _DUE_OUTBOX_EVENTS.where(
+        func.crc32(ProviderOutboxEventModel.aggregate_id) % bindparam("shard_count", type_=Integer)
+        == bindparam("shard_index", type_=Integer)
+    )
+    .order_by(ProviderOutboxEventModel.id)
+    .limit(bindparam("limit", type_=Integer))
+    .with_for_update(skip_locked=True)
+)
+
+# Acknowledgements only touch rows still leased to the acknowledging claim. A row whose lease
+# expired and was claimed again by another processor is left to that processor.
+CLAIMED_OUTBOX_EVENT_IDS = (
+    select(ProviderOutboxEventModel.id)
+    .where(
+        ProviderOutboxEventModel.id.in_(bindparam("event_ids", expanding=True)),
+        ProviderOutboxEventModel.locked_by == bindparam("claim_token"),
+        ProviderOutboxEventModel.status.in_(["PENDING", "FAILED"]),
+    )
+    .with_for_update()
+)
+
+# Extends the lease of a batch still being dispatched, so it is not claimed again mid-batch.
+RENEW_OUTBOX_EVENT_LEASE = (
+    update(ProviderOutboxEventModel)
+    .where(
+        ProviderOutboxEventModel.id.in_(bindparam("event_ids", expanding=True)),
+        ProviderOutboxEventModel.locked_by == bindparam("claim_token"),
+    )
+    .values(locked_until=bindparam("locked_until"))
+)
+
+ACK_PROCESSED_OUTBOX_EVENTS = (
+    update(ProviderOutboxEventModel)
+    .where(
+        ProviderOutboxEventModel.id.in_(bindparam("event_ids", expanding=True)),
+        ProviderOutboxEventModel.locked_by == bindparam("claim_token"),
+    )
+    .values(status="PROCESSED", last_error=None, locked_by=None, locked_until=None)
+)
+
+ACK_FAILED_OUTBOX_EVENT = (
+    update(ProviderOutboxEventModel)
+    .where(
+        ProviderOutboxEventModel.id == bindparam("event_id"),
+        ProviderOutboxEventModel.locked_by == bindparam("claim_token"),
+    )
+    .values(
+        status="FAILED",
+        attempts=bindparam("retry_attempts"),
+        next_attempt_at=bindparam("retry_at"),
+        last_error=bindparam("error"),
+        locked_by=None,
+        locked_until=None,
+    )
+)
+
+ACK_DEFERRED_OUTBOX_EVENT = (
+    update(ProviderOutboxEventModel)
+    .where(
+        ProviderOutboxEventModel.id == bindparam("event_id"),
+        ProviderOutboxEventModel.locked_by == bindparam("claim_token"),
+    )
+    .values(next_attempt_at=bindparam("retry_at"), locked_by=None, locked_until=None)
+)
@@ -1,4 +1,23 @@
+from reservas_api.infrastructure.gateways.http_client_warmer import HttpClientWarmer
+from reservas_api.infrastructure.gateways.http_retry import (
+    is_overload_http_error,
+    is_retryable_http_error,
+    retry_after_seconds,
+)
 from reservas_api.infrastructure.gateways.provider_api_gateway import ProviderAPIGateway
+from reservas_api.infrastructure.gateways.provider_client_registry import (
+    ProviderClientRegistry,
+    ProviderClientSettings,
+)
 from reservas_api.infrastructure.gateways.stripe_payment_gateway import StripePaymentGateway
 
-__all__ = ["ProviderAPIGateway", "StripePaymentGateway"]
+__all__ = [
+    "HttpClientWarmer",
+    "ProviderAPIGateway",
+    "ProviderClientRegistry",
+    "ProviderClientSettings",
+    "StripePaymentGateway",
+    "is_overload_http_error",
+    "is_retryable_http_error",
+    "retry_after_seconds",
+]
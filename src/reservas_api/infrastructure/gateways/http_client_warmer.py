@@ -0,0 +1,72 @@
+import asyncio
+import logging
+from collections.abc import Sequence
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class HttpClientWarmer:
+    """Open keep-alive connections before traffic arrives and keep them alive.
+
+    Concurrent probes force an HTTP/1.1 pool to open one socket per probe, so
+    a burst does not pay TCP and TLS setup on many connections at once. With
+    HTTP/2 the probes share a single multiplexed connection.
+    """
+
+    def __init__(
+        self,
+        clients: Sequence[httpx.AsyncClient],
+        connections_per_client: int = 1,
+        probe_path: str = "/",
+        probe_timeout_seconds: float = 2.0,
+    ) -> None:
+        if connections_per_client <= 0:
+            raise ValueError("connections_per_client must be greater than zero")
+
+        self._clients = list(clients)
+        self._connections_per_client = connections_per_client
+        self._probe_path = probe_path
+        self._probe_timeout_seconds = probe_timeout_seconds
+        self._stop_event = asyncio.Event()
+
+    async def prewarm(self) -> int:
+        """Probe every client concurrently and return the successful probe count."""
+        results = await asyncio.gather(
+            *(
+                self._probe(client)
+                for client in self._clients
+                for _ in range(self._connections_per_client)
+            )
+        )
+        return sum(1 for succeeded in results if succeeded)
+
+    async def run_keepalive(self, interval_seconds: float) -> None:
+        """Re-probe warm connections every `interval_seconds` until stopped.
+
+        The interval must be shorter than the pool keep-alive expiry, otherwise
+        idle connections are closed between probes.
+        """
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be greater than zero")
+        while not self._stop_event.is_set():
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=interval_seconds)
+            except TimeoutError:
+                await self.prewarm()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    async def _probe(self, client: httpx.AsyncClient) -> bool:
+        # Any HTTP response, even 404, means the connection is open and pooled.
+        try:
+            await client.head(self._probe_path, timeout=self._probe_timeout_seconds)
+        except httpx.HTTPError as exc:
+            logger.debug(
+                "http_connection_probe_failed",
+                extra={"base_url": str(client.base_url), "error": str(exc)},
+            )
+            return False
+        return True
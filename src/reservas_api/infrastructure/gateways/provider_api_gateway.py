@@ -1,49 +1,123 @@
+import json
 from datetime import UTC
 
 import httpx
 
 from reservas_api.domain.entities import Reservation
 from reservas_api.domain.ports import ProviderResult
+from reservas_api.infrastructure.gateways.provider_client_registry import ProviderClientRegistry
 from reservas_api.infrastructure.resilience import (
+    AdaptiveConcurrencyLimiter,
     CircuitBreaker,
     CircuitBreakerOpenError,
+    CircuitBreakerRegistry,
+    ConcurrencyLimitExceededError,
+    HedgingPolicy,
+    RetryBudget,
+    RetryBudgetRegistry,
     RetryPolicy,
+    SlidingWindowCircuitBreaker,
 )
+from reservas_api.shared.resilience import Deadline, DeadlineExceededError
+
+JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 class ProviderAPIGateway:
     def __init__(
         self,
         client: httpx.AsyncClient,
-        circuit_breaker: CircuitBreaker,
+        circuit_breaker: CircuitBreaker | SlidingWindowCircuitBreaker,
         retry_policy: RetryPolicy,
         timeout_seconds: float = 10.0,
+        client_registry: ProviderClientRegistry | None = None,
+        hedging_policy: HedgingPolicy | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        supplier_circuit_breakers: CircuitBreakerRegistry | None = None,
+        supplier_retry_budgets: RetryBudgetRegistry | None = None,
     ) -> None:
         self._client = client
         self._circuit_breaker = circuit_breaker
         self._retry_policy = retry_policy
         self._timeout_seconds = timeout_seconds
+        self._client_registry = client_registry
+        self._hedging_policy = hedging_policy
+        self._concurrency_limiter = concurrency_limiter
+        self._supplier_circuit_breakers = supplier_circuit_breakers
+        self._supplier_retry_budgets = supplier_retry_budgets
 
     async def create_booking(self, reservation: Reservation) -> ProviderResult:
-        async def _request() -> ProviderResult:
-            response = await self._client.post(
+        return await self.create_booking_request(
+            self.build_request_body(reservation),
+            supplier_code=reservation.supplier_code,
+            idempotency_key=reservation.reservation_code.value,
+        )
+
+    async def create_booking_request(
+        self,
+        body: bytes,
+        supplier_code: str | None = None,
+        idempotency_key: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> ProviderResult:
+        """Send a request body encoded earlier by `build_request_body`.
+
+        With a client registry, the request goes through the pool dedicated
+        to `supplier_code`. Hedged requests are only sent when an
+        `idempotency_key` lets the provider collapse the duplicate. With
+        supplier circuit breakers, one failing supplier only opens its own
+        circuit, and with supplier retry budgets it only spends its own
+        retries. A `deadline` bounds every attempt and the retries as a whole.
+        """
+        client, timeout_seconds = self._resolve_client(supplier_code)
+        circuit_breaker = self._resolve_circuit_breaker(supplier_code)
+        headers = JSON_HEADERS
+        if idempotency_key is not None:
+            headers = {**JSON_HEADERS, "Idempotency-Key": idempotency_key}
+
+        async def _send() -> ProviderResult:
+            attempt_timeout_seconds = timeout_seconds
+            if deadline is not None:
+                attempt_timeout_seconds = deadline.clip(timeout_seconds)
+            response = await client.post(
                 "/bookings",
-                json=self._build_booking_payload(reservation),
-                timeout=self._timeout_seconds,
+                content=body,
+                headers=headers,
+                timeout=attempt_timeout_seconds,
             )
             response.raise_for_status()
             payload = response.json()
             status = str(payload.get("status", "SUCCESS")).upper()
             return ProviderResult(success=True, status=status, payload=payload)
 
+        async def _request() -> ProviderResult:
+            if self._hedging_policy is None or idempotency_key is None:
+                return await _send()
+            return await self._hedging_policy.execute(
+                _send,
+                key=supplier_code or "default",
+                permits=self._concurrency_limiter,
+            )
+
         async def _request_with_circuit_breaker() -> ProviderResult:
-            return await self._circuit_breaker.call(_request)
+            return await circuit_breaker.call(_request, deadline)
+
+        async def _limited_request() -> ProviderResult:
+            if self._concurrency_limiter is None:
+                return await _request_with_circuit_breaker()
+            return await self._concurrency_limiter.call(_request_with_circuit_breaker)
 
         try:
-            return await self._retry_policy.execute(_request_with_circuit_breaker)
+            return await self._retry_policy.execute(
+                _limited_request,
+                deadline,
+                budget=self._resolve_retry_budget(supplier_code),
+            )
         except CircuitBreakerOpenError:
             return ProviderResult(success=False, status="CIRCUIT_OPEN", payload=None)
-        except httpx.TimeoutException:
+        except ConcurrencyLimitExceededError:
+            return ProviderResult(success=False, status="THROTTLED", payload=None)
+        except (httpx.TimeoutException, DeadlineExceededError):
             return ProviderResult(success=False, status="TIMEOUT", payload=None)
         except httpx.HTTPError as exc:
             return ProviderResult(
@@ -52,6 +126,30 @@ class ProviderAPIGateway:
                 payload={"error": str(exc)},
             )
 
+    def _resolve_circuit_breaker(
+        self,
+        supplier_code: str | None,
+    ) -> CircuitBreaker | SlidingWindowCircuitBreaker:
+        if self._supplier_circuit_breakers is None or supplier_code is None:
+            return self._circuit_breaker
+        return self._supplier_circuit_breakers.get(supplier_code)
+
+    def _resolve_retry_budget(self, supplier_code: str | None) -> RetryBudget | None:
+        if self._supplier_retry_budgets is None or supplier_code is None:
+            return None
+        return self._supplier_retry_budgets.get(supplier_code)
+
+    def _resolve_client(self, supplier_code: str | None) -> tuple[httpx.AsyncClient, float]:
+        if self._client_registry is None:
+            return self._client, self._timeout_seconds
+        return self._client_registry.resolve(supplier_code)
+
+    @staticmethod
+    def build_request_body(reservation: Reservation) -> bytes:
+        """Encode the `/bookings` request body for `reservation`."""
+        payload = ProviderAPIGateway._build_booking_payload(reservation)
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
     @staticmethod
     def _build_booking_payload(reservation: Reservation) -> dict:
         pickup = reservation.pickup_datetime.astimezone(UTC).isoformat()
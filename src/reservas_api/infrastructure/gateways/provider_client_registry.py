@@ -0,0 +1,110 @@
+import logging
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+import httpx
+
+from reservas_api.infrastructure.repositories import ProviderEntity
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class ProviderClientSettings:
+    base_url: str
+    timeout_seconds: float
+    max_connections: int
+    max_keepalive_connections: int | None = None
+
+
+class ProviderClientRegistry:
+    """Dedicated pooled HTTP client per provider entity, keyed by supplier code.
+
+    Each provider gets its own connection limits and timeout, so a slow
+    supplier can only exhaust its own pool. Unknown suppliers use the
+    shared default client.
+    """
+
+    def __init__(
+        self,
+        default_client: httpx.AsyncClient,
+        default_settings: ProviderClientSettings,
+        client_factory: Callable[[ProviderClientSettings], httpx.AsyncClient],
+    ) -> None:
+        self._default_client = default_client
+        self._default_settings = default_settings
+        self._client_factory = client_factory
+        self._clients: dict[str, tuple[httpx.AsyncClient, float]] = {}
+
+    @property
+    def supplier_codes(self) -> list[str]:
+        return sorted(self._clients)
+
+    @property
+    def dedicated_clients(self) -> list[httpx.AsyncClient]:
+        return [client for client, _ in self._clients.values()]
+
+    def register_entities(self, entities: Iterable[ProviderEntity]) -> None:
+        for entity in entities:
+            if entity.entity_code in self._clients:
+                continue
+            client_settings = self._settings_for(entity)
+            self._clients[entity.entity_code] = (
+                self._client_factory(client_settings),
+                client_settings.timeout_seconds,
+            )
+            logger.info(
+                "provider_client_registered",
+                extra={
+                    "supplier_code": entity.entity_code,
+                    "max_connections": client_settings.max_connections,
+                    "timeout_seconds": client_settings.timeout_seconds,
+                },
+            )
+
+    def resolve(self, supplier_code: str | None) -> tuple[httpx.AsyncClient, float]:
+        """Return the client and timeout used for `supplier_code`."""
+        if supplier_code is not None and supplier_code in self._clients:
+            return self._clients[supplier_code]
+        return self._default_client, self._default_settings.timeout_seconds
+
+    async def aclose(self) -> None:
+        """Close dedicated clients; the default client is owned by the caller."""
+        clients = self.dedicated_clients
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
+    def _settings_for(self, entity: ProviderEntity) -> ProviderClientSettings:
+        """Build client settings from the entity row; malformed config falls back to defaults."""
+        try:
+            return self._parse_settings(entity)
+        except (AttributeError, TypeError, ValueError) as exc:
+            logger.warning(
+                "provider_client_config_invalid",
+                extra={"supplier_code": entity.entity_code, "error": str(exc)},
+            )
+            return self._default_settings
+
+    def _parse_settings(self, entity: ProviderEntity) -> ProviderClientSettings:
+        config = entity.config
+        defaults = self._default_settings
+        timeout_seconds = (
+            entity.default_timeout_ms / 1000
+            if entity.default_timeout_ms > 0
+            else defaults.timeout_seconds
+        )
+        max_connections = int(config.get("max_connections") or defaults.max_connections)
+        if max_connections <= 0:
+            raise ValueError("max_connections must be greater than zero")
+        max_keepalive = config.get("max_keepalive_connections", defaults.max_keepalive_connections)
+        if max_keepalive is not None:
+            max_keepalive = int(max_keepalive)
+            if max_keepalive < 0:
+                raise ValueError("max_keepalive_connections must not be negative")
+        return ProviderClientSettings(
+            base_url=str(config.get("base_url") or defaults.base_url),
+            timeout_seconds=timeout_seconds,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+        )
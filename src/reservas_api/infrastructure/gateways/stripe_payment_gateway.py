@@ -1,40 +1,84 @@
+import json
 from datetime import UTC
 
 import httpx
 
 from reservas_api.domain.entities import Reservation
 from reservas_api.domain.ports import PaymentResult
-from reservas_api.infrastructure.resilience import CircuitBreaker, CircuitBreakerOpenError
+from reservas_api.infrastructure.resilience import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    CircuitBreakerOpenError,
+    ConcurrencyLimitExceededError,
+    SlidingWindowCircuitBreaker,
+)
+from reservas_api.shared.resilience import Deadline, DeadlineExceededError
+
+JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 class StripePaymentGateway:
     def __init__(
         self,
         client: httpx.AsyncClient,
-        circuit_breaker: CircuitBreaker,
+        circuit_breaker: CircuitBreaker | SlidingWindowCircuitBreaker,
         timeout_seconds: float = 10.0,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
     ) -> None:
         self._client = client
         self._circuit_breaker = circuit_breaker
         self._timeout_seconds = timeout_seconds
+        self._concurrency_limiter = concurrency_limiter
 
     async def process_payment(self, reservation: Reservation) -> PaymentResult:
+        return await self.process_payment_request(
+            self.build_request_body(reservation),
+            idempotency_key=reservation.reservation_code.value,
+        )
+
+    async def process_payment_request(
+        self,
+        body: bytes,
+        idempotency_key: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> PaymentResult:
+        """Send a request body encoded earlier by `build_request_body`.
+
+        An `idempotency_key` is sent as the `Idempotency-Key` header so a
+        retried charge is collapsed by Stripe instead of charged twice. With a
+        `deadline`, the request timeout is cut to the remaining budget.
+        """
+        headers = JSON_HEADERS
+        if idempotency_key is not None:
+            headers = {**JSON_HEADERS, "Idempotency-Key": idempotency_key}
+
         async def _request() -> PaymentResult:
+            timeout_seconds = self._timeout_seconds
+            if deadline is not None:
+                timeout_seconds = deadline.clip(timeout_seconds)
             response = await self._client.post(
                 "/payments",
-                json=self._build_payment_payload(reservation),
-                timeout=self._timeout_seconds,
+                content=body,
+                headers=headers,
+                timeout=timeout_seconds,
             )
             response.raise_for_status()
             payload = response.json()
             status = str(payload.get("status", "SUCCESS")).upper()
             return PaymentResult(success=True, status=status, payload=payload)
 
+        async def _request_with_circuit_breaker() -> PaymentResult:
+            return await self._circuit_breaker.call(_request, deadline)
+
         try:
-            return await self._circuit_breaker.call(_request)
+            if self._concurrency_limiter is None:
+                return await _request_with_circuit_breaker()
+            return await self._concurrency_limiter.call(_request_with_circuit_breaker)
         except CircuitBreakerOpenError:
             return PaymentResult(success=False, status="CIRCUIT_OPEN", payload=None)
-        except httpx.TimeoutException:
+        except ConcurrencyLimitExceededError:
+            return PaymentResult(success=False, status="THROTTLED", payload=None)
+        except (httpx.TimeoutException, DeadlineExceededError):
             return PaymentResult(success=False, status="TIMEOUT", payload=None)
         except httpx.HTTPError as exc:
             return PaymentResult(
@@ -43,6 +87,12 @@ class StripePaymentGateway:
                 payload={"error": str(exc)},
             )
 
+    @staticmethod
+    def build_request_body(reservation: Reservation) -> bytes:
+        """Encode the `/payments` request body for `reservation`."""
+        payload = StripePaymentGateway._build_payment_payload(reservation)
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
     @staticmethod
     def _build_payment_payload(reservation: Reservation) -> dict:
         pickup = reservation.pickup_datetime.astimezone(UTC).isoformat()
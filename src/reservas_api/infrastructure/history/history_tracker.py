@@ -6,13 +6,19 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from reservas_api.domain.enums import ReservationStatus
 from reservas_api.infrastructure.db.models import ReservationStatusHistoryModel
+from reservas_api.infrastructure.db.session_router import SessionRouter
 
 
 class HistoryTracker:
     """Persist and read reservation status change history."""
 
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        session_router: SessionRouter | None = None,
+    ) -> None:
         self._session_factory = session_factory
+        self._session_router = session_router
 
     async def track_status_change(
         self,
@@ -24,6 +30,8 @@ class HistoryTracker:
         changed_at: datetime,
     ) -> None:
         """Store a status transition in the current transaction."""
+        if self._session_router is not None:
+            self._session_router.record_write(reservation_code)
         session.add(
             ReservationStatusHistoryModel(
                 reservation_code=reservation_code,
@@ -34,8 +42,11 @@ class HistoryTracker:
         )
 
     async def get_history(self, reservation_code: str) -> list[ReservationStatusHistoryModel]:
-        """Return ordered status history for a reservation code."""
-        async with self._session_factory() as session:
+        """Return ordered status history, from the replica when a router is set."""
+        session_factory = self._session_factory
+        if self._session_router is not None:
+            session_factory = await self._session_router.reader(reservation_code)
+        async with session_factory() as session:
             result = await session.exec(
                 select(ReservationStatusHistoryModel)
                 .where(ReservationStatusHistoryModel.reservation_code == reservation_code)
@@ -1,5 +1,15 @@
+from reservas_api.infrastructure.outbox.outbox_archiver import OutboxArchiver
+from reservas_api.infrastructure.outbox.outbox_dead_letter_queue import OutboxDeadLetterQueue
 from reservas_api.infrastructure.outbox.outbox_event_processor import OutboxEventProcessor
 from reservas_api.infrastructure.outbox.outbox_event_publisher import OutboxEventPublisher
+from reservas_api.infrastructure.outbox.outbox_idempotency import outbox_idempotency_key
+from reservas_api.infrastructure.outbox.outbox_metrics import OutboxMetrics
 
-__all__ = ["OutboxEventProcessor", "OutboxEventPublisher"]
-
+__all__ = [
+    "OutboxArchiver",
+    "OutboxDeadLetterQueue",
+    "OutboxEventProcessor",
+    "OutboxEventPublisher",
+    "OutboxMetrics",
+    "outbox_idempotency_key",
+]
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from reservas_api.infrastructure.db.models import (
+    ProviderOutboxEventArchiveModel,
+    ProviderOutboxEventModel,
+)
+
+ARCHIVED_COLUMNS = (
+    "id",
+    "aggregate_id",
+    "event_type",
+    "payload",
+    "request_body",
+    "status",
+    "attempts",
+    "next_attempt_at",
+    "last_error",
+    "created_at",
+)
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxArchiver:
+    """Move old `PROCESSED` outbox events into `provider_outbox_events_archive`.
+
+    Rows are moved in small primary-key batches, each in its own short
+    transaction, so the hot table is never locked for long.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        retention_seconds: float = 7 * 24 * 3600,
+        batch_size: int = 500,
+        poll_interval_seconds: float = 300.0,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        if retention_seconds < 0:
+            raise ValueError("retention_seconds must not be negative")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than zero")
+        if poll_interval_seconds <= 0:
+            raise ValueError("poll_interval_seconds must be greater than zero")
+
+        self._session_factory = session_factory
+        self._retention = timedelta(seconds=retention_seconds)
+        self._batch_size = batch_size
+        self._poll_interval_seconds = poll_interval_seconds
+        self._clock = clock or (lambda: datetime.now(UTC))
+        self._stop_event = asyncio.Event()
+
+    async def archive_once(self) -> int:
+        """Archive one batch of expired processed events and return its size.
+
+        `next_attempt_at` of a processed event is the time of its last
+        dispatch, so the cutoff is served by the `(status, next_attempt_at)` index.
+        """
+        cutoff = self._clock() - self._retention
+        async with self._session_factory() as session:
+            async with session.begin():
+                result = await session.exec(
+                    select(ProviderOutboxEventModel.id)
+                    .where(
+                        ProviderOutboxEventModel.status == "PROCESSED",
+                        ProviderOutboxEventModel.next_attempt_at < cutoff,
+                    )
+                    .order_by(ProviderOutboxEventModel.next_attempt_at)
+                    .limit(self._batch_size)
+                )
+                event_ids = list(result.all())
+                if not event_ids:
+                    return 0
+
+                source_columns = [
+                    getattr(ProviderOutboxEventModel, name) for name in ARCHIVED_COLUMNS
+                ]
+                await session.exec(
+                    insert(ProviderOutboxEventArchiveModel).from_select(
+                        list(ARCHIVED_COLUMNS),
+                        select(*source_columns).where(ProviderOutboxEventModel.id.in_(event_ids)),
+                    )
+                )
+                await session.exec(
+                    delete(ProviderOutboxEventModel).where(
+                        ProviderOutboxEventModel.id.in_(event_ids)
+                    )
+                )
+                return len(event_ids)
+
+    async def archive_pending(self, max_batches: int | None = None) -> int:
+        """Archive batches until no expired rows remain or `max_batches` is reached."""
+        archived = 0
+        batches = 0
+        while not self._stop_event.is_set():
+            if max_batches is not None and batches >= max_batches:
+                break
+            moved = await self.archive_once()
+            archived += moved
+            batches += 1
+            if moved < self._batch_size:
+                break
+            # Let other tasks run between batches.
+            await asyncio.sleep(0)
+        return archived
+
+    async def run_forever(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                await self.archive_pending()
+            except Exception:
+                logger.exception("outbox_archive_failed")
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=self._poll_interval_seconds)
+            except TimeoutError:
+                continue
+
+    def stop(self) -> None:
+        self._stop_event.set()
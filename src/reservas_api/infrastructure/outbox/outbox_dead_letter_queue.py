@@ -0,0 +1,81 @@
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from reservas_api.infrastructure.db.models import (
+    ProviderOutboxDeadLetterModel,
+    ProviderOutboxEventModel,
+)
+
+
+class OutboxDeadLetterQueue:
+    """Inspect and requeue outbox events that exhausted their attempts."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._clock = clock or (lambda: datetime.now(UTC))
+
+    async def list_entries(self, limit: int = 100) -> list[ProviderOutboxDeadLetterModel]:
+        """Return the oldest dead-lettered events first."""
+        async with self._session_factory() as session:
+            result = await session.exec(
+                select(ProviderOutboxDeadLetterModel)
+                .order_by(ProviderOutboxDeadLetterModel.id)
+                .limit(limit)
+            )
+            return list(result.all())
+
+    async def requeue(
+        self,
+        event_ids: Iterable[int] | None = None,
+        limit: int = 100,
+        aggregate_ids: Iterable[str] | None = None,
+    ) -> int:
+        """Move dead letters back to the outbox as fresh `PENDING` events.
+
+        The original event id is kept so downstream references stay stable.
+        `aggregate_ids` requeues every event of a reservation, e.g. a payment and
+        the booking dead-lettered with it. Without filters, up to `limit` of the
+        oldest entries are requeued.
+        """
+        async with self._session_factory() as session:
+            async with session.begin():
+                query = select(ProviderOutboxDeadLetterModel).order_by(
+                    ProviderOutboxDeadLetterModel.id
+                )
+                if event_ids is None and aggregate_ids is None:
+                    query = query.limit(limit)
+                if event_ids is not None:
+                    query = query.where(ProviderOutboxDeadLetterModel.event_id.in_(list(event_ids)))
+                if aggregate_ids is not None:
+                    query = query.where(
+                        ProviderOutboxDeadLetterModel.aggregate_id.in_(list(aggregate_ids))
+                    )
+                result = await session.exec(query)
+                entries = list(result.all())
+
+                now = self._clock()
+                for entry in entries:
+                    session.add(
+                        ProviderOutboxEventModel(
+                            id=entry.event_id,
+                            aggregate_id=entry.aggregate_id,
+                            event_type=entry.event_type,
+                            payload=dict(entry.payload or {}),
+                            request_body=entry.request_body,
+                            status="PENDING",
+                            attempts=0,
+                            last_error=None,
+                            next_attempt_at=now,
+                            created_at=entry.created_at,
+                        )
+                    )
+                    await session.delete(entry)
+                return len(entries)
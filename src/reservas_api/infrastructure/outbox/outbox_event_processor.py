@@ -1,15 +1,85 @@
 import asyncio
+import logging
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal, InvalidOperation
+from time import monotonic, perf_counter
+from typing import Any
+from uuid import uuid4
 
+from sqlalchemy import delete, func, or_, update
 from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from reservas_api.application.use_cases.update_reservation_status_use_case import (
+    ExternalRequestType,
+    ReservationStatusUpdateNotFoundError,
+    UpdateReservationAuditLogger,
+    UpdateReservationStatusRequest,
+    UpdateReservationStatusUseCase,
+)
 from reservas_api.domain.entities import Reservation
-from reservas_api.domain.ports import PaymentGateway, ProviderGateway
+from reservas_api.domain.ports import (
+    PaymentGateway,
+    PaymentResult,
+    ProviderGateway,
+    ProviderResult,
+)
 from reservas_api.domain.value_objects import ReservationCode
-from reservas_api.infrastructure.db.models import ProviderOutboxEventModel
+from reservas_api.infrastructure.db.models import (
+    ProviderIdempotencyKeyModel,
+    ProviderOutboxDeadLetterModel,
+    ProviderOutboxEventModel,
+)
+from reservas_api.infrastructure.db.statements import (
+    ACK_DEFERRED_OUTBOX_EVENT,
+    ACK_FAILED_OUTBOX_EVENT,
+    ACK_PROCESSED_OUTBOX_EVENTS,
+    CLAIMED_OUTBOX_EVENT_IDS,
+    DUE_OUTBOX_EVENTS,
+    DUE_OUTBOX_EVENTS_FOR_SHARD,
+    RENEW_OUTBOX_EVENT_LEASE,
+)
+from reservas_api.infrastructure.outbox.outbox_idempotency import (
+    outbox_idempotency_key,
+    request_hash,
+)
+from reservas_api.infrastructure.outbox.outbox_metrics import OutboxMetrics
+from reservas_api.infrastructure.repositories import MySQLReservationStatusStore
+from reservas_api.shared.resilience import Deadline
+
+MAX_LAST_ERROR_LENGTH = 500
+PAYMENT_EVENT_TYPE = "PAYMENT_REQUESTED"
+BOOKING_EVENT_TYPE = "BOOKING_REQUESTED"
+PAYMENT_PROVIDER_CODE = "STRIPE"
+REQUEST_TYPES: dict[str, ExternalRequestType] = {
+    PAYMENT_EVENT_TYPE: "PAYMENT",
+    BOOKING_EVENT_TYPE: "BOOKING",
+}
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _DispatchOutcome:
+    event: ProviderOutboxEventModel
+    error: str | None = None
+    deferred: bool = False
+    result: PaymentResult | ProviderResult | None = None
+    payment_next_attempt_at: datetime | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None and not self.deferred
+
+    @property
+    def outcome(self) -> str:
+        if self.deferred:
+            return "deferred"
+        return "processed" if self.error is None else "failed"
 
 
 class OutboxEventProcessor:
@@ -20,93 +90,630 @@ class OutboxEventProcessor:
         provider_gateway: ProviderGateway,
         poll_interval_seconds: float = 5.0,
         batch_size: int = 20,
+        max_attempts: int = 10,
+        retry_base_delay_seconds: float = 5.0,
+        retry_max_delay_seconds: float = 900.0,
+        clock: Callable[[], datetime] | None = None,
+        random_func: Callable[[], float] | None = None,
+        audit_logger: UpdateReservationAuditLogger | None = None,
+        metrics: OutboxMetrics | None = None,
+        backlog_refresh_interval_seconds: float = 5.0,
+        shard_index: int = 0,
+        shard_count: int = 1,
+        dispatch_deadline_seconds: float | None = None,
+        claim_lease_seconds: float = 300.0,
     ) -> None:
         if poll_interval_seconds <= 0:
             raise ValueError("poll_interval_seconds must be greater than zero")
         if batch_size <= 0:
             raise ValueError("batch_size must be greater than zero")
+        if max_attempts <= 0:
+            raise ValueError("max_attempts must be greater than zero")
+        if retry_base_delay_seconds <= 0:
+            raise ValueError("retry_base_delay_seconds must be greater than zero")
+        if retry_max_delay_seconds < retry_base_delay_seconds:
+            raise ValueError(
+                "retry_max_delay_seconds must be greater than or equal to retry_base_delay_seconds"
+            )
+        if shard_count <= 0:
+            raise ValueError("shard_count must be greater than zero")
+        if not 0 <= shard_index < shard_count:
+            raise ValueError("shard_index must be between zero and shard_count - 1")
+        if dispatch_deadline_seconds is not None and dispatch_deadline_seconds <= 0:
+            raise ValueError("dispatch_deadline_seconds must be greater than zero")
+        if claim_lease_seconds <= 0:
+            raise ValueError("claim_lease_seconds must be greater than zero")
+        if (
+            dispatch_deadline_seconds is not None
+            and claim_lease_seconds <= dispatch_deadline_seconds
+        ):
+            raise ValueError("claim_lease_seconds must be greater than dispatch_deadline_seconds")
 
         self._session_factory = session_factory
         self._payment_gateway = payment_gateway
         self._provider_gateway = provider_gateway
         self._poll_interval_seconds = poll_interval_seconds
         self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._retry_base_delay_seconds = retry_base_delay_seconds
+        self._retry_max_delay_seconds = retry_max_delay_seconds
+        self._clock = clock or (lambda: datetime.now(UTC))
+        self._random_func = random_func or random.random
+        self._audit_logger = audit_logger
+        self._metrics = metrics
+        self._backlog_refresh_interval_seconds = backlog_refresh_interval_seconds
+        self._backlog_refreshed_at: float | None = None
+        self._shard_index = shard_index
+        self._shard_count = shard_count
+        self._dispatch_deadline_seconds = dispatch_deadline_seconds
+        self._claim_lease_seconds = claim_lease_seconds
+        # Renew the lease before a dispatch that could otherwise outlive it.
+        self._lease_renew_margin_seconds = max(
+            claim_lease_seconds / 2,
+            dispatch_deadline_seconds or 0.0,
+        )
         self._stop_event = asyncio.Event()
+        self._wakeup_event = asyncio.Event()
 
     async def run_forever(self) -> None:
+        """Process batches until stopped, waking early on `notify()`.
+
+        The poll interval acts as a fallback sweep for events whose retry
+        became due or that were committed by other processes.
+        """
         while not self._stop_event.is_set():
-            await self.process_pending_once(self._batch_size)
+            self._wakeup_event.clear()
+            try:
+                await self.process_pending_once(self._batch_size)
+            except Exception:
+                logger.exception("outbox_batch_failed")
+            if self._stop_event.is_set():
+                break
             try:
                 await asyncio.wait_for(
-                    self._stop_event.wait(),
+                    self._wakeup_event.wait(),
                     timeout=self._poll_interval_seconds,
                 )
             except TimeoutError:
                 continue
 
+    def notify(self) -> None:
+        """Wake the processing loop after new events were committed."""
+        self._wakeup_event.set()
+
     def stop(self) -> None:
         self._stop_event.set()
+        self._wakeup_event.set()
 
     async def process_pending_once(self, limit: int | None = None) -> int:
         target_limit = limit if limit is not None else self._batch_size
+        claim_token = uuid4().hex
+        claimed_at = self._clock()
+        events, unpaid_aggregates = await self._claim_due_events(
+            target_limit, claim_token, claimed_at
+        )
+        lease_expires_at = claimed_at + timedelta(seconds=self._claim_lease_seconds)
+        owned_ids = {event.id for event in events}
+
+        outcomes: list[_DispatchOutcome] = []
+        for event in events:
+            if event.event_type == BOOKING_EVENT_TYPE and event.aggregate_id in unpaid_aggregates:
+                outcomes.append(
+                    _DispatchOutcome(
+                        event=event,
+                        deferred=True,
+                        payment_next_attempt_at=unpaid_aggregates[event.aggregate_id],
+                    )
+                )
+                continue
+            now = self._clock()
+            if lease_expires_at - now < timedelta(seconds=self._lease_renew_margin_seconds):
+                owned_ids = await self._renew_lease(owned_ids, claim_token, now)
+                lease_expires_at = now + timedelta(seconds=self._claim_lease_seconds)
+            if event.id not in owned_ids:
+                continue
+            started_at = perf_counter()
+            try:
+                dispatch_result = await self._dispatch_event(event)
+            except Exception as exc:
+                outcomes.append(_DispatchOutcome(event=event, error=str(exc)))
+                continue
+            finally:
+                if self._metrics is not None:
+                    self._metrics.record_dispatch(event.event_type, perf_counter() - started_at)
+            if not dispatch_result.success:
+                outcomes.append(
+                    _DispatchOutcome(
+                        event=event,
+                        error=(
+                            f"{'Payment' if event.event_type == PAYMENT_EVENT_TYPE else 'Provider'}"
+                            f" dispatch failed with status={dispatch_result.status}"
+                        ),
+                        result=dispatch_result,
+                    )
+                )
+                continue
+            outcomes.append(_DispatchOutcome(event=event, result=dispatch_result))
+            if event.event_type == PAYMENT_EVENT_TYPE:
+                unpaid_aggregates.pop(event.aggregate_id, None)
+
+        if outcomes:
+            outcomes = await self._flush_outcomes(outcomes, claim_token)
+        if self._metrics is not None:
+            self._metrics.record_batch()
+            for outcome in outcomes:
+                self._metrics.record_outcome(outcome.event.event_type, outcome.outcome)
+            await self._refresh_backlog_metrics()
+        return sum(1 for outcome in outcomes if outcome.succeeded)
+
+    async def _claim_due_events(
+        self,
+        limit: int,
+        claim_token: str,
+        now: datetime,
+    ) -> tuple[list[ProviderOutboxEventModel], dict[str, datetime]]:
+        """Lease a batch of due events to this processor in a short transaction.
+
+        Rows are selected with `FOR UPDATE SKIP LOCKED` and stamped with
+        `locked_by`/`locked_until`, so other processors skip them until they are
+        acknowledged or the lease expires (a crashed processor's batch is then
+        picked up again).
+        """
+        params: dict[str, Any] = {"now": now, "limit": limit}
+        query = DUE_OUTBOX_EVENTS
+        if self._shard_count > 1:
+            query = DUE_OUTBOX_EVENTS_FOR_SHARD
+            params.update(shard_count=self._shard_count, shard_index=self._shard_index)
+        async with self._session_factory() as session:
+            async with session.begin():
+                result = await session.exec(query, params=params)
+                events = list(result.all())
+                if not events:
+                    return [], {}
+                await session.exec(
+                    update(ProviderOutboxEventModel)
+                    .where(ProviderOutboxEventModel.id.in_([event.id for event in events]))
+                    .values(
+                        locked_by=claim_token,
+                        locked_until=now + timedelta(seconds=self._claim_lease_seconds),
+                    )
+                )
+                unpaid_aggregates = await self._load_unpaid_aggregates(session, events, now)
+        return events, unpaid_aggregates
+
+    async def _renew_lease(
+        self,
+        event_ids: set[int],
+        claim_token: str,
+        now: datetime,
+    ) -> set[int]:
+        """Extend the lease on the unacknowledged events of a batch still being dispatched.
+
+        Events are dispatched one after another, so a batch can outlive a lease
+        taken at claim time. Returns the events still leased to `claim_token`;
+        any other was claimed again after the lease expired and is skipped.
+        """
+        if not event_ids:
+            return set()
         async with self._session_factory() as session:
-            query = (
-                select(ProviderOutboxEventModel.id)
+            async with session.begin():
+                result = await session.exec(
+                    CLAIMED_OUTBOX_EVENT_IDS,
+                    params={"event_ids": list(event_ids), "claim_token": claim_token},
+                )
+                owned_ids = set(result.all())
+                if owned_ids:
+                    connection = await session.connection()
+                    await connection.execute(
+                        RENEW_OUTBOX_EVENT_LEASE,
+                        {
+                            "event_ids": list(owned_ids),
+                            "claim_token": claim_token,
+                            "locked_until": now + timedelta(seconds=self._claim_lease_seconds),
+                        },
+                    )
+        lost_ids = sorted(event_ids - owned_ids)
+        if lost_ids:
+            logger.warning("outbox_lease_lost", extra={"event_ids": lost_ids})
+        return owned_ids
+
+    async def _refresh_backlog_metrics(self) -> None:
+        """Refresh backlog gauges, at most once per refresh interval."""
+        if self._metrics is None:
+            return
+        now = monotonic()
+        if (
+            self._backlog_refreshed_at is not None
+            and now - self._backlog_refreshed_at < self._backlog_refresh_interval_seconds
+        ):
+            return
+        self._backlog_refreshed_at = now
+        async with self._session_factory() as session:
+            result = await session.exec(
+                select(
+                    ProviderOutboxEventModel.status,
+                    func.count(ProviderOutboxEventModel.id),
+                    func.min(ProviderOutboxEventModel.created_at),
+                )
                 .where(ProviderOutboxEventModel.status.in_(["PENDING", "FAILED"]))
-                .order_by(ProviderOutboxEventModel.id)
-                .limit(target_limit)
+                .group_by(ProviderOutboxEventModel.status)
+            )
+            rows = list(result.all())
+        counts = {status: count for status, count, _ in rows}
+        oldest = [created_at for _, _, created_at in rows if created_at is not None]
+        self._metrics.record_backlog(
+            pending_count=counts.get("PENDING", 0),
+            failed_count=counts.get("FAILED", 0),
+            oldest_pending_created_at=min(oldest) if oldest else None,
+        )
+
+    @staticmethod
+    async def _load_unpaid_aggregates(
+        session: AsyncSession,
+        events: list[ProviderOutboxEventModel],
+        now: datetime,
+    ) -> dict[str, datetime]:
+        """Map batch aggregates whose payment is still pending or failed to its next attempt.
+
+        Bookings for these aggregates are not eligible until the payment is
+        `PROCESSED`. Payments already archived or never emitted do not block.
+        """
+        booking_aggregates = {
+            event.aggregate_id for event in events if event.event_type == BOOKING_EVENT_TYPE
+        }
+        if not booking_aggregates:
+            return {}
+        result = await session.exec(
+            select(
+                ProviderOutboxEventModel.aggregate_id,
+                ProviderOutboxEventModel.next_attempt_at,
+            ).where(
+                ProviderOutboxEventModel.event_type == PAYMENT_EVENT_TYPE,
+                ProviderOutboxEventModel.status.in_(["PENDING", "FAILED"]),
+                ProviderOutboxEventModel.aggregate_id.in_(booking_aggregates),
             )
-            result = await session.exec(query)
-            event_ids = list(result.all())
+        )
+        return {
+            aggregate_id: OutboxEventProcessor._parse_datetime(next_attempt_at, fallback=now)
+            for aggregate_id, next_attempt_at in result.all()
+        }
 
-        processed = 0
-        for event_id in event_ids:
-            if await self._process_event_by_id(event_id):
-                processed += 1
-        return processed
+    async def _flush_outcomes(
+        self,
+        outcomes: list[_DispatchOutcome],
+        claim_token: str,
+    ) -> list[_DispatchOutcome]:
+        """Acknowledge a whole batch with set-based writes in one transaction.
 
-    async def _process_event_by_id(self, event_id: int) -> bool:
+        Only events still leased to `claim_token` are acknowledged; the rest
+        were claimed again by another processor after the lease expired and are
+        skipped. Gateway responses are recorded and drive the reservation status
+        in the same transaction, so an acknowledged event always has its effect
+        stored. The idempotency key of every dispatched request is stored
+        alongside. Returns the acknowledged outcomes.
+        """
+        now = self._clock()
         async with self._session_factory() as session:
             async with session.begin():
                 result = await session.exec(
-                    select(ProviderOutboxEventModel).where(ProviderOutboxEventModel.id == event_id)
-                )
-                event = result.one_or_none()
-                if event is None or event.status == "PROCESSED":
-                    return False
-                try:
-                    await self._dispatch_event(event)
-                    event.status = "PROCESSED"
-                    payload = dict(event.payload or {})
-                    payload.pop("last_error", None)
-                    event.payload = payload
-                    return True
-                except Exception as exc:
-                    event.status = "FAILED"
-                    payload = dict(event.payload or {})
-                    payload["last_error"] = str(exc)
-                    event.payload = payload
-                    return False
-
-    async def _dispatch_event(self, event: ProviderOutboxEventModel) -> None:
-        reservation = self._reservation_from_payload(
-            reservation_code=event.aggregate_id,
+                    CLAIMED_OUTBOX_EVENT_IDS,
+                    params={
+                        "event_ids": [outcome.event.id for outcome in outcomes],
+                        "claim_token": claim_token,
+                    },
+                )
+                owned_ids = set(result.all())
+                skipped_ids = [
+                    outcome.event.id for outcome in outcomes if outcome.event.id not in owned_ids
+                ]
+                if skipped_ids:
+                    logger.warning("outbox_ack_skipped", extra={"event_ids": skipped_ids})
+                outcomes = [outcome for outcome in outcomes if outcome.event.id in owned_ids]
+                if not outcomes:
+                    return []
+
+                processed_ids, retries, deferrals, dead_letters = self._classify_outcomes(
+                    outcomes, claim_token, now
+                )
+                dead_letters.extend(
+                    await self._load_orphaned_bookings(session, dead_letters, claim_token, now)
+                )
+                dead_letter_ids = {item.event_id for item in dead_letters}
+                deferrals = [item for item in deferrals if item["event_id"] not in dead_letter_ids]
+
+                connection = await session.connection()
+                if processed_ids:
+                    await connection.execute(
+                        ACK_PROCESSED_OUTBOX_EVENTS,
+                        {"event_ids": processed_ids, "claim_token": claim_token},
+                    )
+                if retries:
+                    await connection.execute(ACK_FAILED_OUTBOX_EVENT, retries)
+                if deferrals:
+                    await connection.execute(ACK_DEFERRED_OUTBOX_EVENT, deferrals)
+                if dead_letters:
+                    session.add_all(dead_letters)
+                    await session.exec(
+                        delete(ProviderOutboxEventModel).where(
+                            ProviderOutboxEventModel.id.in_(dead_letter_ids)
+                        )
+                    )
+                await self._record_idempotency_keys(session, outcomes, now)
+                await self._apply_results(session, outcomes, now)
+        if self._metrics is not None:
+            for item in dead_letters:
+                self._metrics.record_outcome(item.event_type, "dead_lettered")
+        return outcomes
+
+    def _classify_outcomes(
+        self,
+        outcomes: list[_DispatchOutcome],
+        claim_token: str,
+        now: datetime,
+    ) -> tuple[
+        list[int],
+        list[dict[str, Any]],
+        list[dict[str, Any]],
+        list[ProviderOutboxDeadLetterModel],
+    ]:
+        """Split outcomes into processed ids, retry and deferral params, and dead letters.
+
+        A deferred booking is rescheduled for its payment's next attempt, so it
+        is not reloaded and rewritten while the payment is still backing off.
+        """
+        processed_ids: list[int] = []
+        retries: list[dict[str, Any]] = []
+        deferred: list[_DispatchOutcome] = []
+        dead_letters: list[ProviderOutboxDeadLetterModel] = []
+        payment_retry_at: dict[str, datetime] = {}
+        for outcome in outcomes:
+            event = outcome.event
+            if outcome.deferred:
+                deferred.append(outcome)
+                continue
+            if outcome.error is None:
+                processed_ids.append(event.id)
+                continue
+            attempts = event.attempts + 1
+            error = outcome.error[:MAX_LAST_ERROR_LENGTH]
+            if attempts >= self._max_attempts:
+                dead_letters.append(self._to_dead_letter(event, attempts, error, now))
+                continue
+            retry_at = now + timedelta(seconds=self.retry_delay_seconds(attempts))
+            if event.event_type == PAYMENT_EVENT_TYPE:
+                payment_retry_at[event.aggregate_id] = retry_at
+            retries.append(
+                {
+                    "event_id": event.id,
+                    "claim_token": claim_token,
+                    "retry_attempts": attempts,
+                    "retry_at": retry_at,
+                    "error": error,
+                }
+            )
+
+        deferrals: list[dict[str, Any]] = []
+        for outcome in deferred:
+            retry_at = payment_retry_at.get(outcome.event.aggregate_id)
+            if retry_at is None:
+                # Payment not retried in this batch: wait for its scheduled attempt, or the
+                # base delay when it is already due (e.g. claimed by another processor).
+                retry_at = max(
+                    outcome.payment_next_attempt_at or now,
+                    now + timedelta(seconds=self._retry_base_delay_seconds),
+                )
+            deferrals.append(
+                {"event_id": outcome.event.id, "claim_token": claim_token, "retry_at": retry_at}
+            )
+        return processed_ids, retries, deferrals, dead_letters
+
+    @staticmethod
+    async def _record_idempotency_keys(
+        session: AsyncSession,
+        outcomes: list[_DispatchOutcome],
+        now: datetime,
+    ) -> None:
+        """Upsert the key, request hash and last response of each sent request."""
+        entries: dict[str, tuple[str, _DispatchOutcome]] = {}
+        for outcome in outcomes:
+            event = outcome.event
+            if outcome.deferred or event.request_body is None:
+                continue
+            key = outbox_idempotency_key(event.event_type, event.aggregate_id, event.id)
+            entries[key] = (request_hash(event.request_body), outcome)
+        if not entries:
+            return
+
+        result = await session.exec(
+            select(ProviderIdempotencyKeyModel).where(
+                ProviderIdempotencyKeyModel.idem_key.in_(list(entries))
+            )
+        )
+        existing = {row.idem_key: row for row in result.all()}
+        for key, (body_hash, outcome) in entries.items():
+            status = outcome.result.status if outcome.result is not None else "ERROR"
+            response_body = (
+                dict(outcome.result.payload or {}) if outcome.result is not None else None
+            )
+            row = existing.get(key)
+            if row is None:
+                session.add(
+                    ProviderIdempotencyKeyModel(
+                        idem_key=key,
+                        request_hash=body_hash,
+                        response_body=response_body,
+                        status=status,
+                        created_at=now,
+                    )
+                )
+                continue
+            if row.request_hash != body_hash:
+                logger.warning(
+                    "outbox_idempotency_key_reused",
+                    extra={"event_id": outcome.event.id, "idempotency_key": key},
+                )
+            row.request_hash = body_hash
+            row.response_body = response_body
+            row.status = status
+            row.updated_at = now
+            session.add(row)
+
+    async def _apply_results(
+        self,
+        session: AsyncSession,
+        outcomes: list[_DispatchOutcome],
+        responded_at: datetime,
+    ) -> None:
+        """Store gateway responses and move reservation status within `session`.
+
+        Each outcome runs in its own savepoint; a failed update is rolled back
+        and logged without failing the batch acknowledgement.
+        """
+        status_use_case = UpdateReservationStatusUseCase(
+            status_store=MySQLReservationStatusStore(self._session_factory, session=session),
+            audit_logger=self._audit_logger,
+        )
+        for outcome in outcomes:
+            if outcome.result is None:
+                continue
+            event = outcome.event
+            reservation_payload = dict((event.payload or {}).get("reservation") or {})
+            provider_code = (
+                PAYMENT_PROVIDER_CODE
+                if event.event_type == PAYMENT_EVENT_TYPE
+                else str(reservation_payload.get("supplier_code") or "UNKNOWN")
+            )
+            try:
+                async with session.begin_nested():
+                    await status_use_case.execute(
+                        UpdateReservationStatusRequest(
+                            reservation_code=ReservationCode(event.aggregate_id),
+                            request_type=REQUEST_TYPES[event.event_type],
+                            provider_code=provider_code,
+                            success=outcome.result.success,
+                            request_payload=reservation_payload,
+                            response_payload=dict(outcome.result.payload or {}),
+                            responded_at=responded_at,
+                        )
+                    )
+            except ReservationStatusUpdateNotFoundError:
+                logger.warning(
+                    "outbox_reservation_not_found",
+                    extra={"event_id": event.id, "reservation_code": event.aggregate_id},
+                )
+            except Exception:
+                # The request was already sent: keep acknowledging the event (and the rest of
+                # the batch) rather than re-dispatching it forever over a status update.
+                logger.exception(
+                    "outbox_reservation_status_update_failed",
+                    extra={"event_id": event.id, "reservation_code": event.aggregate_id},
+                )
+
+    async def _load_orphaned_bookings(
+        self,
+        session: AsyncSession,
+        dead_letters: list[ProviderOutboxDeadLetterModel],
+        claim_token: str,
+        now: datetime,
+    ) -> list[ProviderOutboxDeadLetterModel]:
+        """Dead-letter bookings whose payment event is being dead-lettered.
+
+        Without this they would either wait forever or be booked without payment.
+        Bookings currently leased to another processor are left to it.
+        """
+        dead_payment_aggregates = {
+            item.aggregate_id for item in dead_letters if item.event_type == PAYMENT_EVENT_TYPE
+        }
+        if not dead_payment_aggregates:
+            return []
+        result = await session.exec(
+            select(ProviderOutboxEventModel)
+            .where(
+                ProviderOutboxEventModel.event_type == BOOKING_EVENT_TYPE,
+                ProviderOutboxEventModel.status.in_(["PENDING", "FAILED"]),
+                ProviderOutboxEventModel.aggregate_id.in_(dead_payment_aggregates),
+                ProviderOutboxEventModel.id.not_in([item.event_id for item in dead_letters]),
+                or_(
+                    ProviderOutboxEventModel.locked_by == claim_token,
+                    ProviderOutboxEventModel.locked_until.is_(None),
+                    ProviderOutboxEventModel.locked_until <= now,
+                ),
+            )
+            .with_for_update(skip_locked=True)
+        )
+        return [
+            self._to_dead_letter(event, event.attempts, "Payment event was dead-lettered", now)
+            for event in result.all()
+        ]
+
+    def retry_delay_seconds(self, attempts: int) -> float:
+        """Return the jittered backoff delay before retry number `attempts`."""
+        ceiling = min(
+            self._retry_base_delay_seconds * (2 ** max(attempts - 1, 0)),
+            self._retry_max_delay_seconds,
+        )
+        return ceiling / 2 + (ceiling / 2) * self._random_func()
+
+    @staticmethod
+    def _to_dead_letter(
+        event: ProviderOutboxEventModel,
+        attempts: int,
+        error: str,
+        dead_lettered_at: datetime,
+    ) -> ProviderOutboxDeadLetterModel:
+        return ProviderOutboxDeadLetterModel(
+            event_id=event.id,
+            aggregate_id=event.aggregate_id,
+            event_type=event.event_type,
             payload=dict(event.payload or {}),
+            request_body=event.request_body,
+            attempts=attempts,
+            last_error=error,
+            created_at=event.created_at,
+            dead_lettered_at=dead_lettered_at,
         )
-        if event.event_type == "PAYMENT_REQUESTED":
-            payment_result = await self._payment_gateway.process_payment(reservation)
-            if not payment_result.success:
-                raise RuntimeError(
-                    f"Payment dispatch failed with status={payment_result.status}"
+
+    async def _dispatch_event(
+        self,
+        event: ProviderOutboxEventModel,
+    ) -> PaymentResult | ProviderResult:
+        """Send the stored request body; rebuild it only for events that lack one.
+
+        Each dispatch gets its own deadline, so retries inside the gateway
+        cannot stretch one event past `dispatch_deadline_seconds`. Every
+        attempt of the event carries the same idempotency key.
+        """
+        if event.request_body is not None:
+            idempotency_key = outbox_idempotency_key(event.event_type, event.aggregate_id, event.id)
+            deadline = (
+                Deadline(self._dispatch_deadline_seconds)
+                if self._dispatch_deadline_seconds is not None
+                else None
+            )
+            if event.event_type == PAYMENT_EVENT_TYPE:
+                return await self._payment_gateway.process_payment_request(
+                    event.request_body,
+                    idempotency_key=idempotency_key,
+                    deadline=deadline,
                 )
-            return
-        if event.event_type == "BOOKING_REQUESTED":
-            provider_result = await self._provider_gateway.create_booking(reservation)
-            if not provider_result.success:
-                raise RuntimeError(
-                    f"Provider dispatch failed with status={provider_result.status}"
+            if event.event_type == BOOKING_EVENT_TYPE:
+                reservation_payload = dict((event.payload or {}).get("reservation") or {})
+                return await self._provider_gateway.create_booking_request(
+                    event.request_body,
+                    supplier_code=reservation_payload.get("supplier_code"),
+                    idempotency_key=idempotency_key,
+                    deadline=deadline,
                 )
-            return
+            raise ValueError(f"Unsupported outbox event type: {event.event_type}")
+
+        reservation = self._reservation_from_payload(
+            reservation_code=event.aggregate_id,
+            payload=dict(event.payload or {}),
+        )
+        if event.event_type == PAYMENT_EVENT_TYPE:
+            return await self._payment_gateway.process_payment(reservation)
+        if event.event_type == BOOKING_EVENT_TYPE:
+            return await self._provider_gateway.create_booking(reservation)
         raise ValueError(f"Unsupported outbox event type: {event.event_type}")
 
     @staticmethod
@@ -1,4 +1,5 @@
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import asynccontextmanager
 
 from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -9,22 +10,41 @@ from reservas_api.infrastructure.db.models import (
     ProviderOutboxEventModel,
     ReservationAddonModel,
 )
+from reservas_api.infrastructure.db.session_router import SessionRouter
+from reservas_api.infrastructure.gateways import ProviderAPIGateway, StripePaymentGateway
 from reservas_api.infrastructure.repositories import MySQLReservationRepository
 
 
 class OutboxEventPublisher:
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+    """Persist outbox events, alone or atomically with their reservation.
+
+    A publisher bound to `session` only flushes into that caller-managed
+    transaction; committing and waking the worker is then up to the caller.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        on_committed: Callable[[], None] | None = None,
+        session_router: SessionRouter | None = None,
+        session: AsyncSession | None = None,
+    ) -> None:
         self._session_factory = session_factory
-        self._reservation_repository = MySQLReservationRepository(session_factory)
+        self._reservation_repository = MySQLReservationRepository(
+            session_factory,
+            session_router,
+            session=session,
+        )
+        self._on_committed = on_committed
+        self._session = session
 
     async def publish(self, event: DomainEvent) -> None:
         await self.publish_many([event])
 
     async def publish_many(self, events: Iterable[DomainEvent]) -> None:
-        async with self._session_factory() as session:
-            async with session.begin():
-                for event in events:
-                    session.add(self._to_model(event))
+        async with self._transaction() as session:
+            for event in events:
+                session.add(self._to_model(event))
 
     async def save_reservation_with_outbox(
         self,
@@ -32,30 +52,44 @@ class OutboxEventPublisher:
         events: Iterable[DomainEvent] | None = None,
     ) -> Reservation:
         outbox_events = list(events) if events is not None else self.build_reservation_events(reservation)
-        async with self._session_factory() as session:
-            async with session.begin():
-                saved_reservation = await self._reservation_repository.save(
-                    reservation,
-                    session=session,
-                )
-                for addon in reservation.addons:
-                    session.add(
-                        ReservationAddonModel(
-                            reservation_code=saved_reservation.reservation_code.value,
-                            addon_code=addon.addon_code,
-                            addon_name_snapshot=addon.addon_name_snapshot,
-                            addon_category_snapshot=addon.addon_category_snapshot,
-                            quantity=addon.quantity,
-                            unit_price=addon.unit_price,
-                            total_price=addon.total_price,
-                            currency_code=addon.currency_code,
-                        )
+        async with self._transaction() as session:
+            saved_reservation = await self._reservation_repository.save(
+                reservation,
+                session=session,
+            )
+            for addon in reservation.addons:
+                session.add(
+                    ReservationAddonModel(
+                        reservation_code=saved_reservation.reservation_code.value,
+                        addon_code=addon.addon_code,
+                        addon_name_snapshot=addon.addon_name_snapshot,
+                        addon_category_snapshot=addon.addon_category_snapshot,
+                        quantity=addon.quantity,
+                        unit_price=addon.unit_price,
+                        total_price=addon.total_price,
+                        currency_code=addon.currency_code,
                     )
-                for event in outbox_events:
-                    session.add(self._to_model(event))
+                )
+            for event in outbox_events:
+                session.add(self._to_model(event))
         saved_reservation.addons = list(reservation.addons)
         return saved_reservation
 
+    @asynccontextmanager
+    async def _transaction(self) -> AsyncIterator[AsyncSession]:
+        if self._session is not None:
+            yield self._session
+            await self._session.flush()
+            return
+        async with self._session_factory() as session:
+            async with session.begin():
+                yield session
+        self._notify_committed()
+
+    def _notify_committed(self) -> None:
+        if self._on_committed is not None:
+            self._on_committed()
+
     @staticmethod
     def build_reservation_events(reservation: Reservation) -> list[DomainEvent]:
         addons_payload = [
@@ -89,11 +123,13 @@ class OutboxEventPublisher:
                 event_type="PAYMENT_REQUESTED",
                 aggregate_id=reservation.reservation_code.value,
                 payload=payload,
+                request_body=StripePaymentGateway.build_request_body(reservation),
             ),
             DomainEvent(
                 event_type="BOOKING_REQUESTED",
                 aggregate_id=reservation.reservation_code.value,
                 payload=payload,
+                request_body=ProviderAPIGateway.build_request_body(reservation),
             ),
         ]
 
@@ -104,5 +140,6 @@ class OutboxEventPublisher:
             aggregate_id=event.aggregate_id,
             event_type=event.event_type,
             payload=payload,
+            request_body=event.request_body,
             status="PENDING",
         )
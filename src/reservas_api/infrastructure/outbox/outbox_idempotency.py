@@ -0,0 +1,18 @@
+import hashlib
+from uuid import UUID, uuid5
+
+OUTBOX_IDEMPOTENCY_NAMESPACE = UUID("6f1c2a4e-9b7d-5e3f-8a21-4c0d9e6b7f15")
+
+
+def outbox_idempotency_key(event_type: str, aggregate_id: str, event_id: int | None) -> str:
+    """Return the idempotency key sent upstream for an outbox event.
+
+    The key only depends on the event itself, so every retry, hedge and
+    dead-letter requeue of the same event sends the same key.
+    """
+    return str(uuid5(OUTBOX_IDEMPOTENCY_NAMESPACE, f"{event_type}:{aggregate_id}:{event_id}"))
+
+
+def request_hash(body: bytes) -> str:
+    """Return the SHA-256 hex digest stored next to an idempotency key."""
+    return hashlib.sha256(body).hexdigest()
@@ -0,0 +1,97 @@
+from collections.abc import Callable
+from datetime import UTC, datetime
+from time import monotonic
+from typing import Any
+
+from reservas_api.shared.metrics import LatencyHistogram, RateCounter
+
+
+class OutboxMetrics:
+    """In-memory outbox pipeline metrics: backlog, lag, drain rate and latency.
+
+    Every structure has a fixed size per event type and outcome, so recording
+    is O(1) and memory does not grow with traffic.
+    """
+
+    def __init__(
+        self,
+        rate_window_seconds: int = 60,
+        time_provider: Callable[[], float] | None = None,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        self._rate_window_seconds = rate_window_seconds
+        self._time_provider = time_provider or monotonic
+        self._clock = clock or (lambda: datetime.now(UTC))
+        self._dispatch_latency: dict[str, LatencyHistogram] = {}
+        self._outcome_rates: dict[tuple[str, str], RateCounter] = {}
+        self._pending_count = 0
+        self._failed_count = 0
+        self._oldest_pending_created_at: datetime | None = None
+        self._backlog_updated_at: datetime | None = None
+        self._last_batch_at: datetime | None = None
+
+    def record_dispatch(self, event_type: str, duration_seconds: float) -> None:
+        histogram = self._dispatch_latency.get(event_type)
+        if histogram is None:
+            histogram = self._dispatch_latency[event_type] = LatencyHistogram()
+        histogram.observe(duration_seconds)
+
+    def record_outcome(self, event_type: str, outcome: str, amount: int = 1) -> None:
+        key = (event_type, outcome)
+        counter = self._outcome_rates.get(key)
+        if counter is None:
+            counter = self._outcome_rates[key] = RateCounter(
+                window_seconds=self._rate_window_seconds,
+                time_provider=self._time_provider,
+            )
+        counter.add(amount)
+
+    def record_batch(self) -> None:
+        self._last_batch_at = self._clock()
+
+    def record_backlog(
+        self,
+        pending_count: int,
+        failed_count: int,
+        oldest_pending_created_at: datetime | None,
+    ) -> None:
+        self._pending_count = pending_count
+        self._failed_count = failed_count
+        self._oldest_pending_created_at = oldest_pending_created_at
+        self._backlog_updated_at = self._clock()
+
+    def snapshot(self) -> dict[str, Any]:
+        now = self._clock()
+        oldest_age = None
+        if self._oldest_pending_created_at is not None:
+            oldest_created_at = self._oldest_pending_created_at
+            if oldest_created_at.tzinfo is None:
+                oldest_created_at = oldest_created_at.replace(tzinfo=UTC)
+            oldest_age = max((now - oldest_created_at).total_seconds(), 0.0)
+        return {
+            "backlog": {
+                "pending": self._pending_count,
+                "failed": self._failed_count,
+                "oldest_pending_age_seconds": oldest_age,
+                "updated_at": _isoformat(self._backlog_updated_at),
+            },
+            "last_batch_at": _isoformat(self._last_batch_at),
+            "throughput": [
+                {
+                    "event_type": event_type,
+                    "outcome": outcome,
+                    "total": counter.total,
+                    "per_second": round(counter.per_second(), 3),
+                    "window_seconds": self._rate_window_seconds,
+                }
+                for (event_type, outcome), counter in sorted(self._outcome_rates.items())
+            ],
+            "dispatch_latency": {
+                event_type: histogram.snapshot()
+                for event_type, histogram in sorted(self._dispatch_latency.items())
+            },
+        }
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
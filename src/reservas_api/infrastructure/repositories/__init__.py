@@ -1,6 +1,10 @@
 from reservas_api.infrastructure.repositories.mysql_addon_catalog_repository import (
     MySQLAddonCatalogRepository,
 )
+from reservas_api.infrastructure.repositories.mysql_provider_entity_repository import (
+    MySQLProviderEntityRepository,
+    ProviderEntity,
+)
 from reservas_api.infrastructure.repositories.mysql_reservation_repository import (
     MySQLReservationRepository,
     ReservationNotFoundError,
@@ -11,7 +15,9 @@ from reservas_api.infrastructure.repositories.mysql_reservation_status_store imp
 
 __all__ = [
     "MySQLAddonCatalogRepository",
+    "MySQLProviderEntityRepository",
     "MySQLReservationRepository",
     "MySQLReservationStatusStore",
+    "ProviderEntity",
     "ReservationNotFoundError",
 ]
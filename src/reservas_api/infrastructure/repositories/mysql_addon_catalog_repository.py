@@ -1,22 +1,31 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from reservas_api.domain.enums import AddonCategory
 from reservas_api.infrastructure.db.models import RentalAddonModel
+from reservas_api.infrastructure.db.session_router import SessionRouter
 
 
 class MySQLAddonCatalogRepository:
     """Reads active add-ons from the rental_addons catalog table."""
 
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        session_router: SessionRouter | None = None,
+    ) -> None:
         self._session_factory = session_factory
+        self._session_router = session_router
 
     async def get_active_addons_by_codes(
         self, codes: list[str]
     ) -> dict[str, dict[str, str]]:
         """Return {code: {"name": ..., "category": ...}} for active addons."""
-        async with self._session_factory() as session:
+        async with self._read_session() as session:
             result = await session.exec(
                 select(RentalAddonModel).where(
                     RentalAddonModel.code.in_(codes),
@@ -32,7 +41,7 @@ class MySQLAddonCatalogRepository:
         self, category: AddonCategory | None = None
     ) -> list[RentalAddonModel]:
         """Return all active add-ons, optionally filtered by category."""
-        async with self._session_factory() as session:
+        async with self._read_session() as session:
             query = select(RentalAddonModel).where(
                 RentalAddonModel.is_active == True,  # noqa: E712
             )
@@ -41,3 +50,11 @@ class MySQLAddonCatalogRepository:
             query = query.order_by(RentalAddonModel.sort_order)
             result = await session.exec(query)
             return list(result.all())
+
+    @asynccontextmanager
+    async def _read_session(self) -> AsyncIterator[AsyncSession]:
+        session_factory = self._session_factory
+        if self._session_router is not None:
+            session_factory = await self._session_router.reader()
+        async with session_factory() as session:
+            yield session
@@ -0,0 +1,58 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import JSON, Boolean, Integer, String, column, select, table
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from reservas_api.infrastructure.db.session_router import SessionRouter
+
+# `provider_entities` is owned by the provider catalog schema (see tablas_provider.md),
+# so it is read through a lightweight table construct instead of a migrated model.
+provider_entities_table = table(
+    "provider_entities",
+    column("entity_code", String(80)),
+    column("enabled", Boolean),
+    column("default_timeout_ms", Integer),
+    column("config", JSON),
+)
+
+
+@dataclass(slots=True, frozen=True)
+class ProviderEntity:
+    entity_code: str
+    default_timeout_ms: int
+    config: dict[str, Any] = field(default_factory=dict)
+
+
+class MySQLProviderEntityRepository:
+    """Reads enabled provider entities and their connection settings."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        session_router: SessionRouter | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._session_router = session_router
+
+    async def list_enabled(self) -> list[ProviderEntity]:
+        session_factory = self._session_factory
+        if self._session_router is not None:
+            session_factory = await self._session_router.reader()
+        async with session_factory() as session:
+            result = await session.execute(
+                select(
+                    provider_entities_table.c.entity_code,
+                    provider_entities_table.c.default_timeout_ms,
+                    provider_entities_table.c.config,
+                ).where(provider_entities_table.c.enabled.is_(True))
+            )
+            return [
+                ProviderEntity(
+                    entity_code=entity_code,
+                    default_timeout_ms=default_timeout_ms,
+                    config=dict(config or {}),
+                )
+                for entity_code, default_timeout_ms, config in result.all()
+            ]
@@ -1,15 +1,21 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from decimal import Decimal
 
-from sqlalchemy import func
 from sqlalchemy.ext.asyncio import async_sessionmaker
-from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from reservas_api.domain.entities import Reservation, ReservationAddon
 from reservas_api.domain.enums import ReservationStatus
 from reservas_api.domain.value_objects import ReservationCode
-from reservas_api.infrastructure.db.models import ReservationAddonModel, ReservationModel
+from reservas_api.infrastructure.db.models import ReservationModel
+from reservas_api.infrastructure.db.session_router import SessionRouter
+from reservas_api.infrastructure.db.statements import (
+    RESERVATION_ADDONS_BY_CODE,
+    RESERVATION_BY_CODE,
+    RESERVATION_CODE_COUNT,
+)
 
 
 class ReservationNotFoundError(ValueError):
@@ -17,14 +23,28 @@ class ReservationNotFoundError(ValueError):
 
 
 class MySQLReservationRepository:
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        session_router: SessionRouter | None = None,
+        session: AsyncSession | None = None,
+    ) -> None:
+        """Create the repository; a `session_router` serves `find_by_code` from the replica.
+
+        A repository bound to `session` runs every query in that caller-managed
+        session and never commits, e.g. inside a unit of work.
+        """
         self._session_factory = session_factory
+        self._session_router = session_router
+        self._session = session
 
     async def save(
         self,
         reservation: Reservation,
         session: AsyncSession | None = None,
     ) -> Reservation:
+        self._record_write(reservation.reservation_code)
+        session = session or self._session
         if session is not None:
             return await self._save_with_session(session, reservation)
 
@@ -33,18 +53,13 @@ class MySQLReservationRepository:
                 return await self._save_with_session(db_session, reservation)
 
     async def find_by_code(self, code: ReservationCode) -> Reservation | None:
-        async with self._session_factory() as session:
-            result = await session.exec(
-                select(ReservationModel).where(ReservationModel.reservation_code == code.value)
-            )
+        params = {"reservation_code": code.value}
+        async with self._read_session(code) as session:
+            result = await session.exec(RESERVATION_BY_CODE, params=params)
             model = result.one_or_none()
             if model is None:
                 return None
-            addon_result = await session.exec(
-                select(ReservationAddonModel).where(
-                    ReservationAddonModel.reservation_code == code.value
-                )
-            )
+            addon_result = await session.exec(RESERVATION_ADDONS_BY_CODE, params=params)
             addon_models = addon_result.all()
             reservation = self._to_domain(model)
             reservation.addons = [
@@ -62,23 +77,54 @@ class MySQLReservationRepository:
             return reservation
 
     async def exists_code(self, code: ReservationCode) -> bool:
-        async with self._session_factory() as session:
-            query = select(func.count(ReservationModel.id)).where(
-                ReservationModel.reservation_code == code.value
+        # Uniqueness checks stay on the primary: a lagging replica would miss new codes.
+        async with self._read_session() as session:
+            result = await session.exec(
+                RESERVATION_CODE_COUNT,
+                params={"reservation_code": code.value},
             )
-            result = await session.exec(query)
             return int(result.one()) > 0
 
     async def update_status(self, code: ReservationCode, status: ReservationStatus) -> None:
+        self._record_write(code)
+        async with self._write_session() as session:
+            result = await session.exec(
+                RESERVATION_BY_CODE,
+                params={"reservation_code": code.value},
+            )
+            model = result.one_or_none()
+            if model is None:
+                raise ReservationNotFoundError(f"Reservation not found for code={code.value}")
+            model.status = status
+
+    @asynccontextmanager
+    async def _read_session(
+        self,
+        routed_code: ReservationCode | None = None,
+    ) -> AsyncIterator[AsyncSession]:
+        """Yield the bound session, or one routed by `routed_code` when given."""
+        if self._session is not None:
+            yield self._session
+            return
+        session_factory = self._session_factory
+        if routed_code is not None and self._session_router is not None:
+            session_factory = await self._session_router.reader(routed_code.value)
+        async with session_factory() as session:
+            yield session
+
+    @asynccontextmanager
+    async def _write_session(self) -> AsyncIterator[AsyncSession]:
+        if self._session is not None:
+            yield self._session
+            await self._session.flush()
+            return
         async with self._session_factory() as session:
             async with session.begin():
-                result = await session.exec(
-                    select(ReservationModel).where(ReservationModel.reservation_code == code.value)
-                )
-                model = result.one_or_none()
-                if model is None:
-                    raise ReservationNotFoundError(f"Reservation not found for code={code.value}")
-                model.status = status
+                yield session
+
+    def _record_write(self, code: ReservationCode) -> None:
+        if self._session_router is not None:
+            self._session_router.record_write(code.value)
 
     async def _save_with_session(
         self,
@@ -92,9 +138,8 @@ class MySQLReservationRepository:
             return self._to_domain(model)
 
         existing = await session.exec(
-            select(ReservationModel).where(
-                ReservationModel.reservation_code == reservation.reservation_code.value
-            )
+            RESERVATION_BY_CODE,
+            params={"reservation_code": reservation.reservation_code.value},
         )
         model = existing.one_or_none()
         if model is None:
@@ -1,9 +1,9 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import func
 from sqlalchemy.ext.asyncio import async_sessionmaker
-from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from reservas_api.application.use_cases.update_reservation_status_use_case import (
@@ -13,16 +13,37 @@ from reservas_api.application.use_cases.update_reservation_status_use_case impor
 from reservas_api.domain.enums import ReservationStatus
 from reservas_api.domain.value_objects import ReservationCode
 from reservas_api.infrastructure.db.models import ReservationModel, ReservationProviderRequestModel
+from reservas_api.infrastructure.db.session_router import SessionRouter
+from reservas_api.infrastructure.db.statements import (
+    RESERVATION_BY_CODE,
+    SUCCESSFUL_PROVIDER_REQUEST_COUNT,
+)
 from reservas_api.infrastructure.history import HistoryTracker
 
 
 class MySQLReservationStatusStore:
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        session: AsyncSession | None = None,
+        session_router: SessionRouter | None = None,
+    ) -> None:
+        """Create the store, optionally bound to a caller-managed `session`.
+
+        A bound store joins the caller's transaction instead of opening and
+        committing its own, so status changes commit atomically with it. Its
+        reads decide the next status transition, so they always go to the
+        primary: read-your-writes only tracks this process's writes, and a
+        lagging replica would replay or skip transitions. The `session_router`
+        is still told about writes, so display reads routed through it see them.
+        """
         self._session_factory = session_factory
-        self._history_tracker = HistoryTracker(session_factory)
+        self._session = session
+        self._session_router = session_router
+        self._history_tracker = HistoryTracker(session_factory, session_router)
 
     async def get_status(self, reservation_code: ReservationCode) -> ReservationStatus:
-        async with self._session_factory() as session:
+        async with self._read_session() as session:
             reservation = await self._get_reservation(session, reservation_code)
             return reservation.status
 
@@ -31,13 +52,11 @@ class MySQLReservationStatusStore:
         reservation_code: ReservationCode,
         request_type: ExternalRequestType,
     ) -> bool:
-        async with self._session_factory() as session:
-            query = select(func.count(ReservationProviderRequestModel.id)).where(
-                ReservationProviderRequestModel.reservation_code == reservation_code.value,
-                ReservationProviderRequestModel.request_type == request_type,
-                ReservationProviderRequestModel.status == "SUCCESS",
+        async with self._read_session() as session:
+            result = await session.exec(
+                SUCCESSFUL_PROVIDER_REQUEST_COUNT,
+                params={"reservation_code": reservation_code.value, "request_type": request_type},
             )
-            result = await session.exec(query)
             return int(result.one()) > 0
 
     async def save_external_response(
@@ -50,20 +69,19 @@ class MySQLReservationStatusStore:
         response_payload: dict[str, Any] | None,
         responded_at: datetime,
     ) -> None:
-        async with self._session_factory() as session:
-            async with session.begin():
-                await self._get_reservation(session, reservation_code)
-                session.add(
-                    ReservationProviderRequestModel(
-                        reservation_code=reservation_code.value,
-                        provider_code=provider_code,
-                        request_type=request_type,
-                        request_payload=dict(request_payload or {}),
-                        response_payload=dict(response_payload or {}),
-                        status="SUCCESS" if success else "FAILED",
-                        responded_at=responded_at,
-                    )
+        async with self._write_session(reservation_code) as session:
+            await self._get_reservation(session, reservation_code)
+            session.add(
+                ReservationProviderRequestModel(
+                    reservation_code=reservation_code.value,
+                    provider_code=provider_code,
+                    request_type=request_type,
+                    request_payload=dict(request_payload or {}),
+                    response_payload=dict(response_payload or {}),
+                    status="SUCCESS" if success else "FAILED",
+                    responded_at=responded_at,
                 )
+            )
 
     async def set_status(
         self,
@@ -72,17 +90,39 @@ class MySQLReservationStatusStore:
         status: ReservationStatus,
         changed_at: datetime,
     ) -> None:
+        async with self._write_session(reservation_code) as session:
+            reservation = await self._get_reservation(session, reservation_code)
+            reservation.status = status
+            await self._history_tracker.track_status_change(
+                session=session,
+                reservation_code=reservation_code.value,
+                from_status=from_status,
+                to_status=status,
+                changed_at=changed_at,
+            )
+
+    @asynccontextmanager
+    async def _read_session(self) -> AsyncIterator[AsyncSession]:
+        if self._session is not None:
+            yield self._session
+            return
+        async with self._session_factory() as session:
+            yield session
+
+    @asynccontextmanager
+    async def _write_session(
+        self,
+        reservation_code: ReservationCode,
+    ) -> AsyncIterator[AsyncSession]:
+        if self._session_router is not None:
+            self._session_router.record_write(reservation_code.value)
+        if self._session is not None:
+            yield self._session
+            await self._session.flush()
+            return
         async with self._session_factory() as session:
             async with session.begin():
-                reservation = await self._get_reservation(session, reservation_code)
-                reservation.status = status
-                await self._history_tracker.track_status_change(
-                    session=session,
-                    reservation_code=reservation_code.value,
-                    from_status=from_status,
-                    to_status=status,
-                    changed_at=changed_at,
-                )
+                yield session
 
     async def _get_reservation(
         self,
@@ -90,7 +130,8 @@ class MySQLReservationStatusStore:
         reservation_code: ReservationCode,
     ) -> ReservationModel:
         result = await session.exec(
-            select(ReservationModel).where(ReservationModel.reservation_code == reservation_code.value)
+            RESERVATION_BY_CODE,
+            params={"reservation_code": reservation_code.value},
         )
         reservation = result.one_or_none()
         if reservation is None:
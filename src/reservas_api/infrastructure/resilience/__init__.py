@@ -1,13 +1,31 @@
+from reservas_api.infrastructure.resilience.adaptive_concurrency_limiter import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyLimitExceededError,
+)
 from reservas_api.infrastructure.resilience.circuit_breaker import (
     CircuitBreaker,
     CircuitBreakerOpenError,
     CircuitState,
 )
+from reservas_api.infrastructure.resilience.circuit_breaker_registry import CircuitBreakerRegistry
+from reservas_api.infrastructure.resilience.hedging_policy import HedgingPolicy
+from reservas_api.infrastructure.resilience.retry_budget import RetryBudget
+from reservas_api.infrastructure.resilience.retry_budget_registry import RetryBudgetRegistry
 from reservas_api.infrastructure.resilience.retry_policy import RetryPolicy
+from reservas_api.infrastructure.resilience.sliding_window_circuit_breaker import (
+    SlidingWindowCircuitBreaker,
+)
 
 __all__ = [
+    "AdaptiveConcurrencyLimiter",
     "CircuitBreaker",
     "CircuitBreakerOpenError",
+    "CircuitBreakerRegistry",
     "CircuitState",
+    "ConcurrencyLimitExceededError",
+    "HedgingPolicy",
+    "RetryBudget",
+    "RetryBudgetRegistry",
     "RetryPolicy",
+    "SlidingWindowCircuitBreaker",
 ]
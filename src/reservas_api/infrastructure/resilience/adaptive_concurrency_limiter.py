@@ -0,0 +1,167 @@
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from typing import TypeVar
+
+from reservas_api.infrastructure.resilience.circuit_breaker import CircuitBreakerOpenError
+
+T = TypeVar("T")
+
+
+class ConcurrencyLimitExceededError(RuntimeError):
+    pass
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limit on in-flight calls to one upstream.
+
+    The limit grows by roughly one per `limit` successful calls and shrinks by
+    `backoff_ratio` on an overload error or when latency exceeds
+    `latency_tolerance` times the long-term average. `overload` decides which
+    errors signal an overloaded upstream; by default every error except a
+    circuit-open rejection does. Other errors leave the limit untouched. Calls
+    above the limit wait in a bounded queue; once the queue is full, or a call
+    waits longer than `queue_timeout_seconds`, it is shed with
+    `ConcurrencyLimitExceededError`.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        backoff_ratio: float = 0.9,
+        latency_tolerance: float = 2.0,
+        max_queue_size: int = 100,
+        queue_timeout_seconds: float | None = None,
+        time_provider: Callable[[], float] | None = None,
+        overload: Callable[[Exception], bool] | None = None,
+    ) -> None:
+        if min_limit <= 0:
+            raise ValueError("min_limit must be greater than zero")
+        if not min_limit <= initial_limit <= max_limit:
+            raise ValueError("initial_limit must be between min_limit and max_limit")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+        if latency_tolerance <= 1:
+            raise ValueError("latency_tolerance must be greater than one")
+        if max_queue_size < 0:
+            raise ValueError("max_queue_size must be greater than or equal to zero")
+
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._backoff_ratio = backoff_ratio
+        self._latency_tolerance = latency_tolerance
+        self._max_queue_size = max_queue_size
+        self._queue_timeout_seconds = queue_timeout_seconds
+        self._time_provider = time_provider or monotonic
+        self._overload = overload or _is_not_circuit_open
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._average_latency: float | None = None
+        self._shed_count = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def shed_count(self) -> int:
+        return self._shed_count
+
+    def try_acquire(self) -> bool:
+        """Take a slot only if one is free right now; the caller must `release()` it."""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return True
+        return False
+
+    def release(self) -> None:
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    async def call(self, func: Callable[[], Awaitable[T]]) -> T:
+        await self._acquire()
+        started_at = self._time_provider()
+        in_flight_at_start = self._in_flight
+        try:
+            result = await func()
+        except Exception as exc:
+            if self._overload(exc):
+                self._on_drop()
+            raise
+        else:
+            self._on_sample(self._time_provider() - started_at, in_flight_at_start)
+            return result
+        finally:
+            self.release()
+
+    async def _acquire(self) -> None:
+        if self.try_acquire():
+            return
+        if len(self._waiters) >= self._max_queue_size:
+            self._shed_count += 1
+            raise ConcurrencyLimitExceededError("Concurrency limit queue is full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout=self._queue_timeout_seconds)
+        except TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over as the wait timed out; pass it on.
+                self._in_flight -= 1
+                self._wake_waiters()
+            self._shed_count += 1
+            raise ConcurrencyLimitExceededError(
+                "Timed out waiting for a concurrency slot"
+            ) from None
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before cancellation; pass it on.
+                self._in_flight -= 1
+                self._wake_waiters()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def _on_sample(self, latency_seconds: float, in_flight: int) -> None:
+        average = self._average_latency
+        # The average also absorbs slow samples, so a lasting slowdown becomes the new baseline.
+        self._average_latency = (
+            latency_seconds if average is None else average + (latency_seconds - average) * 0.01
+        )
+        if average is not None and latency_seconds > average * self._latency_tolerance:
+            self._on_drop()
+            return
+        # Only grow while the limit is actually being used.
+        if in_flight * 2 >= self._limit:
+            self._limit = min(self._limit + 1 / self._limit, float(self._max_limit))
+            self._wake_waiters()
+
+    def _on_drop(self) -> None:
+        self._limit = max(self._limit * self._backoff_ratio, float(self._min_limit))
+
+
+def _is_not_circuit_open(exc: Exception) -> bool:
+    # A circuit-open rejection fails fast without reaching the upstream: no load signal.
+    return not isinstance(exc, CircuitBreakerOpenError)
@@ -4,6 +4,8 @@ from enum import StrEnum
 from time import monotonic
 from typing import TypeVar
 
+from reservas_api.shared.resilience import Deadline, DeadlineExceededError
+
 T = TypeVar("T")
 
 
@@ -46,7 +48,14 @@ class CircuitBreaker:
     def failure_count(self) -> int:
         return self._failure_count
 
-    async def call(self, func: Callable[[], Awaitable[T]]) -> T:
+    async def call(
+        self,
+        func: Callable[[], Awaitable[T]],
+        deadline: Deadline | None = None,
+    ) -> T:
+        # An expired deadline is the caller's budget running out, not an upstream failure.
+        if deadline is not None and deadline.expired:
+            raise DeadlineExceededError("Deadline exceeded before calling upstream")
         async with self._lock:
             if self._state == CircuitState.OPEN:
                 if self._should_attempt_reset():
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+from collections.abc import Callable
+from time import monotonic
+
+from reservas_api.infrastructure.resilience.circuit_breaker import CircuitState
+from reservas_api.infrastructure.resilience.sliding_window_circuit_breaker import (
+    SlidingWindowCircuitBreaker,
+)
+
+
+class CircuitBreakerRegistry:
+    """Circuit breakers shared by every gateway instance, keyed by upstream.
+
+    Keys can be as fine as one supplier, so the registry keeps at most
+    `max_keys` breakers and drops those unused for `idle_seconds`, least
+    recently used first.
+    """
+
+    def __init__(
+        self,
+        breaker_factory: Callable[[], SlidingWindowCircuitBreaker],
+        max_keys: int = 1000,
+        idle_seconds: float = 600.0,
+        time_provider: Callable[[], float] | None = None,
+    ) -> None:
+        if max_keys <= 0:
+            raise ValueError("max_keys must be greater than zero")
+        if idle_seconds <= 0:
+            raise ValueError("idle_seconds must be greater than zero")
+
+        self._breaker_factory = breaker_factory
+        self._max_keys = max_keys
+        self._idle_seconds = idle_seconds
+        self._time_provider = time_provider or monotonic
+        self._breakers: OrderedDict[str, tuple[SlidingWindowCircuitBreaker, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._breakers)
+
+    def get(self, upstream: str) -> SlidingWindowCircuitBreaker:
+        now = self._time_provider()
+        entry = self._breakers.pop(upstream, None)
+        breaker = entry[0] if entry is not None else self._breaker_factory()
+        self._breakers[upstream] = (breaker, now)
+        self._evict(now)
+        return breaker
+
+    def states(self) -> dict[str, CircuitState]:
+        return {
+            upstream: breaker.state for upstream, (breaker, _) in sorted(self._breakers.items())
+        }
+
+    def _evict(self, now: float) -> None:
+        while len(self._breakers) > self._max_keys:
+            self._breakers.popitem(last=False)
+        while self._breakers:
+            _, (_, last_used_at) = next(iter(self._breakers.items()))
+            if now - last_used_at < self._idle_seconds:
+                break
+            self._breakers.popitem(last=False)
@@ -0,0 +1,166 @@
+import asyncio
+import contextlib
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from typing import Protocol, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_KEY = "default"
+
+
+class HedgePermits(Protocol):
+    """Non-blocking admission for hedged attempts, e.g. a concurrency limiter."""
+
+    def try_acquire(self) -> bool: ...
+
+    def release(self) -> None: ...
+
+
+class HedgingPolicy:
+    """Send a backup request when the first one outlives recent tail latency.
+
+    The hedge fires once the primary request is slower than `percentile` of
+    the latest `window_size` latencies for the same key. Whichever request
+    succeeds first wins and the other is cancelled, so callers must make the
+    operation idempotent. Hedges are paid from a budget that earns
+    `budget_ratio` tokens per request, capping extra load at roughly that ratio.
+
+    Every attempt feeds the latency window, including failures and attempts
+    cancelled after losing the race (their elapsed time is a lower bound), so
+    slow failures and timeouts still raise the hedge threshold.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        budget_ratio: float = 0.1,
+        min_delay_seconds: float = 0.05,
+        window_size: int = 200,
+        min_samples: int = 20,
+        max_budget_tokens: float = 10.0,
+        max_keys: int = 256,
+        time_provider: Callable[[], float] | None = None,
+    ) -> None:
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if not 0 <= budget_ratio <= 1:
+            raise ValueError("budget_ratio must be between 0 and 1")
+        if min_delay_seconds < 0:
+            raise ValueError("min_delay_seconds must not be negative")
+        if window_size <= 0:
+            raise ValueError("window_size must be greater than zero")
+        if min_samples <= 0:
+            raise ValueError("min_samples must be greater than zero")
+        if max_keys <= 0:
+            raise ValueError("max_keys must be greater than zero")
+
+        self._percentile = percentile
+        self._budget_ratio = budget_ratio
+        self._min_delay_seconds = min_delay_seconds
+        self._window_size = window_size
+        self._min_samples = min_samples
+        self._max_budget_tokens = max_budget_tokens
+        self._max_keys = max_keys
+        self._time_provider = time_provider or monotonic
+        self._latencies: OrderedDict[str, deque[float]] = OrderedDict()
+        self._budget_tokens = 0.0
+        self._hedges_sent = 0
+        self._hedges_won = 0
+
+    @property
+    def hedges_sent(self) -> int:
+        return self._hedges_sent
+
+    @property
+    def hedges_won(self) -> int:
+        return self._hedges_won
+
+    def hedge_delay_seconds(self, key: str = DEFAULT_KEY) -> float | None:
+        """Return when to hedge for `key`, or `None` until enough samples exist."""
+        window = self._latencies.get(key)
+        if window is None or len(window) < self._min_samples:
+            return None
+        ordered = sorted(window)
+        index = min(int(self._percentile * len(ordered)), len(ordered) - 1)
+        return max(ordered[index], self._min_delay_seconds)
+
+    def record_latency(self, latency_seconds: float, key: str = DEFAULT_KEY) -> None:
+        window = self._latencies.get(key)
+        if window is None:
+            window = self._latencies[key] = deque(maxlen=self._window_size)
+            if len(self._latencies) > self._max_keys:
+                self._latencies.popitem(last=False)
+        else:
+            self._latencies.move_to_end(key)
+        window.append(latency_seconds)
+
+    async def execute(
+        self,
+        func: Callable[[], Awaitable[T]],
+        key: str = DEFAULT_KEY,
+        permits: HedgePermits | None = None,
+    ) -> T:
+        """Run `func`, hedging it once if it is slow.
+
+        With `permits`, the hedge is only sent when a permit is available
+        without waiting, and holds it until the hedged attempt finishes.
+        """
+        self._budget_tokens = min(
+            self._budget_tokens + self._budget_ratio,
+            self._max_budget_tokens,
+        )
+        delay = self.hedge_delay_seconds(key)
+        primary = asyncio.ensure_future(self._timed(func, key))
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait({primary}, timeout=delay)
+                if (
+                    not done
+                    and self._budget_tokens >= 1
+                    and (permits is None or permits.try_acquire())
+                ):
+                    return await self._hedge(primary, func, key, permits)
+            return await primary
+        except BaseException:
+            # `asyncio.wait` does not cancel what it waits on; never leave the request detached.
+            primary.cancel()
+            raise
+
+    async def _hedge(
+        self,
+        primary: asyncio.Future[T],
+        func: Callable[[], Awaitable[T]],
+        key: str,
+        permits: HedgePermits | None,
+    ) -> T:
+        self._budget_tokens -= 1
+        self._hedges_sent += 1
+        hedge = asyncio.ensure_future(self._timed(func, key))
+        if permits is not None:
+            hedge.add_done_callback(lambda _: permits.release())
+        pending: set[asyncio.Future[T]] = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self._hedges_won += 1
+                        return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            for task in pending:
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await task
+        # Both attempts failed: surface the primary's error.
+        return primary.result()
+
+    async def _timed(self, func: Callable[[], Awaitable[T]], key: str) -> T:
+        started_at = self._time_provider()
+        try:
+            return await func()
+        finally:
+            self.record_latency(self._time_provider() - started_at, key)
@@ -0,0 +1,60 @@
+from collections.abc import Callable
+from time import monotonic
+
+
+class RetryBudget:
+    """Token bucket that caps retries relative to successful requests.
+
+    Every success deposits `ratio` tokens and every retry withdraws one, so
+    over time retries stay below roughly `ratio` times the successful
+    traffic. `min_retries_per_second` refills the bucket slowly, which keeps
+    low-traffic upstreams retrying.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        max_tokens: float = 10.0,
+        min_retries_per_second: float = 0.1,
+        time_provider: Callable[[], float] | None = None,
+    ) -> None:
+        if ratio < 0:
+            raise ValueError("ratio must be greater than or equal to zero")
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be greater than or equal to one")
+        if min_retries_per_second < 0:
+            raise ValueError("min_retries_per_second must be greater than or equal to zero")
+
+        self._ratio = ratio
+        self._max_tokens = max_tokens
+        self._min_retries_per_second = min_retries_per_second
+        self._time_provider = time_provider or monotonic
+        self._tokens = max_tokens
+        self._updated_at = self._time_provider()
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def record_success(self) -> None:
+        self._refill()
+        self._tokens = min(self._tokens + self._ratio, self._max_tokens)
+
+    def try_acquire(self) -> bool:
+        """Withdraw one retry token; return `False` when the budget is spent."""
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def _refill(self) -> None:
+        now = self._time_provider()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        if elapsed > 0:
+            self._tokens = min(
+                self._tokens + elapsed * self._min_retries_per_second,
+                self._max_tokens,
+            )
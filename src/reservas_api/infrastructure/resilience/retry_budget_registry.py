@@ -0,0 +1,53 @@
+from collections import OrderedDict
+from collections.abc import Callable
+from time import monotonic
+
+from reservas_api.infrastructure.resilience.retry_budget import RetryBudget
+
+
+class RetryBudgetRegistry:
+    """Retry budgets shared by every gateway instance, keyed by upstream.
+
+    One budget per supplier keeps an outage at one supplier from spending the
+    retries of the others. Like `CircuitBreakerRegistry`, it keeps at most
+    `max_keys` budgets and drops those unused for `idle_seconds`, least
+    recently used first.
+    """
+
+    def __init__(
+        self,
+        budget_factory: Callable[[], RetryBudget],
+        max_keys: int = 1000,
+        idle_seconds: float = 600.0,
+        time_provider: Callable[[], float] | None = None,
+    ) -> None:
+        if max_keys <= 0:
+            raise ValueError("max_keys must be greater than zero")
+        if idle_seconds <= 0:
+            raise ValueError("idle_seconds must be greater than zero")
+
+        self._budget_factory = budget_factory
+        self._max_keys = max_keys
+        self._idle_seconds = idle_seconds
+        self._time_provider = time_provider or monotonic
+        self._budgets: OrderedDict[str, tuple[RetryBudget, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._budgets)
+
+    def get(self, upstream: str) -> RetryBudget:
+        now = self._time_provider()
+        entry = self._budgets.pop(upstream, None)
+        budget = entry[0] if entry is not None else self._budget_factory()
+        self._budgets[upstream] = (budget, now)
+        self._evict(now)
+        return budget
+
+    def _evict(self, now: float) -> None:
+        while len(self._budgets) > self._max_keys:
+            self._budgets.popitem(last=False)
+        while self._budgets:
+            _, (_, last_used_at) = next(iter(self._budgets.items()))
+            if now - last_used_at < self._idle_seconds:
+                break
+            self._budgets.popitem(last=False)
@@ -1,11 +1,27 @@
 import asyncio
+import random
 from collections.abc import Awaitable, Callable
 from typing import TypeVar
 
+from reservas_api.infrastructure.resilience.retry_budget import RetryBudget
+from reservas_api.shared.resilience import Deadline
+
 T = TypeVar("T")
 
 
 class RetryPolicy:
+    """Exponential backoff retries.
+
+    With `full_jitter` each delay is drawn uniformly from zero to the
+    exponential cap, so callers that failed together do not retry together.
+    `retryable` decides which errors are worth retrying, `retry_after` can
+    return a server-requested minimum delay, and a shared `budget` stops
+    retries once they exceed their share of successful traffic. With a
+    `deadline`, a retry is skipped when the backoff plus `min_attempt_seconds`
+    no longer fits in the remaining budget. A `budget` passed to `execute`
+    replaces the shared one for that call (e.g. one budget per supplier).
+    """
+
     def __init__(
         self,
         max_retries: int = 3,
@@ -13,6 +29,12 @@ class RetryPolicy:
         backoff_factor: float = 2.0,
         max_delay_seconds: float = 60.0,
         sleep_func: Callable[[float], Awaitable[None]] | None = None,
+        full_jitter: bool = False,
+        retryable: Callable[[Exception], bool] | None = None,
+        retry_after: Callable[[Exception], float | None] | None = None,
+        budget: RetryBudget | None = None,
+        random_func: Callable[[], float] | None = None,
+        min_attempt_seconds: float = 0.5,
     ) -> None:
         if max_retries < 0:
             raise ValueError("max_retries must be greater than or equal to zero")
@@ -22,28 +44,71 @@ class RetryPolicy:
             raise ValueError("backoff_factor must be greater than or equal to one")
         if max_delay_seconds <= 0:
             raise ValueError("max_delay_seconds must be greater than zero")
+        if min_attempt_seconds < 0:
+            raise ValueError("min_attempt_seconds must be greater than or equal to zero")
 
         self._max_retries = max_retries
         self._base_delay_seconds = base_delay_seconds
         self._backoff_factor = backoff_factor
         self._max_delay_seconds = max_delay_seconds
         self._sleep_func = sleep_func or asyncio.sleep
+        self._full_jitter = full_jitter
+        self._retryable = retryable
+        self._retry_after = retry_after
+        self._budget = budget
+        self._random_func = random_func or random.random
+        self._min_attempt_seconds = min_attempt_seconds
 
-    async def execute(self, func: Callable[[], Awaitable[T]]) -> T:
+    async def execute(
+        self,
+        func: Callable[[], Awaitable[T]],
+        deadline: Deadline | None = None,
+        budget: RetryBudget | None = None,
+    ) -> T:
+        budget = budget if budget is not None else self._budget
         attempt = 0
         while True:
             try:
-                return await func()
-            except Exception:
+                result = await func()
+            except Exception as exc:
                 if attempt >= self._max_retries:
                     raise
-                delay = min(
-                    self._base_delay_seconds * (self._backoff_factor**attempt),
-                    self._max_delay_seconds,
-                )
+                delay = self._delay_for(attempt, exc)
+                if not self._fits_deadline(delay, deadline) or not self._should_retry(exc, budget):
+                    raise
                 attempt += 1
                 await self._sleep_func(delay)
+            else:
+                if budget is not None:
+                    budget.record_success()
+                return result
+
+    async def execute_with_retry(
+        self,
+        func: Callable[[], Awaitable[T]],
+        deadline: Deadline | None = None,
+    ) -> T:
+        return await self.execute(func, deadline)
+
+    def _fits_deadline(self, delay: float, deadline: Deadline | None) -> bool:
+        if deadline is None:
+            return True
+        return deadline.remaining_seconds() > delay + self._min_attempt_seconds
 
-    async def execute_with_retry(self, func: Callable[[], Awaitable[T]]) -> T:
-        return await self.execute(func)
+    def _should_retry(self, exc: Exception, budget: RetryBudget | None) -> bool:
+        if self._retryable is not None and not self._retryable(exc):
+            return False
+        return budget is None or budget.try_acquire()
 
+    def _delay_for(self, attempt: int, exc: Exception) -> float:
+        delay = min(
+            self._base_delay_seconds * (self._backoff_factor**attempt),
+            self._max_delay_seconds,
+        )
+        if self._full_jitter:
+            delay *= self._random_func()
+        if self._retry_after is not None:
+            requested = self._retry_after(exc)
+            if requested is not None:
+                delay = min(max(delay, requested), self._max_delay_seconds)
+        return delay
@@ -0,0 +1,168 @@
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from typing import TypeVar
+
+from reservas_api.infrastructure.resilience.circuit_breaker import (
+    CircuitBreakerOpenError,
+    CircuitState,
+)
+from reservas_api.shared.resilience import Deadline, DeadlineExceededError
+
+T = TypeVar("T")
+
+
+class SlidingWindowCircuitBreaker:
+    """Circuit breaker that trips on the failure rate over a sliding time window.
+
+    The window is a ring of `bucket_count` buckets covering `window_seconds`.
+    It opens when the window holds at least `failure_threshold` failures and
+    the failure rate reaches `failure_rate_threshold`. After
+    `recovery_timeout_seconds` at most `half_open_max_calls` probes run; the
+    circuit closes once all of them succeed.
+
+    State changes never await, so on a single event loop they need no lock and
+    a closed circuit costs one bucket update per call.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        failure_rate_threshold: float = 0.5,
+        window_seconds: float = 10.0,
+        bucket_count: int = 10,
+        recovery_timeout_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        time_provider: Callable[[], float] | None = None,
+    ) -> None:
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold must be greater than zero")
+        if not 0 < failure_rate_threshold <= 1:
+            raise ValueError("failure_rate_threshold must be between 0 and 1")
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be greater than zero")
+        if bucket_count <= 0:
+            raise ValueError("bucket_count must be greater than zero")
+        if recovery_timeout_seconds <= 0:
+            raise ValueError("recovery_timeout_seconds must be greater than zero")
+        if half_open_max_calls <= 0:
+            raise ValueError("half_open_max_calls must be greater than zero")
+
+        self._failure_threshold = failure_threshold
+        self._failure_rate_threshold = failure_rate_threshold
+        self._bucket_seconds = window_seconds / bucket_count
+        self._bucket_count = bucket_count
+        self._recovery_timeout_seconds = recovery_timeout_seconds
+        self._half_open_max_calls = half_open_max_calls
+        self._time_provider = time_provider or monotonic
+
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._bucket_ids = [-1] * bucket_count
+        self._bucket_calls = [0] * bucket_count
+        self._bucket_failures = [0] * bucket_count
+        self._half_open_in_flight = 0
+        self._half_open_successes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    @property
+    def failure_count(self) -> int:
+        return self._window_totals()[1]
+
+    @property
+    def failure_rate(self) -> float:
+        calls, failures = self._window_totals()
+        return failures / calls if calls else 0.0
+
+    async def call(
+        self,
+        func: Callable[[], Awaitable[T]],
+        deadline: Deadline | None = None,
+    ) -> T:
+        # An expired deadline is the caller's budget running out, not an upstream failure.
+        if deadline is not None and deadline.expired:
+            raise DeadlineExceededError("Deadline exceeded before calling upstream")
+        probe = self._state is not CircuitState.CLOSED and self._admit_probe()
+        try:
+            result = await func()
+        except Exception:
+            self._on_failure(probe)
+            raise
+        except BaseException:
+            # A cancelled probe (e.g. a losing hedge) says nothing about the upstream; free
+            # its slot so the next call can probe instead.
+            self._release_probe(probe)
+            raise
+        self._on_success(probe)
+        return result
+
+    def _admit_probe(self) -> bool:
+        if self._state is CircuitState.OPEN:
+            if self._time_provider() - self._opened_at < self._recovery_timeout_seconds:
+                raise CircuitBreakerOpenError("Circuit breaker is OPEN")
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_in_flight = 0
+            self._half_open_successes = 0
+        if self._half_open_in_flight >= self._half_open_max_calls:
+            raise CircuitBreakerOpenError("Circuit breaker is HALF_OPEN")
+        self._half_open_in_flight += 1
+        return True
+
+    def _release_probe(self, probe: bool) -> None:
+        if probe and self._state is CircuitState.HALF_OPEN and self._half_open_in_flight > 0:
+            self._half_open_in_flight -= 1
+
+    def _on_success(self, probe: bool) -> None:
+        self._record(failed=False)
+        if not probe or self._state is not CircuitState.HALF_OPEN:
+            return
+        self._half_open_in_flight -= 1
+        self._half_open_successes += 1
+        if self._half_open_successes >= self._half_open_max_calls:
+            self._state = CircuitState.CLOSED
+            self._reset_window()
+
+    def _on_failure(self, probe: bool) -> None:
+        self._record(failed=True)
+        if probe:
+            if self._state is CircuitState.HALF_OPEN:
+                self._open()
+            return
+        if self._state is CircuitState.CLOSED:
+            calls, failures = self._window_totals()
+            if (
+                failures >= self._failure_threshold
+                and failures >= calls * self._failure_rate_threshold
+            ):
+                self._open()
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self._time_provider()
+
+    def _record(self, failed: bool) -> None:
+        bucket_id = int(self._time_provider() / self._bucket_seconds)
+        index = bucket_id % self._bucket_count
+        if self._bucket_ids[index] != bucket_id:
+            self._bucket_ids[index] = bucket_id
+            self._bucket_calls[index] = 0
+            self._bucket_failures[index] = 0
+        self._bucket_calls[index] += 1
+        if failed:
+            self._bucket_failures[index] += 1
+
+    def _window_totals(self) -> tuple[int, int]:
+        oldest_bucket_id = int(self._time_provider() / self._bucket_seconds) - self._bucket_count
+        calls = failures = 0
+        for index, bucket_id in enumerate(self._bucket_ids):
+            if bucket_id > oldest_bucket_id:
+                calls += self._bucket_calls[index]
+                failures += self._bucket_failures[index]
+        return calls, failures
+
+    def _reset_window(self) -> None:
+        self._bucket_ids = [-1] * self._bucket_count
+        self._bucket_calls = [0] * self._bucket_count
+        self._bucket_failures = [0] * self._bucket_count
@@ -0,0 +1,3 @@
+from reservas_api.infrastructure.unit_of_work.sql_unit_of_work import SQLUnitOfWork
+
+__all__ = ["SQLUnitOfWork"]
@@ -0,0 +1,92 @@
+from collections.abc import Callable
+from types import TracebackType
+from typing import Self
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from reservas_api.infrastructure.db.session_router import SessionRouter
+from reservas_api.infrastructure.outbox import OutboxEventPublisher
+from reservas_api.infrastructure.repositories import (
+    MySQLAddonCatalogRepository,
+    MySQLReservationRepository,
+)
+
+
+class SQLUnitOfWork:
+    """Request-scoped transaction shared by the reservation adapters.
+
+    Entering opens one session; `reservations` and `outbox_writer` are bound
+    to it, so the request holds a single write connection from its first
+    query until `commit` or exit. Leaving without `commit` rolls back.
+    `on_committed` runs after a successful commit, e.g. to wake the outbox
+    worker.
+
+    The add-on catalog is reference data copied into snapshots, so
+    `addon_catalog` reads it outside the transaction, on
+    `read_session_factory` or the router's replica. That lets the use case
+    look it up concurrently with the code check.
+    """
+
+    reservations: MySQLReservationRepository
+    addon_catalog: MySQLAddonCatalogRepository
+    outbox_writer: OutboxEventPublisher
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        session_router: SessionRouter | None = None,
+        on_committed: Callable[[], None] | None = None,
+        read_session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._read_session_factory = read_session_factory or session_factory
+        self._session_router = session_router
+        self._on_committed = on_committed
+        self._session: AsyncSession | None = None
+        self._committed = False
+
+    async def __aenter__(self) -> Self:
+        if self._session is not None:
+            raise RuntimeError("Unit of work is already active")
+        session = self._session_factory()
+        self._session = session
+        self._committed = False
+        self.reservations = MySQLReservationRepository(
+            self._session_factory,
+            self._session_router,
+            session=session,
+        )
+        self.addon_catalog = MySQLAddonCatalogRepository(
+            self._read_session_factory,
+            self._session_router,
+        )
+        self.outbox_writer = OutboxEventPublisher(
+            self._session_factory,
+            session_router=self._session_router,
+            session=session,
+        )
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        session, self._session = self._session, None
+        if session is None:
+            return
+        try:
+            if not self._committed:
+                await session.rollback()
+        finally:
+            await session.close()
+
+    async def commit(self) -> None:
+        if self._session is None:
+            raise RuntimeError("Unit of work is not active")
+        await self._session.commit()
+        self._committed = True
+        if self._on_committed is not None:
+            self._on_committed()
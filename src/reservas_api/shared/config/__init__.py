@@ -1,4 +1,14 @@
-from reservas_api.shared.config.container import ApplicationContainer
+from reservas_api.shared.config.container import (
+    API_PROCESS_ROLE,
+    WORKER_PROCESS_ROLE,
+    ApplicationContainer,
+)
 from reservas_api.shared.config.settings import Settings, settings
 
-__all__ = ["ApplicationContainer", "Settings", "settings"]
+__all__ = [
+    "API_PROCESS_ROLE",
+    "WORKER_PROCESS_ROLE",
+    "ApplicationContainer",
+    "Settings",
+    "settings",
+]
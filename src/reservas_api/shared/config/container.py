@@ -1,3 +1,7 @@
+import asyncio
+import logging
+from contextlib import suppress
+
 import httpx
 from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -7,83 +11,293 @@ from reservas_api.application import (
     GenerateReservationCodeUseCase,
     UpdateReservationStatusUseCase,
 )
-from reservas_api.infrastructure.db.session import create_session_factory
-from reservas_api.infrastructure.gateways import ProviderAPIGateway, StripePaymentGateway
-from reservas_api.infrastructure.outbox import OutboxEventPublisher
+from reservas_api.infrastructure.db import DatabasePoolWarmer, PoolMetrics
+from reservas_api.infrastructure.db.session import (
+    API_READ_POOL,
+    WORKER_POOL,
+    create_session_factory,
+    create_session_router,
+)
+from reservas_api.infrastructure.gateways import (
+    HttpClientWarmer,
+    ProviderAPIGateway,
+    ProviderClientRegistry,
+    ProviderClientSettings,
+    StripePaymentGateway,
+    is_overload_http_error,
+    is_retryable_http_error,
+    retry_after_seconds,
+)
+from reservas_api.infrastructure.outbox import (
+    OutboxArchiver,
+    OutboxEventProcessor,
+    OutboxEventPublisher,
+    OutboxMetrics,
+)
 from reservas_api.infrastructure.repositories import (
+    MySQLAddonCatalogRepository,
+    MySQLProviderEntityRepository,
     MySQLReservationRepository,
     MySQLReservationStatusStore,
 )
-from reservas_api.infrastructure.resilience import CircuitBreaker, RetryPolicy
+from reservas_api.infrastructure.resilience import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreakerRegistry,
+    HedgingPolicy,
+    RetryBudget,
+    RetryBudgetRegistry,
+    RetryPolicy,
+    SlidingWindowCircuitBreaker,
+)
+from reservas_api.infrastructure.unit_of_work import SQLUnitOfWork
 from reservas_api.shared.config.settings import Settings, settings
 from reservas_api.shared.logging import AuditLogger
 
+logger = logging.getLogger(__name__)
+
+API_PROCESS_ROLE = "api"
+WORKER_PROCESS_ROLE = "worker"
+
 
 class ApplicationContainer:
-    """Dependency container for repositories, gateways and use cases."""
+    """Dependency container for repositories, gateways and use cases.
+
+    API writes, API reads and outbox background work each get their own
+    connection pool, unless a single `session_factory` is injected.
+    `process_role` tells which of those pools this process actually uses:
+    the API process (`api`) or the standalone outbox worker (`worker`).
+    """
 
     def __init__(
         self,
         app_settings: Settings = settings,
         session_factory: async_sessionmaker[AsyncSession] | None = None,
+        process_role: str = API_PROCESS_ROLE,
     ) -> None:
+        if process_role not in (API_PROCESS_ROLE, WORKER_PROCESS_ROLE):
+            raise ValueError("process_role must be 'api' or 'worker'")
+
         self.settings = app_settings
-        self.session_factory = session_factory or create_session_factory(app_settings)
+        self.process_role = process_role
+        self.pool_metrics = PoolMetrics()
+        self.session_factory = session_factory or create_session_factory(
+            app_settings,
+            pool_metrics=self.pool_metrics,
+        )
+        self.read_session_factory = session_factory or create_session_factory(
+            app_settings,
+            pool_name=API_READ_POOL,
+            pool_metrics=self.pool_metrics,
+        )
+        self.worker_session_factory = session_factory or create_session_factory(
+            app_settings,
+            pool_name=WORKER_POOL,
+            pool_metrics=self.pool_metrics,
+        )
+        self.session_router = create_session_router(
+            self.read_session_factory,
+            app_settings,
+            pool_metrics=self.pool_metrics,
+        )
         self._audit_logger = AuditLogger()
+        self.outbox_metrics = OutboxMetrics()
+        self._circuit_breakers = CircuitBreakerRegistry(self._create_circuit_breaker)
+        self._supplier_circuit_breakers = CircuitBreakerRegistry(
+            self._create_circuit_breaker,
+            max_keys=app_settings.circuit_breaker_max_keys,
+            idle_seconds=app_settings.circuit_breaker_idle_eviction_seconds,
+        )
+        self._provider_retry_budget = self._create_retry_budget()
+        self._supplier_retry_budgets = RetryBudgetRegistry(
+            self._create_retry_budget,
+            max_keys=app_settings.circuit_breaker_max_keys,
+            idle_seconds=app_settings.circuit_breaker_idle_eviction_seconds,
+        )
+        self._provider_hedging_policy = self._create_provider_hedging_policy()
+        self._stripe_concurrency_limiter = self._create_concurrency_limiter()
+        self._provider_concurrency_limiter = self._create_concurrency_limiter()
         self._stripe_client: httpx.AsyncClient | None = None
         self._provider_client: httpx.AsyncClient | None = None
+        self._provider_client_registry: ProviderClientRegistry | None = None
+        self._http_warmer: HttpClientWarmer | None = None
+        self._http_keepalive_task: asyncio.Task[None] | None = None
+        self._outbox_processor: OutboxEventProcessor | None = None
+        self._outbox_worker_task: asyncio.Task[None] | None = None
+        self._warmup_task: asyncio.Task[None] | None = None
+        self._warmup_status = "warming"
+        self.warmup_connections: dict[str, int] = {"db": 0, "http": 0}
+
+    @property
+    def ready(self) -> bool:
+        """True once the startup warm-up has opened a DB connection (or DB pre-warm is off)."""
+        return self._warmup_status == "ready"
+
+    @property
+    def warmup_status(self) -> str:
+        """`warming` while the first warm-up runs, `degraded` while it is retried, else `ready`."""
+        return self._warmup_status
+
+    async def wait_until_ready(self) -> None:
+        """Wait for the background warm-up started by `startup` to report ready."""
+        if self._warmup_task is not None:
+            await asyncio.shield(self._warmup_task)
 
     async def startup(self) -> None:
-        """Initialize long-lived external HTTP clients."""
+        """Initialize long-lived external HTTP clients and the embedded outbox worker.
+
+        DB and HTTP connection warm-up runs in the background; `ready` turns
+        true once it has opened a DB connection, so the process can answer
+        liveness probes while readiness still reports it as cold.
+        """
         if self._stripe_client is None:
             self._stripe_client = httpx.AsyncClient(
                 base_url=self.settings.stripe_api_base_url.rstrip("/"),
                 headers={"Authorization": f"Bearer {self.settings.stripe_api_key}"},
-                limits=httpx.Limits(max_connections=self.settings.http_max_connections),
+                limits=self._http_limits(self.settings.http_max_connections),
                 timeout=self.settings.external_api_timeout_seconds,
+                http2=self.settings.http2_enabled,
             )
         if self._provider_client is None:
             self._provider_client = httpx.AsyncClient(
                 base_url=self.settings.provider_api_base_url.rstrip("/"),
                 headers={"Authorization": f"Bearer {self.settings.provider_api_key}"},
-                limits=httpx.Limits(max_connections=self.settings.http_max_connections),
+                limits=self._http_limits(self.settings.http_max_connections),
                 timeout=self.settings.external_api_timeout_seconds,
+                http2=self.settings.http2_enabled,
+            )
+        if self.settings.provider_client_pools_enabled and self._provider_client_registry is None:
+            self._provider_client_registry = await self._load_provider_client_registry()
+        if self._warmup_task is None and not self.ready:
+            self._warmup_task = asyncio.create_task(self._warm_up())
+        if self.settings.outbox_embedded_worker_enabled and self._outbox_worker_task is None:
+            self._outbox_processor = self.create_outbox_event_processor(
+                poll_interval_seconds=self.settings.outbox_embedded_sweep_interval_seconds,
+                batch_size=self.settings.outbox_batch_size,
             )
+            self._outbox_worker_task = asyncio.create_task(self._outbox_processor.run_forever())
 
     async def shutdown(self) -> None:
-        """Close long-lived external HTTP clients."""
+        """Stop the embedded outbox worker and close long-lived external HTTP clients."""
+        self._warmup_status = "warming"
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._warmup_task
+            self._warmup_task = None
+        if self._outbox_worker_task is not None and self._outbox_processor is not None:
+            self._outbox_processor.stop()
+            await self._outbox_worker_task
+            self._outbox_worker_task = None
+            self._outbox_processor = None
+        if self._http_warmer is not None:
+            self._http_warmer.stop()
+            if self._http_keepalive_task is not None:
+                await self._http_keepalive_task
+                self._http_keepalive_task = None
+            self._http_warmer = None
         if self._stripe_client is not None:
             await self._stripe_client.aclose()
             self._stripe_client = None
+        if self._provider_client_registry is not None:
+            await self._provider_client_registry.aclose()
+            self._provider_client_registry = None
         if self._provider_client is not None:
             await self._provider_client.aclose()
             self._provider_client = None
-        engine = self.session_factory.kw.get("bind")
-        if engine is not None:
-            await engine.dispose()
+        await self.session_router.dispose()
+        engines = {
+            factory.kw.get("bind")
+            for factory in (
+                self.session_factory,
+                self.read_session_factory,
+                self.worker_session_factory,
+            )
+        }
+        for engine in engines:
+            if engine is not None:
+                await engine.dispose()
 
     def create_reservation_repository(self) -> MySQLReservationRepository:
         """Create reservation repository instance."""
-        return MySQLReservationRepository(self.session_factory)
+        return MySQLReservationRepository(self.session_factory, self.session_router)
+
+    def create_addon_catalog_repository(self) -> MySQLAddonCatalogRepository:
+        """Create add-on catalog repository on the API read pool."""
+        return MySQLAddonCatalogRepository(self.read_session_factory, self.session_router)
 
     def create_reservation_status_store(self) -> MySQLReservationStatusStore:
         """Create status store instance."""
-        return MySQLReservationStatusStore(self.session_factory)
+        return MySQLReservationStatusStore(
+            self.session_factory,
+            session_router=self.session_router,
+        )
 
     def create_generate_reservation_code_use_case(self) -> GenerateReservationCodeUseCase:
         """Create reservation code generator use case."""
         return GenerateReservationCodeUseCase(repository=self.create_reservation_repository())
 
     def create_outbox_event_publisher(self) -> OutboxEventPublisher:
-        """Create outbox publisher adapter."""
-        return OutboxEventPublisher(self.session_factory)
+        """Create outbox publisher adapter, waking the embedded worker on commit."""
+        on_committed = self._outbox_processor.notify if self._outbox_processor is not None else None
+        return OutboxEventPublisher(
+            self.session_factory,
+            on_committed=on_committed,
+            session_router=self.session_router,
+        )
+
+    def create_unit_of_work(self) -> SQLUnitOfWork:
+        """Create a request-scoped unit of work on the API write pool."""
+        on_committed = self._outbox_processor.notify if self._outbox_processor is not None else None
+        return SQLUnitOfWork(
+            self.session_factory,
+            session_router=self.session_router,
+            on_committed=on_committed,
+            read_session_factory=self.read_session_factory,
+        )
+
+    def create_outbox_event_processor(
+        self,
+        poll_interval_seconds: float,
+        batch_size: int,
+        max_attempts: int | None = None,
+        shard_index: int = 0,
+        shard_count: int = 1,
+    ) -> OutboxEventProcessor:
+        """Create outbox processor wired to the external gateways."""
+        return OutboxEventProcessor(
+            session_factory=self.worker_session_factory,
+            payment_gateway=self.create_payment_gateway(),
+            provider_gateway=self.create_provider_gateway(),
+            poll_interval_seconds=poll_interval_seconds,
+            batch_size=batch_size,
+            max_attempts=max_attempts or self.settings.outbox_max_attempts,
+            retry_base_delay_seconds=self.settings.outbox_retry_base_delay_seconds,
+            retry_max_delay_seconds=self.settings.outbox_retry_max_delay_seconds,
+            audit_logger=self._audit_logger,
+            metrics=self.outbox_metrics,
+            shard_index=shard_index,
+            shard_count=shard_count,
+            dispatch_deadline_seconds=self.settings.outbox_dispatch_deadline_seconds,
+            claim_lease_seconds=self.settings.outbox_claim_lease_seconds,
+        )
+
+    def create_outbox_archiver(self) -> OutboxArchiver:
+        """Create archiver for processed outbox events past retention."""
+        return OutboxArchiver(
+            session_factory=self.worker_session_factory,
+            retention_seconds=self.settings.outbox_archive_retention_hours * 3600,
+            batch_size=self.settings.outbox_archive_batch_size,
+            poll_interval_seconds=self.settings.outbox_archive_interval_seconds,
+        )
 
     def create_create_reservation_use_case(self) -> CreateReservationUseCase:
         """Create reservation creation use case with configured dependencies."""
         return CreateReservationUseCase(
             generate_code_use_case=self.create_generate_reservation_code_use_case(),
             outbox_writer=self.create_outbox_event_publisher(),
+            addon_catalog=self.create_addon_catalog_repository(),
             audit_logger=self._audit_logger,
+            unit_of_work_factory=self.create_unit_of_work,
         )
 
     def create_update_reservation_status_use_case(self) -> UpdateReservationStatusUseCase:
@@ -93,16 +307,22 @@ class ApplicationContainer:
             audit_logger=self._audit_logger,
         )
 
-    def create_circuit_breaker(self) -> CircuitBreaker:
-        """Create circuit breaker from configured thresholds."""
-        return CircuitBreaker(
-            failure_threshold=self.settings.circuit_breaker_failure_threshold,
-            recovery_timeout_seconds=self.settings.circuit_breaker_recovery_seconds,
-        )
+    def get_circuit_breaker(self, upstream: str) -> SlidingWindowCircuitBreaker:
+        """Return the circuit breaker shared by every gateway calling `upstream`."""
+        return self._circuit_breakers.get(upstream)
 
     def create_retry_policy(self) -> RetryPolicy:
-        """Create retry policy from configured retry attempts."""
-        return RetryPolicy(max_retries=self.settings.retry_max_attempts)
+        """Create jittered retry policy limited by the shared provider retry budget.
+
+        Provider gateways replace that budget per call with the supplier's own.
+        """
+        return RetryPolicy(
+            max_retries=self.settings.retry_max_attempts,
+            full_jitter=True,
+            retryable=is_retryable_http_error,
+            retry_after=retry_after_seconds,
+            budget=self._provider_retry_budget,
+        )
 
     def create_payment_gateway(self) -> StripePaymentGateway:
         """Create Stripe payment gateway adapter."""
@@ -110,8 +330,9 @@ class ApplicationContainer:
             raise RuntimeError("Container not started. Call startup() before requesting gateways.")
         return StripePaymentGateway(
             client=self._stripe_client,
-            circuit_breaker=self.create_circuit_breaker(),
+            circuit_breaker=self.get_circuit_breaker("stripe"),
             timeout_seconds=self.settings.external_api_timeout_seconds,
+            concurrency_limiter=self._stripe_concurrency_limiter,
         )
 
     def create_provider_gateway(self) -> ProviderAPIGateway:
@@ -120,7 +341,172 @@ class ApplicationContainer:
             raise RuntimeError("Container not started. Call startup() before requesting gateways.")
         return ProviderAPIGateway(
             client=self._provider_client,
-            circuit_breaker=self.create_circuit_breaker(),
+            circuit_breaker=self.get_circuit_breaker("provider"),
             retry_policy=self.create_retry_policy(),
             timeout_seconds=self.settings.external_api_timeout_seconds,
+            client_registry=self._provider_client_registry,
+            hedging_policy=self._provider_hedging_policy,
+            concurrency_limiter=self._provider_concurrency_limiter,
+            supplier_circuit_breakers=self._supplier_circuit_breakers,
+            supplier_retry_budgets=self._supplier_retry_budgets,
+        )
+
+    def _create_circuit_breaker(self) -> SlidingWindowCircuitBreaker:
+        """Create circuit breaker from configured thresholds."""
+        return SlidingWindowCircuitBreaker(
+            failure_threshold=self.settings.circuit_breaker_failure_threshold,
+            failure_rate_threshold=self.settings.circuit_breaker_failure_rate_threshold,
+            window_seconds=self.settings.circuit_breaker_window_seconds,
+            recovery_timeout_seconds=self.settings.circuit_breaker_recovery_seconds,
+            half_open_max_calls=self.settings.circuit_breaker_half_open_max_calls,
+        )
+
+    def _create_retry_budget(self) -> RetryBudget:
+        """Create retry budget from configured ratio and floor rate."""
+        return RetryBudget(
+            ratio=self.settings.retry_budget_ratio,
+            min_retries_per_second=self.settings.retry_budget_min_retries_per_second,
+        )
+
+    def _create_provider_hedging_policy(self) -> HedgingPolicy | None:
+        """Share one latency window across provider gateways when hedging is on."""
+        if not self.settings.provider_hedging_enabled:
+            return None
+        return HedgingPolicy(
+            percentile=self.settings.provider_hedging_percentile,
+            budget_ratio=self.settings.provider_hedging_budget_ratio,
+            min_delay_seconds=self.settings.provider_hedging_min_delay_ms / 1000,
+        )
+
+    def _create_concurrency_limiter(self) -> AdaptiveConcurrencyLimiter | None:
+        """Create one adaptive limiter per upstream, shared by its gateways."""
+        if not self.settings.outbound_adaptive_concurrency_enabled:
+            return None
+        max_limit = self.settings.http_max_connections
+        return AdaptiveConcurrencyLimiter(
+            initial_limit=min(self.settings.outbound_concurrency_initial_limit, max_limit),
+            max_limit=max_limit,
+            max_queue_size=self.settings.outbound_concurrency_max_queue_size,
+            queue_timeout_seconds=self.settings.outbound_concurrency_queue_timeout_seconds,
+            overload=is_overload_http_error,
+        )
+
+    async def _load_provider_client_registry(self) -> ProviderClientRegistry | None:
+        """Create one pooled client per enabled provider entity.
+
+        Falls back to the shared provider client when the catalog cannot be read.
+        """
+        if self._provider_client is None:
+            return None
+        registry = ProviderClientRegistry(
+            default_client=self._provider_client,
+            default_settings=ProviderClientSettings(
+                base_url=self.settings.provider_api_base_url,
+                timeout_seconds=self.settings.external_api_timeout_seconds,
+                max_connections=self.settings.provider_http_max_connections,
+            ),
+            client_factory=self._create_provider_client,
+        )
+        try:
+            entities = await MySQLProviderEntityRepository(
+                self.session_factory,
+                self.session_router,
+            ).list_enabled()
+        except Exception:
+            logger.warning("provider_entities_unavailable", exc_info=True)
+            return None
+        registry.register_entities(entities)
+        return registry
+
+    def _create_provider_client(self, client_settings: ProviderClientSettings) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=client_settings.base_url.rstrip("/"),
+            headers={"Authorization": f"Bearer {self.settings.provider_api_key}"},
+            limits=self._http_limits(
+                client_settings.max_connections,
+                client_settings.max_keepalive_connections,
+            ),
+            timeout=client_settings.timeout_seconds,
+            http2=self.settings.http2_enabled,
+        )
+
+    def _http_limits(
+        self,
+        max_connections: int,
+        max_keepalive_connections: int | None = None,
+    ) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=self.settings.http_keepalive_expiry_seconds,
+        )
+
+    async def _warm_up(self) -> None:
+        """Pre-open DB and outbound keep-alive connections in parallel, then mark ready.
+
+        A timeout, or a DB warm-up where every connect failed, leaves the
+        process `degraded`; the DB warm-up is then retried every
+        `STARTUP_WARMUP_RETRY_SECONDS` until it opens a connection.
+        """
+        timeout_seconds = self.settings.startup_warmup_timeout_seconds
+        db_connections = 0
+        try:
+            async with asyncio.timeout(timeout_seconds):
+                db_connections, http_connections = await asyncio.gather(
+                    self._prewarm_db_pools(),
+                    self._start_http_warmer(),
+                )
+            self.warmup_connections = {"db": db_connections, "http": http_connections}
+        except TimeoutError:
+            logger.warning("startup_warmup_timed_out", extra={"timeout_seconds": timeout_seconds})
+        while db_connections == 0 and self.settings.db_prewarm_connections > 0:
+            self._warmup_status = "degraded"
+            await asyncio.sleep(self.settings.startup_warmup_retry_seconds)
+            try:
+                async with asyncio.timeout(timeout_seconds):
+                    db_connections = await self._prewarm_db_pools()
+            except TimeoutError:
+                logger.warning(
+                    "startup_warmup_timed_out",
+                    extra={"timeout_seconds": timeout_seconds},
+                )
+                continue
+            self.warmup_connections["db"] = db_connections
+        self._warmup_status = "ready"
+
+    async def _prewarm_db_pools(self) -> int:
+        """Open `DB_PREWARM_CONNECTIONS` connections in every pool this process uses."""
+        if self.settings.db_prewarm_connections <= 0:
+            return 0
+        if self.process_role == WORKER_PROCESS_ROLE:
+            factories = [self.worker_session_factory]
+        else:
+            factories = [self.session_factory, self.read_session_factory]
+            if self.settings.outbox_embedded_worker_enabled:
+                factories.append(self.worker_session_factory)
+            if self.session_router.replica is not None:
+                factories.append(self.session_router.replica)
+        engines = list(dict.fromkeys(factory.kw["bind"] for factory in factories))
+        warmer = DatabasePoolWarmer(engines, self.settings.db_prewarm_connections)
+        warmed = await warmer.prewarm()
+        logger.info("db_connections_prewarmed", extra={"connections": warmed})
+        return warmed
+
+    async def _start_http_warmer(self) -> int:
+        """Open keep-alive connections to every gateway and keep them warm."""
+        if self.settings.http_prewarm_connections <= 0 or self._http_warmer is not None:
+            return 0
+        clients = [client for client in (self._stripe_client, self._provider_client) if client]
+        if self._provider_client_registry is not None:
+            clients.extend(self._provider_client_registry.dedicated_clients)
+        self._http_warmer = HttpClientWarmer(
+            clients,
+            connections_per_client=self.settings.http_prewarm_connections,
         )
+        warmed = await self._http_warmer.prewarm()
+        logger.info("http_connections_prewarmed", extra={"connections": warmed})
+        if self.settings.http_keepalive_probe_interval_seconds > 0:
+            self._http_keepalive_task = asyncio.create_task(
+                self._http_warmer.run_keepalive(self.settings.http_keepalive_probe_interval_seconds)
+            )
+        return warmed
@@ -34,6 +34,59 @@ class Settings(BaseSettings):
         default=1800,
         validation_alias=AliasChoices("DB_POOL_RECYCLE_SECONDS"),
     )
+    db_query_cache_size: int = Field(
+        default=500,
+        validation_alias=AliasChoices("DB_QUERY_CACHE_SIZE"),
+    )
+    db_prewarm_connections: int = Field(
+        default=0,
+        validation_alias=AliasChoices("DB_PREWARM_CONNECTIONS"),
+    )
+    startup_warmup_timeout_seconds: float = Field(
+        default=10.0,
+        validation_alias=AliasChoices("STARTUP_WARMUP_TIMEOUT_SECONDS"),
+    )
+    startup_warmup_retry_seconds: float = Field(
+        default=5.0,
+        validation_alias=AliasChoices("STARTUP_WARMUP_RETRY_SECONDS"),
+    )
+    db_read_pool_size: int = Field(default=10, validation_alias=AliasChoices("DB_READ_POOL_SIZE"))
+    db_read_max_overflow: int = Field(
+        default=10,
+        validation_alias=AliasChoices("DB_READ_MAX_OVERFLOW"),
+    )
+    db_read_pool_timeout_seconds: float = Field(
+        default=5.0,
+        validation_alias=AliasChoices("DB_READ_POOL_TIMEOUT_SECONDS"),
+    )
+    db_worker_pool_size: int = Field(
+        default=5,
+        validation_alias=AliasChoices("DB_WORKER_POOL_SIZE"),
+    )
+    db_worker_max_overflow: int = Field(
+        default=5,
+        validation_alias=AliasChoices("DB_WORKER_MAX_OVERFLOW"),
+    )
+    db_worker_pool_timeout_seconds: float = Field(
+        default=30.0,
+        validation_alias=AliasChoices("DB_WORKER_POOL_TIMEOUT_SECONDS"),
+    )
+    database_replica_url: str = Field(
+        default="",
+        validation_alias=AliasChoices("DATABASE_REPLICA_URL"),
+    )
+    db_replica_max_lag_seconds: float = Field(
+        default=2.0,
+        validation_alias=AliasChoices("DB_REPLICA_MAX_LAG_SECONDS"),
+    )
+    db_replica_lag_check_interval_seconds: float = Field(
+        default=5.0,
+        validation_alias=AliasChoices("DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS"),
+    )
+    db_read_your_writes_seconds: float = Field(
+        default=5.0,
+        validation_alias=AliasChoices("DB_READ_YOUR_WRITES_SECONDS"),
+    )
 
     stripe_api_base_url: str = Field(
         default="https://api.stripe.com", validation_alias=AliasChoices("STRIPE_API_BASE_URL")
@@ -53,6 +106,59 @@ class Settings(BaseSettings):
     tls_cert_file: str = Field(default="", validation_alias=AliasChoices("TLS_CERT_FILE"))
     tls_key_file: str = Field(default="", validation_alias=AliasChoices("TLS_KEY_FILE"))
     http_max_connections: int = Field(default=100, validation_alias=AliasChoices("HTTP_MAX_CONNECTIONS"))
+    http2_enabled: bool = Field(default=False, validation_alias=AliasChoices("HTTP2_ENABLED"))
+    http_keepalive_expiry_seconds: float = Field(
+        default=5.0,
+        validation_alias=AliasChoices("HTTP_KEEPALIVE_EXPIRY_SECONDS"),
+    )
+    http_prewarm_connections: int = Field(
+        default=0,
+        validation_alias=AliasChoices("HTTP_PREWARM_CONNECTIONS"),
+    )
+    http_keepalive_probe_interval_seconds: float = Field(
+        default=0.0,
+        validation_alias=AliasChoices("HTTP_KEEPALIVE_PROBE_INTERVAL_SECONDS"),
+    )
+    outbound_adaptive_concurrency_enabled: bool = Field(
+        default=False,
+        validation_alias=AliasChoices("OUTBOUND_ADAPTIVE_CONCURRENCY_ENABLED"),
+    )
+    outbound_concurrency_initial_limit: int = Field(
+        default=20,
+        validation_alias=AliasChoices("OUTBOUND_CONCURRENCY_INITIAL_LIMIT"),
+    )
+    outbound_concurrency_max_queue_size: int = Field(
+        default=100,
+        validation_alias=AliasChoices("OUTBOUND_CONCURRENCY_MAX_QUEUE_SIZE"),
+    )
+    outbound_concurrency_queue_timeout_seconds: float = Field(
+        default=5.0,
+        validation_alias=AliasChoices("OUTBOUND_CONCURRENCY_QUEUE_TIMEOUT_SECONDS"),
+    )
+    provider_client_pools_enabled: bool = Field(
+        default=True,
+        validation_alias=AliasChoices("PROVIDER_CLIENT_POOLS_ENABLED"),
+    )
+    provider_http_max_connections: int = Field(
+        default=20,
+        validation_alias=AliasChoices("PROVIDER_HTTP_MAX_CONNECTIONS"),
+    )
+    provider_hedging_enabled: bool = Field(
+        default=False,
+        validation_alias=AliasChoices("PROVIDER_HEDGING_ENABLED"),
+    )
+    provider_hedging_percentile: float = Field(
+        default=0.95,
+        validation_alias=AliasChoices("PROVIDER_HEDGING_PERCENTILE"),
+    )
+    provider_hedging_budget_ratio: float = Field(
+        default=0.1,
+        validation_alias=AliasChoices("PROVIDER_HEDGING_BUDGET_RATIO"),
+    )
+    provider_hedging_min_delay_ms: int = Field(
+        default=50,
+        validation_alias=AliasChoices("PROVIDER_HEDGING_MIN_DELAY_MS"),
+    )
     rate_limit_requests_per_minute: int = Field(
         default=120,
         validation_alias=AliasChoices("RATE_LIMIT_REQUESTS_PER_MINUTE"),
@@ -75,7 +181,76 @@ class Settings(BaseSettings):
             "CIRCUIT_BREAKER_TIMEOUT",
         ),
     )
+    circuit_breaker_failure_rate_threshold: float = Field(
+        default=0.5,
+        validation_alias=AliasChoices("CIRCUIT_BREAKER_FAILURE_RATE_THRESHOLD"),
+    )
+    circuit_breaker_window_seconds: float = Field(
+        default=10.0,
+        validation_alias=AliasChoices("CIRCUIT_BREAKER_WINDOW_SECONDS"),
+    )
+    circuit_breaker_half_open_max_calls: int = Field(
+        default=3,
+        validation_alias=AliasChoices("CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS"),
+    )
+    circuit_breaker_max_keys: int = Field(
+        default=1000,
+        validation_alias=AliasChoices("CIRCUIT_BREAKER_MAX_KEYS"),
+    )
+    circuit_breaker_idle_eviction_seconds: float = Field(
+        default=600.0,
+        validation_alias=AliasChoices("CIRCUIT_BREAKER_IDLE_EVICTION_SECONDS"),
+    )
     retry_max_attempts: int = Field(default=3, validation_alias=AliasChoices("RETRY_MAX_ATTEMPTS"))
+    retry_budget_ratio: float = Field(
+        default=0.1,
+        validation_alias=AliasChoices("RETRY_BUDGET_RATIO"),
+    )
+    retry_budget_min_retries_per_second: float = Field(
+        default=0.1,
+        validation_alias=AliasChoices("RETRY_BUDGET_MIN_RETRIES_PER_SECOND"),
+    )
+    outbox_max_attempts: int = Field(
+        default=10,
+        validation_alias=AliasChoices("OUTBOX_MAX_ATTEMPTS"),
+    )
+    outbox_dispatch_deadline_seconds: float = Field(
+        default=30.0,
+        validation_alias=AliasChoices("OUTBOX_DISPATCH_DEADLINE_SECONDS"),
+    )
+    outbox_claim_lease_seconds: float = Field(
+        default=300.0,
+        validation_alias=AliasChoices("OUTBOX_CLAIM_LEASE_SECONDS"),
+    )
+    outbox_retry_base_delay_seconds: float = Field(
+        default=5.0,
+        validation_alias=AliasChoices("OUTBOX_RETRY_BASE_DELAY_SECONDS"),
+    )
+    outbox_retry_max_delay_seconds: float = Field(
+        default=900.0,
+        validation_alias=AliasChoices("OUTBOX_RETRY_MAX_DELAY_SECONDS"),
+    )
+    outbox_embedded_worker_enabled: bool = Field(
+        default=False,
+        validation_alias=AliasChoices("OUTBOX_EMBEDDED_WORKER_ENABLED"),
+    )
+    outbox_embedded_sweep_interval_seconds: float = Field(
+        default=30.0,
+        validation_alias=AliasChoices("OUTBOX_EMBEDDED_SWEEP_INTERVAL_SECONDS"),
+    )
+    outbox_batch_size: int = Field(default=100, validation_alias=AliasChoices("OUTBOX_BATCH_SIZE"))
+    outbox_archive_retention_hours: float = Field(
+        default=168.0,
+        validation_alias=AliasChoices("OUTBOX_ARCHIVE_RETENTION_HOURS"),
+    )
+    outbox_archive_batch_size: int = Field(
+        default=500,
+        validation_alias=AliasChoices("OUTBOX_ARCHIVE_BATCH_SIZE"),
+    )
+    outbox_archive_interval_seconds: float = Field(
+        default=300.0,
+        validation_alias=AliasChoices("OUTBOX_ARCHIVE_INTERVAL_SECONDS"),
+    )
 
     @property
     def cors_allowed_origins_list(self) -> list[str]:
@@ -0,0 +1,4 @@
+from reservas_api.shared.metrics.latency_histogram import LatencyHistogram
+from reservas_api.shared.metrics.rate_counter import RateCounter
+
+__all__ = ["LatencyHistogram", "RateCounter"]
@@ -0,0 +1,76 @@
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import Any
+
+DEFAULT_LATENCY_BUCKETS_SECONDS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with constant memory per instance."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_SECONDS) -> None:
+        if not buckets:
+            raise ValueError("buckets must not be empty")
+        if any(upper <= lower for lower, upper in zip(buckets, buckets[1:], strict=False)):
+            raise ValueError("buckets must be strictly increasing")
+
+        self._bounds = tuple(float(bound) for bound in buckets)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def observe(self, value_seconds: float) -> None:
+        value = max(value_seconds, 0.0)
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self._count += 1
+        self._sum += value
+        self._max = max(self._max, value)
+
+    def quantile(self, q: float) -> float:
+        """Return the upper bound of the bucket holding quantile `q`."""
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if self._count == 0:
+            return 0.0
+        rank = q * self._count
+        cumulative = 0
+        for index, bucket_count in enumerate(self._counts):
+            cumulative += bucket_count
+            if cumulative >= rank and bucket_count:
+                return self._bounds[index] if index < len(self._bounds) else self._max
+        return self._max
+
+    def snapshot(self) -> dict[str, Any]:
+        cumulative = 0
+        buckets: dict[str, int] = {}
+        for bound, bucket_count in zip(self._bounds, self._counts, strict=False):
+            cumulative += bucket_count
+            buckets[f"{bound:g}"] = cumulative
+        buckets["+Inf"] = self._count
+        return {
+            "count": self._count,
+            "sum_seconds": round(self._sum, 6),
+            "max_seconds": round(self._max, 6),
+            "p50_seconds": self.quantile(0.5),
+            "p95_seconds": self.quantile(0.95),
+            "p99_seconds": self.quantile(0.99),
+            "buckets": buckets,
+        }
@@ -0,0 +1,48 @@
+from collections.abc import Callable
+from time import monotonic
+
+
+class RateCounter:
+    """Per-second event counter over a sliding window of fixed size.
+
+    Counts live in a ring buffer of `window_seconds` slots, so memory stays
+    bounded no matter how many events are recorded.
+    """
+
+    def __init__(
+        self,
+        window_seconds: int = 60,
+        time_provider: Callable[[], float] | None = None,
+    ) -> None:
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be greater than zero")
+
+        self._window_seconds = window_seconds
+        self._time_provider = time_provider or monotonic
+        self._slots = [0] * window_seconds
+        self._slot_seconds = [-1] * window_seconds
+        self._total = 0
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    def add(self, amount: int = 1) -> None:
+        second = int(self._time_provider())
+        index = second % self._window_seconds
+        if self._slot_seconds[index] != second:
+            self._slot_seconds[index] = second
+            self._slots[index] = 0
+        self._slots[index] += amount
+        self._total += amount
+
+    def per_second(self) -> float:
+        """Return the average events per second over the window."""
+        now = int(self._time_provider())
+        oldest = now - self._window_seconds
+        recent = sum(
+            count
+            for count, second in zip(self._slots, self._slot_seconds, strict=False)
+            if second > oldest
+        )
+        return recent / self._window_seconds
@@ -0,0 +1,3 @@
+from reservas_api.shared.resilience.deadline import Deadline, DeadlineExceededError
+
+__all__ = ["Deadline", "DeadlineExceededError"]
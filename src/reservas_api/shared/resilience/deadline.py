@@ -0,0 +1,42 @@
+from collections.abc import Callable
+from time import monotonic
+
+
+class DeadlineExceededError(TimeoutError):
+    pass
+
+
+class Deadline:
+    """Time budget shared by every step of one outbound operation.
+
+    Retries, circuit breakers and HTTP attempts read the same deadline, so
+    the whole operation ends within `timeout_seconds` however many attempts
+    it makes. Implements the domain `Deadline` port.
+    """
+
+    __slots__ = ("_expires_at", "_time_provider")
+
+    def __init__(
+        self,
+        timeout_seconds: float,
+        time_provider: Callable[[], float] | None = None,
+    ) -> None:
+        if timeout_seconds <= 0:
+            raise ValueError("timeout_seconds must be greater than zero")
+
+        self._time_provider = time_provider or monotonic
+        self._expires_at = self._time_provider() + timeout_seconds
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining_seconds() <= 0
+
+    def remaining_seconds(self) -> float:
+        return max(self._expires_at - self._time_provider(), 0.0)
+
+    def clip(self, timeout_seconds: float) -> float:
+        """Return `timeout_seconds` cut to the remaining budget."""
+        remaining = self.remaining_seconds()
+        if remaining <= 0:
+            raise DeadlineExceededError("Deadline exceeded")
+        return min(timeout_seconds, remaining)
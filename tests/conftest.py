@@ -15,6 +15,9 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 # Ensure model metadata is registered before creating/dropping tables.
 from reservas_api.infrastructure.db.models import (  # noqa: F401
     OfficeModel,
+    ProviderIdempotencyKeyModel,
+    ProviderOutboxDeadLetterModel,
+    ProviderOutboxEventArchiveModel,
     ProviderOutboxEventModel,
     ReservationContactModel,
     ReservationModel,
@@ -32,6 +35,11 @@ TABLES_TRUNCATE_ORDER = [
     "reservation_contacts",
     "reservation_status_history",
     "provider_outbox_events",
+    "provider_outbox_dead_letters",
+    "provider_outbox_events_archive",
+    "provider_idempotency_keys",
+    "reservation_addons",
+    "rental_addons",
     "reservations",
 ]
 
@@ -175,6 +183,44 @@ def mysql_test_urls() -> tuple[str, str]:
         _drop_database(sync_url)
 
 
+@pytest.fixture(scope="session")
+def mysql_replica_test_urls() -> tuple[str, str]:
+    """Isolated database on a second MySQL instance used as read replica.
+
+    Tests using it are skipped unless `MYSQL_REPLICA_TEST_DATABASE_URL` is set.
+    """
+    raw_url = os.getenv("MYSQL_REPLICA_TEST_DATABASE_URL")
+    if not raw_url:
+        pytest.skip("MYSQL_REPLICA_TEST_DATABASE_URL is not set.")
+    url = make_url(raw_url)
+    if url.get_backend_name() != "mysql":
+        pytest.fail("Replica test database must use MySQL.")
+    if not (url.database and url.database.endswith("_test")):
+        pytest.fail("MYSQL_REPLICA_TEST_DATABASE_URL database name must end with '_test'.")
+
+    isolated_db = f"{url.database}_{uuid.uuid4().hex[:8]}"[:64]
+    async_url = url.set(database=isolated_db).render_as_string(hide_password=False)
+    sync_url = (
+        url.set(
+            drivername=url.drivername.replace("aiomysql", "pymysql"),
+            database=isolated_db,
+        )
+        .render_as_string(hide_password=False)
+    )
+
+    _ensure_test_database_exists(sync_url)
+    bootstrap_engine = create_engine(sync_url, pool_pre_ping=True)
+    try:
+        SQLModel.metadata.create_all(bootstrap_engine, checkfirst=False)
+    finally:
+        bootstrap_engine.dispose()
+
+    try:
+        yield async_url, sync_url
+    finally:
+        _drop_database(sync_url)
+
+
 @pytest.fixture(scope="session")
 def mysql_sync_engine(mysql_test_urls: tuple[str, str]):
     _, sync_url = mysql_test_urls
@@ -206,3 +252,20 @@ async def mysql_async_session_factory(
         yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
     finally:
         await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def mysql_replica_async_session_factory(
+    mysql_replica_test_urls: tuple[str, str],
+) -> async_sessionmaker[AsyncSession]:
+    async_url, _ = mysql_replica_test_urls
+    engine = create_async_engine(async_url, poolclass=NullPool, pool_pre_ping=False)
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("SET FOREIGN_KEY_CHECKS = 0"))
+            for table in TABLES_TRUNCATE_ORDER:
+                await conn.execute(text(f"TRUNCATE TABLE `{table}`"))
+            await conn.execute(text("SET FOREIGN_KEY_CHECKS = 1"))
+        yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    finally:
+        await engine.dispose()
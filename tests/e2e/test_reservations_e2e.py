@@ -1,4 +1,5 @@
 import asyncio
+import json
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
@@ -11,46 +12,72 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from reservas_api.api.routers.reservations import get_create_reservation_use_case
 from reservas_api.application import CreateReservationUseCase, GenerateReservationCodeUseCase
 from reservas_api.domain import PaymentResult, ProviderResult
-from reservas_api.domain.entities import Reservation
 from reservas_api.infrastructure.db.models import ProviderOutboxEventModel, ReservationModel
 from reservas_api.infrastructure.outbox import OutboxEventProcessor, OutboxEventPublisher
 from reservas_api.infrastructure.repositories import MySQLReservationRepository
 from reservas_api.main import app
+from reservas_api.shared.resilience import Deadline
+
+
+def _reservation_code(body: bytes) -> str:
+    return json.loads(body)["reservation_code"]
 
 
 class AlwaysFailPaymentGateway:
-    async def process_payment(self, reservation: Reservation) -> PaymentResult:
-        raise RuntimeError(f"payment unavailable for {reservation.reservation_code.value}")
+    async def process_payment_request(
+        self,
+        body: bytes,
+        idempotency_key: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> PaymentResult:
+        raise RuntimeError(f"payment unavailable for {_reservation_code(body)}")
 
 
 class AlwaysFailProviderGateway:
-    async def create_booking(self, reservation: Reservation) -> ProviderResult:
-        raise RuntimeError(f"provider unavailable for {reservation.reservation_code.value}")
+    async def create_booking_request(
+        self,
+        body: bytes,
+        supplier_code: str | None = None,
+        idempotency_key: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> ProviderResult:
+        raise RuntimeError(f"provider unavailable for {_reservation_code(body)}")
 
 
 class FailOncePaymentGateway:
     def __init__(self) -> None:
         self.calls = 0
 
-    async def process_payment(self, reservation: Reservation) -> PaymentResult:
+    async def process_payment_request(
+        self,
+        body: bytes,
+        idempotency_key: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> PaymentResult:
         self.calls += 1
         if self.calls == 1:
             raise RuntimeError("temporary payment outage")
-        return PaymentResult(success=True, status="PAID", payload={"code": reservation.reservation_code.value})
+        return PaymentResult(success=True, status="PAID", payload={"code": _reservation_code(body)})
 
 
 class FailOnceProviderGateway:
     def __init__(self) -> None:
         self.calls = 0
 
-    async def create_booking(self, reservation: Reservation) -> ProviderResult:
+    async def create_booking_request(
+        self,
+        body: bytes,
+        supplier_code: str | None = None,
+        idempotency_key: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> ProviderResult:
         self.calls += 1
         if self.calls == 1:
             raise RuntimeError("temporary provider outage")
         return ProviderResult(
             success=True,
             status="CONFIRMED",
-            payload={"code": reservation.reservation_code.value},
+            payload={"code": _reservation_code(body)},
         )
 
 
@@ -159,7 +186,7 @@ async def test_e2e_outbox_marks_events_failed_when_external_gateways_fail(
     statuses = await _load_outbox_statuses(mysql_async_session_factory, reservation_code)
 
     assert processed == 0
-    assert statuses == ["FAILED", "FAILED"]
+    assert statuses == ["FAILED", "PENDING"]
 
 
 @pytest.mark.asyncio
@@ -172,12 +199,14 @@ async def test_e2e_outbox_recovers_automatically_after_transient_failures(
 
     payment_gateway = FailOncePaymentGateway()
     provider_gateway = FailOnceProviderGateway()
+    clock_state = {"now": datetime.now(UTC) + timedelta(seconds=1)}
     processor = OutboxEventProcessor(
         session_factory=mysql_async_session_factory,
         payment_gateway=payment_gateway,
         provider_gateway=provider_gateway,
         poll_interval_seconds=0.05,
         batch_size=10,
+        clock=lambda: clock_state["now"],
     )
 
     for _ in range(12):
@@ -185,6 +214,7 @@ async def test_e2e_outbox_recovers_automatically_after_transient_failures(
         statuses = await _load_outbox_statuses(mysql_async_session_factory, reservation_code)
         if statuses == ["PROCESSED", "PROCESSED"]:
             break
+        clock_state["now"] += timedelta(hours=1)
         await asyncio.sleep(0.02)
 
     statuses = await _load_outbox_statuses(mysql_async_session_factory, reservation_code)
@@ -1,5 +1,9 @@
+from types import SimpleNamespace
+
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from reservas_api.api.routers.health import router as health_router
 from reservas_api.main import app
 
 
@@ -9,3 +13,30 @@ def test_health_check_returns_ok() -> None:
 
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+def test_readiness_reports_warming_until_warmup_opens_db_connections() -> None:
+    application = FastAPI()
+    application.include_router(health_router, prefix="/api/v1")
+    container = SimpleNamespace(
+        ready=False,
+        warmup_status="warming",
+        warmup_connections={"db": 0, "http": 0},
+    )
+    application.state.container = container
+    client = TestClient(application)
+
+    cold = client.get("/api/v1/health/ready")
+    container.warmup_status = "degraded"
+    degraded = client.get("/api/v1/health/ready")
+    container.ready = True
+    container.warmup_status = "ready"
+    container.warmup_connections = {"db": 4, "http": 2}
+    warm = client.get("/api/v1/health/ready")
+
+    assert cold.status_code == 503
+    assert cold.json() == {"status": "warming"}
+    assert degraded.status_code == 503
+    assert degraded.json() == {"status": "degraded"}
+    assert warm.status_code == 200
+    assert warm.json() == {"status": "ready", "warmed_connections": {"db": 4, "http": 2}}
@@ -1,3 +1,5 @@
+import hashlib
+import json
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
@@ -9,58 +11,123 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from reservas_api.domain import DomainEvent, PaymentResult, ProviderResult
 from reservas_api.domain.entities import Reservation
+from reservas_api.domain.enums import ReservationStatus
 from reservas_api.domain.value_objects import ReservationCode
-from reservas_api.infrastructure.db.models import ProviderOutboxEventModel
-from reservas_api.infrastructure.outbox import OutboxEventProcessor, OutboxEventPublisher
+from reservas_api.infrastructure.db.models import (
+    ProviderIdempotencyKeyModel,
+    ProviderOutboxDeadLetterModel,
+    ProviderOutboxEventArchiveModel,
+    ProviderOutboxEventModel,
+    ReservationModel,
+    ReservationProviderRequestModel,
+    ReservationStatusHistoryModel,
+)
+from reservas_api.infrastructure.gateways import ProviderAPIGateway, StripePaymentGateway
+from reservas_api.infrastructure.outbox import (
+    OutboxArchiver,
+    OutboxDeadLetterQueue,
+    OutboxEventProcessor,
+    OutboxEventPublisher,
+    OutboxMetrics,
+    outbox_idempotency_key,
+)
 from reservas_api.infrastructure.repositories import MySQLReservationRepository
+from reservas_api.shared.resilience import Deadline
+
+
+def _reservation_code(body: bytes) -> str:
+    return json.loads(body)["reservation_code"]
 
 
 class ControlledPaymentGateway:
     def __init__(self, failures_before_success: int = 0) -> None:
         self._failures_before_success = failures_before_success
         self.calls = 0
+        self.idempotency_keys: list[str | None] = []
 
     async def process_payment(self, reservation: Reservation) -> PaymentResult:
+        return await self.process_payment_request(StripePaymentGateway.build_request_body(reservation))
+
+    async def process_payment_request(
+        self,
+        body: bytes,
+        idempotency_key: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> PaymentResult:
         self.calls += 1
+        self.idempotency_keys.append(idempotency_key)
         if self.calls <= self._failures_before_success:
             raise RuntimeError("payment gateway unavailable")
-        return PaymentResult(success=True, status="PAID", payload={"reservation": reservation.reservation_code.value})
+        return PaymentResult(success=True, status="PAID", payload={"reservation": _reservation_code(body)})
 
 
 class ControlledProviderGateway:
     def __init__(self, failures_before_success: int = 0) -> None:
         self._failures_before_success = failures_before_success
         self.calls = 0
+        self.idempotency_keys: list[str | None] = []
 
     async def create_booking(self, reservation: Reservation) -> ProviderResult:
+        return await self.create_booking_request(ProviderAPIGateway.build_request_body(reservation))
+
+    async def create_booking_request(
+        self,
+        body: bytes,
+        supplier_code: str | None = None,
+        idempotency_key: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> ProviderResult:
         self.calls += 1
+        self.idempotency_keys.append(idempotency_key)
         if self.calls <= self._failures_before_success:
             raise RuntimeError("provider gateway unavailable")
         return ProviderResult(
             success=True,
             status="CONFIRMED",
-            payload={"reservation": reservation.reservation_code.value},
+            payload={"reservation": _reservation_code(body)},
         )
 
 
 class UnsuccessfulPaymentGateway:
-    async def process_payment(self, reservation: Reservation) -> PaymentResult:
+    async def process_payment_request(
+        self,
+        body: bytes,
+        idempotency_key: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> PaymentResult:
         return PaymentResult(
             success=False,
             status="CIRCUIT_OPEN",
-            payload={"reservation": reservation.reservation_code.value},
+            payload={"reservation": _reservation_code(body)},
         )
 
 
 class UnsuccessfulProviderGateway:
-    async def create_booking(self, reservation: Reservation) -> ProviderResult:
+    async def create_booking_request(
+        self,
+        body: bytes,
+        supplier_code: str | None = None,
+        idempotency_key: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> ProviderResult:
         return ProviderResult(
             success=False,
             status="CIRCUIT_OPEN",
-            payload={"reservation": reservation.reservation_code.value},
+            payload={"reservation": _reservation_code(body)},
         )
 
 
+class ManualClock:
+    def __init__(self) -> None:
+        self.now = datetime.now(UTC) + timedelta(seconds=1)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
 def _build_reservation(code: str = "AB12CD34") -> Reservation:
     pickup = datetime(2026, 10, 1, 10, 0, tzinfo=UTC)
     dropoff = pickup + timedelta(days=2)
@@ -99,6 +166,24 @@ async def test_outbox_publisher_saves_reservation_and_events_atomically(
     assert all(item.status == "PENDING" for item in events)
 
 
+@pytest.mark.asyncio
+async def test_outbox_publisher_signals_commit_only_after_successful_transaction(
+    mysql_async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    notifications: list[str] = []
+    publisher = OutboxEventPublisher(
+        mysql_async_session_factory,
+        on_committed=lambda: notifications.append("committed"),
+    )
+
+    await publisher.save_reservation_with_outbox(_build_reservation("OTBX0006"))
+    assert notifications == ["committed"]
+
+    with pytest.raises(IntegrityError):
+        await publisher.save_reservation_with_outbox(_build_reservation("OTBX0006"))
+    assert notifications == ["committed"]
+
+
 @pytest.mark.asyncio
 async def test_outbox_atomic_transaction_rolls_back_reservation_if_event_insert_fails(
     mysql_async_session_factory: async_sessionmaker[AsyncSession],
@@ -131,27 +216,41 @@ async def test_outbox_processor_retries_failed_events_and_marks_processed_after_
 
     payment_gateway = ControlledPaymentGateway(failures_before_success=1)
     provider_gateway = ControlledProviderGateway(failures_before_success=0)
+    clock = ManualClock()
     processor = OutboxEventProcessor(
         session_factory=mysql_async_session_factory,
         payment_gateway=payment_gateway,
         provider_gateway=provider_gateway,
+        retry_base_delay_seconds=10.0,
+        clock=clock,
     )
 
     first_run_processed = await processor.process_pending_once()
-    assert first_run_processed == 1
+    assert first_run_processed == 0
 
     async with mysql_async_session_factory() as session:
         result = await session.exec(select(ProviderOutboxEventModel))
-        first_statuses = {item.event_type: item.status for item in result.all()}
-    assert first_statuses["PAYMENT_REQUESTED"] == "FAILED"
-    assert first_statuses["BOOKING_REQUESTED"] == "PROCESSED"
-
+        first_events = {item.event_type: item for item in result.all()}
+    assert first_events["PAYMENT_REQUESTED"].status == "FAILED"
+    assert first_events["PAYMENT_REQUESTED"].attempts == 1
+    assert first_events["PAYMENT_REQUESTED"].last_error == "payment gateway unavailable"
+    assert "last_error" not in (first_events["PAYMENT_REQUESTED"].payload or {})
+    assert first_events["BOOKING_REQUESTED"].status == "PENDING"
+    assert first_events["BOOKING_REQUESTED"].attempts == 0
+    assert provider_gateway.calls == 0
+
+    assert await processor.process_pending_once() == 0
+    assert payment_gateway.calls == 1
+
+    clock.advance(60)
     second_run_processed = await processor.process_pending_once()
-    assert second_run_processed == 1
+    assert second_run_processed == 2
 
     async with mysql_async_session_factory() as session:
         result = await session.exec(select(ProviderOutboxEventModel))
-        final_statuses = {item.event_type: item.status for item in result.all()}
+        final_events = list(result.all())
+        final_statuses = {item.event_type: item.status for item in final_events}
+    assert all(item.last_error is None for item in final_events)
     assert final_statuses["PAYMENT_REQUESTED"] == "PROCESSED"
     assert final_statuses["BOOKING_REQUESTED"] == "PROCESSED"
     assert payment_gateway.calls == 2
@@ -180,4 +279,575 @@ async def test_outbox_processor_marks_events_failed_when_gateway_returns_unsucce
         statuses = {item.event_type: item.status for item in result.all()}
 
     assert statuses["PAYMENT_REQUESTED"] == "FAILED"
-    assert statuses["BOOKING_REQUESTED"] == "FAILED"
+    assert statuses["BOOKING_REQUESTED"] == "PENDING"
+
+
+@pytest.mark.asyncio
+async def test_outbox_processor_dead_letters_events_after_max_attempts_and_requeues_them(
+    mysql_async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    reservation = _build_reservation("OTBX0005")
+    publisher = OutboxEventPublisher(mysql_async_session_factory)
+    await publisher.save_reservation_with_outbox(reservation)
+
+    clock = ManualClock()
+    processor = OutboxEventProcessor(
+        session_factory=mysql_async_session_factory,
+        payment_gateway=UnsuccessfulPaymentGateway(),
+        provider_gateway=UnsuccessfulProviderGateway(),
+        max_attempts=2,
+        clock=clock,
+    )
+
+    await processor.process_pending_once()
+    clock.advance(3600)
+    await processor.process_pending_once()
+
+    async with mysql_async_session_factory() as session:
+        remaining = list((await session.exec(select(ProviderOutboxEventModel))).all())
+        dead_letters = list((await session.exec(select(ProviderOutboxDeadLetterModel))).all())
+    assert remaining == []
+    by_type = {item.event_type: item for item in dead_letters}
+    assert by_type["PAYMENT_REQUESTED"].attempts == 2
+    assert "CIRCUIT_OPEN" in (by_type["PAYMENT_REQUESTED"].last_error or "")
+    assert by_type["BOOKING_REQUESTED"].attempts == 0
+    assert by_type["BOOKING_REQUESTED"].last_error == "Payment event was dead-lettered"
+
+    requeued = await OutboxDeadLetterQueue(mysql_async_session_factory).requeue(
+        aggregate_ids=["OTBX0005"]
+    )
+    assert requeued == 2
+
+    async with mysql_async_session_factory() as session:
+        restored = list((await session.exec(select(ProviderOutboxEventModel))).all())
+        dead_letters = list((await session.exec(select(ProviderOutboxDeadLetterModel))).all())
+    assert dead_letters == []
+    assert {item.status for item in restored} == {"PENDING"}
+    assert all(item.attempts == 0 for item in restored)
+
+
+@pytest.mark.asyncio
+async def test_outbox_processor_dispatches_booking_only_after_payment_is_processed(
+    mysql_async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    publisher = OutboxEventPublisher(mysql_async_session_factory)
+    await publisher.save_reservation_with_outbox(_build_reservation("OTBX0007"))
+
+    clock = ManualClock()
+    payment_gateway = ControlledPaymentGateway(failures_before_success=0)
+    provider_gateway = ControlledProviderGateway(failures_before_success=0)
+    processor = OutboxEventProcessor(
+        session_factory=mysql_async_session_factory,
+        payment_gateway=payment_gateway,
+        provider_gateway=provider_gateway,
+        clock=clock,
+    )
+
+    # A batch that only sees the booking must not dispatch it while payment is pending.
+    async with mysql_async_session_factory() as session:
+        async with session.begin():
+            result = await session.exec(
+                select(ProviderOutboxEventModel).where(
+                    ProviderOutboxEventModel.event_type == "PAYMENT_REQUESTED"
+                )
+            )
+            payment_event = result.one()
+            payment_event.next_attempt_at = clock.now + timedelta(minutes=5)
+
+    assert await processor.process_pending_once() == 0
+    assert provider_gateway.calls == 0
+
+    clock.advance(600)
+    assert await processor.process_pending_once() == 2
+    assert payment_gateway.calls == 1
+    assert provider_gateway.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_outbox_processor_records_responses_and_updates_reservation_status(
+    mysql_async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    publisher = OutboxEventPublisher(mysql_async_session_factory)
+    await publisher.save_reservation_with_outbox(_build_reservation("OTBX0008"))
+
+    processor = OutboxEventProcessor(
+        session_factory=mysql_async_session_factory,
+        payment_gateway=ControlledPaymentGateway(),
+        provider_gateway=ControlledProviderGateway(),
+        clock=ManualClock(),
+    )
+
+    assert await processor.process_pending_once() == 2
+
+    async with mysql_async_session_factory() as session:
+        reservation = (
+            await session.exec(
+                select(ReservationModel).where(ReservationModel.reservation_code == "OTBX0008")
+            )
+        ).one()
+        requests = list((await session.exec(select(ReservationProviderRequestModel))).all())
+        history = list((await session.exec(select(ReservationStatusHistoryModel))).all())
+
+    assert reservation.status == ReservationStatus.SUPPLIER_CONFIRMED
+    assert {(item.request_type, item.provider_code, item.status) for item in requests} == {
+        ("PAYMENT", "STRIPE", "SUCCESS"),
+        ("BOOKING", "SUP001", "SUCCESS"),
+    }
+    assert [item.to_status for item in sorted(history, key=lambda item: item.id)] == [
+        ReservationStatus.PAID,
+        ReservationStatus.SUPPLIER_CONFIRMED,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_outbox_archiver_moves_only_expired_processed_events(
+    mysql_async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    now = datetime.now(UTC)
+    async with mysql_async_session_factory() as session:
+        async with session.begin():
+            session.add_all(
+                [
+                    ProviderOutboxEventModel(
+                        aggregate_id=f"ARCH000{index}",
+                        event_type="PAYMENT_REQUESTED",
+                        payload={},
+                        status=status,
+                        next_attempt_at=now - timedelta(days=age_days),
+                    )
+                    for index, (status, age_days) in enumerate(
+                        [("PROCESSED", 10), ("PROCESSED", 9), ("PROCESSED", 1), ("FAILED", 10)]
+                    )
+                ]
+            )
+
+    archiver = OutboxArchiver(
+        mysql_async_session_factory,
+        retention_seconds=7 * 24 * 3600,
+        batch_size=1,
+        clock=lambda: now,
+    )
+    assert await archiver.archive_pending() == 2
+
+    async with mysql_async_session_factory() as session:
+        hot = list((await session.exec(select(ProviderOutboxEventModel))).all())
+        archived = list((await session.exec(select(ProviderOutboxEventArchiveModel))).all())
+    assert sorted(item.aggregate_id for item in hot) == ["ARCH0002", "ARCH0003"]
+    assert sorted(item.aggregate_id for item in archived) == ["ARCH0000", "ARCH0001"]
+    assert {item.status for item in archived} == {"PROCESSED"}
+
+
+@pytest.mark.asyncio
+async def test_outbox_processor_records_dispatch_metrics_and_backlog(
+    mysql_async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    publisher = OutboxEventPublisher(mysql_async_session_factory)
+    await publisher.save_reservation_with_outbox(_build_reservation("OTBX0009"))
+
+    metrics = OutboxMetrics()
+    processor = OutboxEventProcessor(
+        session_factory=mysql_async_session_factory,
+        payment_gateway=UnsuccessfulPaymentGateway(),
+        provider_gateway=ControlledProviderGateway(),
+        clock=ManualClock(),
+        metrics=metrics,
+    )
+
+    await processor.process_pending_once()
+    snapshot = metrics.snapshot()
+
+    assert snapshot["backlog"]["pending"] == 1
+    assert snapshot["backlog"]["failed"] == 1
+    assert snapshot["backlog"]["oldest_pending_age_seconds"] is not None
+    assert {(item["event_type"], item["outcome"]) for item in snapshot["throughput"]} == {
+        ("PAYMENT_REQUESTED", "failed"),
+        ("BOOKING_REQUESTED", "deferred"),
+    }
+    assert snapshot["dispatch_latency"]["PAYMENT_REQUESTED"]["count"] == 1
+    assert "BOOKING_REQUESTED" not in snapshot["dispatch_latency"]
+
+
+@pytest.mark.asyncio
+async def test_outbox_processor_shards_split_events_by_aggregate(
+    mysql_async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    publisher = OutboxEventPublisher(mysql_async_session_factory)
+    codes = [f"SHRD000{index}" for index in range(6)]
+    for code in codes:
+        await publisher.save_reservation_with_outbox(_build_reservation(code))
+
+    clock = ManualClock()
+    handled: dict[int, set[str]] = {}
+    for shard_index in range(2):
+        payment_gateway = ControlledPaymentGateway()
+        processor = OutboxEventProcessor(
+            session_factory=mysql_async_session_factory,
+            payment_gateway=payment_gateway,
+            provider_gateway=ControlledProviderGateway(),
+            clock=clock,
+            shard_index=shard_index,
+            shard_count=2,
+        )
+        processed = await processor.process_pending_once(limit=100)
+        async with mysql_async_session_factory() as session:
+            result = await session.exec(
+                select(ProviderOutboxEventModel.aggregate_id).where(
+                    ProviderOutboxEventModel.status == "PROCESSED"
+                )
+            )
+            handled[shard_index] = set(result.all()) - set().union(*handled.values())
+        assert processed == 2 * len(handled[shard_index])
+        assert payment_gateway.calls == len(handled[shard_index])
+
+    assert handled[0].isdisjoint(handled[1])
+    assert handled[0] | handled[1] == set(codes)
+
+
+@pytest.mark.asyncio
+async def test_outbox_publisher_stores_encoded_gateway_request_bodies(
+    mysql_async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    reservation = _build_reservation("OTBX0010")
+    publisher = OutboxEventPublisher(mysql_async_session_factory)
+    await publisher.save_reservation_with_outbox(reservation)
+
+    async with mysql_async_session_factory() as session:
+        result = await session.exec(select(ProviderOutboxEventModel))
+        bodies = {item.event_type: item.request_body for item in result.all()}
+
+    assert bodies["PAYMENT_REQUESTED"] == StripePaymentGateway.build_request_body(reservation)
+    assert bodies["BOOKING_REQUESTED"] == ProviderAPIGateway.build_request_body(reservation)
+
+
+@pytest.mark.asyncio
+async def test_outbox_processor_rebuilds_request_for_events_without_stored_body(
+    mysql_async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    reservation = _build_reservation("OTBX0011")
+    repository = MySQLReservationRepository(mysql_async_session_factory)
+    await repository.save(reservation)
+    legacy_events = [
+        DomainEvent(event_type=event.event_type, aggregate_id=event.aggregate_id, payload=event.payload)
+        for event in OutboxEventPublisher.build_reservation_events(reservation)
+    ]
+    await OutboxEventPublisher(mysql_async_session_factory).publish_many(legacy_events)
+
+    payment_gateway = ControlledPaymentGateway()
+    provider_gateway = ControlledProviderGateway()
+    processor = OutboxEventProcessor(
+        session_factory=mysql_async_session_factory,
+        payment_gateway=payment_gateway,
+        provider_gateway=provider_gateway,
+        clock=ManualClock(),
+    )
+
+    assert await processor.process_pending_once() == 2
+    assert payment_gateway.calls == 1
+    assert provider_gateway.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_outbox_processor_reuses_idempotency_key_across_retries_and_records_it(
+    mysql_async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    reservation = _build_reservation("OTBX0012")
+    await OutboxEventPublisher(mysql_async_session_factory).save_reservation_with_outbox(reservation)
+
+    payment_gateway = ControlledPaymentGateway(failures_before_success=1)
+    provider_gateway = ControlledProviderGateway()
+    clock = ManualClock()
+    processor = OutboxEventProcessor(
+        session_factory=mysql_async_session_factory,
+        payment_gateway=payment_gateway,
+        provider_gateway=provider_gateway,
+        retry_base_delay_seconds=10.0,
+        clock=clock,
+    )
+
+    assert await processor.process_pending_once() == 0
+    clock.advance(60)
+    assert await processor.process_pending_once() == 2
+
+    async with mysql_async_session_factory() as session:
+        result = await session.exec(select(ProviderOutboxEventModel))
+        events = {item.event_type: item for item in result.all()}
+        result = await session.exec(select(ProviderIdempotencyKeyModel))
+        keys = {item.idem_key: item for item in result.all()}
+
+    payment_event = events["PAYMENT_REQUESTED"]
+    payment_key = outbox_idempotency_key("PAYMENT_REQUESTED", "OTBX0012", payment_event.id)
+    booking_key = outbox_idempotency_key(
+        "BOOKING_REQUESTED", "OTBX0012", events["BOOKING_REQUESTED"].id
+    )
+    assert payment_gateway.idempotency_keys == [payment_key, payment_key]
+    assert provider_gateway.idempotency_keys == [booking_key]
+    assert set(keys) == {payment_key, booking_key}
+    assert keys[payment_key].status == "PAID"
+    assert keys[payment_key].request_hash == hashlib.sha256(payment_event.request_body).hexdigest()
+    assert keys[payment_key].response_body == {"reservation": "OTBX0012"}
+    assert keys[booking_key].status == "CONFIRMED"
+
+
+class ConcurrentSweepPaymentGateway(ControlledPaymentGateway):
+    """Runs another processor's sweep while this processor is mid-dispatch."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.other_processor: OutboxEventProcessor | None = None
+        self.other_processed: int | None = None
+
+    async def process_payment_request(
+        self,
+        body: bytes,
+        idempotency_key: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> PaymentResult:
+        if self.other_processor is not None and self.other_processed is None:
+            self.other_processed = await self.other_processor.process_pending_once()
+        return await super().process_payment_request(body, idempotency_key, deadline)
+
+
+@pytest.mark.asyncio
+async def test_outbox_processor_claims_batch_so_concurrent_processors_skip_it(
+    mysql_async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    await OutboxEventPublisher(mysql_async_session_factory).save_reservation_with_outbox(
+        _build_reservation("OTBX0013")
+    )
+
+    clock = ManualClock()
+    payment_gateway = ConcurrentSweepPaymentGateway()
+    provider_gateway = ControlledProviderGateway()
+    other_payment_gateway = ControlledPaymentGateway()
+    other_provider_gateway = ControlledProviderGateway()
+    processor = OutboxEventProcessor(
+        session_factory=mysql_async_session_factory,
+        payment_gateway=payment_gateway,
+        provider_gateway=provider_gateway,
+        clock=clock,
+    )
+    payment_gateway.other_processor = OutboxEventProcessor(
+        session_factory=mysql_async_session_factory,
+        payment_gateway=other_payment_gateway,
+        provider_gateway=other_provider_gateway,
+        clock=clock,
+    )
+
+    assert await processor.process_pending_once() == 2
+    assert payment_gateway.other_processed == 0
+    assert other_payment_gateway.calls == 0
+    assert other_provider_gateway.calls == 0
+    assert payment_gateway.calls == 1
+    assert provider_gateway.calls == 1
+
+    async with mysql_async_session_factory() as session:
+        result = await session.exec(select(ProviderOutboxEventModel))
+        events = list(result.all())
+    assert {item.status for item in events} == {"PROCESSED"}
+    assert all(item.locked_by is None and item.locked_until is None for item in events)
+
+
+@pytest.mark.asyncio
+async def test_outbox_processor_skips_acks_for_events_claimed_again_after_lease_expiry(
+    mysql_async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    await OutboxEventPublisher(mysql_async_session_factory).save_reservation_with_outbox(
+        _build_reservation("OTBX0014")
+    )
+
+    clock = ManualClock()
+
+    class SlowFailingPaymentGateway(ConcurrentSweepPaymentGateway):
+        async def process_payment_request(
+            self,
+            body: bytes,
+            idempotency_key: str | None = None,
+            deadline: Deadline | None = None,
+        ) -> PaymentResult:
+            clock.advance(120)
+            if self.other_processor is not None:
+                self.other_processed = await self.other_processor.process_pending_once()
+            raise RuntimeError("payment gateway timed out")
+
+    payment_gateway = SlowFailingPaymentGateway()
+    processor = OutboxEventProcessor(
+        session_factory=mysql_async_session_factory,
+        payment_gateway=payment_gateway,
+        provider_gateway=ControlledProviderGateway(),
+        clock=clock,
+        claim_lease_seconds=60.0,
+    )
+    payment_gateway.other_processor = OutboxEventProcessor(
+        session_factory=mysql_async_session_factory,
+        payment_gateway=ControlledPaymentGateway(),
+        provider_gateway=ControlledProviderGateway(),
+        clock=clock,
+    )
+
+    assert await processor.process_pending_once() == 0
+    assert payment_gateway.other_processed == 2
+
+    async with mysql_async_session_factory() as session:
+        result = await session.exec(select(ProviderOutboxEventModel))
+        events = list(result.all())
+    assert {item.status for item in events} == {"PROCESSED"}
+    assert all(item.attempts == 0 and item.last_error is None for item in events)
+
+
+@pytest.mark.asyncio
+async def test_outbox_processor_renews_the_lease_when_it_would_expire_mid_batch(
+    mysql_async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    await OutboxEventPublisher(mysql_async_session_factory).save_reservation_with_outbox(
+        _build_reservation("OTBX0017")
+    )
+
+    clock = ManualClock()
+
+    class SlowPaymentGateway(ControlledPaymentGateway):
+        async def process_payment_request(
+            self,
+            body: bytes,
+            idempotency_key: str | None = None,
+            deadline: Deadline | None = None,
+        ) -> PaymentResult:
+            clock.advance(40)
+            return await super().process_payment_request(body, idempotency_key, deadline)
+
+    class SlowSweepingProviderGateway(ControlledProviderGateway):
+        other_processor: OutboxEventProcessor | None = None
+        other_processed: int | None = None
+
+        async def create_booking_request(
+            self,
+            body: bytes,
+            supplier_code: str | None = None,
+            idempotency_key: str | None = None,
+            deadline: Deadline | None = None,
+        ) -> ProviderResult:
+            # Past the lease taken at claim time, but within the renewed one.
+            clock.advance(40)
+            if self.other_processor is not None:
+                self.other_processed = await self.other_processor.process_pending_once()
+            return await super().create_booking_request(
+                body, supplier_code, idempotency_key, deadline
+            )
+
+    provider_gateway = SlowSweepingProviderGateway()
+    other_payment_gateway = ControlledPaymentGateway()
+    other_provider_gateway = ControlledProviderGateway()
+    processor = OutboxEventProcessor(
+        session_factory=mysql_async_session_factory,
+        payment_gateway=SlowPaymentGateway(),
+        provider_gateway=provider_gateway,
+        clock=clock,
+        claim_lease_seconds=60.0,
+    )
+    provider_gateway.other_processor = OutboxEventProcessor(
+        session_factory=mysql_async_session_factory,
+        payment_gateway=other_payment_gateway,
+        provider_gateway=other_provider_gateway,
+        clock=clock,
+    )
+
+    assert await processor.process_pending_once() == 2
+    assert provider_gateway.other_processed == 0
+    assert other_payment_gateway.calls == 0
+    assert other_provider_gateway.calls == 0
+
+    async with mysql_async_session_factory() as session:
+        result = await session.exec(select(ProviderOutboxEventModel))
+        events = list(result.all())
+    assert {item.status for item in events} == {"PROCESSED"}
+
+
+@pytest.mark.asyncio
+async def test_outbox_processor_defers_booking_until_the_payment_retry(
+    mysql_async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    await OutboxEventPublisher(mysql_async_session_factory).save_reservation_with_outbox(
+        _build_reservation("OTBX0015")
+    )
+
+    clock = ManualClock()
+    payment_retry_at = clock.now + timedelta(minutes=15)
+    async with mysql_async_session_factory() as session:
+        async with session.begin():
+            result = await session.exec(
+                select(ProviderOutboxEventModel).where(
+                    ProviderOutboxEventModel.event_type == "PAYMENT_REQUESTED"
+                )
+            )
+            payment_event = result.one()
+            payment_event.status = "FAILED"
+            payment_event.attempts = 4
+            payment_event.next_attempt_at = payment_retry_at
+
+    provider_gateway = ControlledProviderGateway()
+    processor = OutboxEventProcessor(
+        session_factory=mysql_async_session_factory,
+        payment_gateway=ControlledPaymentGateway(),
+        provider_gateway=provider_gateway,
+        retry_base_delay_seconds=5.0,
+        clock=clock,
+    )
+
+    assert await processor.process_pending_once() == 0
+    assert provider_gateway.calls == 0
+
+    async with mysql_async_session_factory() as session:
+        result = await session.exec(
+            select(ProviderOutboxEventModel).where(
+                ProviderOutboxEventModel.event_type == "BOOKING_REQUESTED"
+            )
+        )
+        booking_event = result.one()
+    assert booking_event.status == "PENDING"
+    assert booking_event.attempts == 0
+    assert booking_event.next_attempt_at.replace(tzinfo=UTC) == payment_retry_at
+
+    clock.advance(60)
+    assert await processor.process_pending_once() == 0
+    assert provider_gateway.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_outbox_processor_acks_batch_when_a_status_update_fails(
+    mysql_async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    await OutboxEventPublisher(mysql_async_session_factory).save_reservation_with_outbox(
+        _build_reservation("OTBX0016")
+    )
+    async with mysql_async_session_factory() as session:
+        async with session.begin():
+            session.add(
+                ProviderOutboxEventModel(
+                    aggregate_id="not-a-code",
+                    event_type="PAYMENT_REQUESTED",
+                    payload={"reservation": {}},
+                    request_body=json.dumps({"reservation_code": "not-a-code"}).encode(),
+                )
+            )
+
+    payment_gateway = ControlledPaymentGateway()
+    processor = OutboxEventProcessor(
+        session_factory=mysql_async_session_factory,
+        payment_gateway=payment_gateway,
+        provider_gateway=ControlledProviderGateway(),
+        clock=ManualClock(),
+    )
+
+    assert await processor.process_pending_once() == 3
+    assert payment_gateway.calls == 2
+
+    async with mysql_async_session_factory() as session:
+        events = list((await session.exec(select(ProviderOutboxEventModel))).all())
+        keys = list((await session.exec(select(ProviderIdempotencyKeyModel))).all())
+        reservation = (
+            await session.exec(
+                select(ReservationModel).where(ReservationModel.reservation_code == "OTBX0016")
+            )
+        ).one()
+    assert {item.status for item in events} == {"PROCESSED"}
+    assert len(keys) == 3
+    assert reservation.status == ReservationStatus.SUPPLIER_CONFIRMED.value
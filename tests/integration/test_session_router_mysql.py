@@ -0,0 +1,130 @@
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from reservas_api.domain.entities import Reservation
+from reservas_api.domain.enums import ReservationStatus
+from reservas_api.domain.value_objects import ReservationCode
+from reservas_api.infrastructure.db import SessionRouter
+from reservas_api.infrastructure.repositories import (
+    MySQLReservationRepository,
+    MySQLReservationStatusStore,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _build_reservation(code: str) -> Reservation:
+    pickup = datetime(2026, 4, 1, 10, 0, tzinfo=UTC)
+    return Reservation(
+        reservation_code=ReservationCode(code),
+        supplier_code="SUP-A",
+        pickup_office_code="MAD-01",
+        dropoff_office_code="MAD-02",
+        pickup_datetime=pickup,
+        dropoff_datetime=pickup + timedelta(days=2),
+        total_amount=Decimal("180.00"),
+        customer_snapshot={"first_name": "Ada", "email": "ada@example.com"},
+        vehicle_snapshot={"vehicle_code": "VH001"},
+    )
+
+
+def _router(
+    primary: async_sessionmaker[AsyncSession],
+    replica: async_sessionmaker[AsyncSession],
+    clock: FakeClock,
+    lag_seconds: float | None,
+) -> SessionRouter:
+    async def probe(_: AsyncSession) -> float | None:
+        return lag_seconds
+
+    return SessionRouter(
+        primary,
+        replica,
+        max_replica_lag_seconds=1.0,
+        read_your_writes_seconds=5.0,
+        lag_probe=probe,
+        time_provider=clock,
+    )
+
+
+@pytest.mark.asyncio
+async def test_find_by_code_reads_own_writes_from_primary_then_uses_replica(
+    mysql_async_session_factory: async_sessionmaker[AsyncSession],
+    mysql_replica_async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    clock = FakeClock()
+    router = _router(
+        mysql_async_session_factory,
+        mysql_replica_async_session_factory,
+        clock,
+        lag_seconds=0.0,
+    )
+    repository = MySQLReservationRepository(mysql_async_session_factory, router)
+    await repository.save(_build_reservation("RP12LC34"))
+
+    assert await repository.find_by_code(ReservationCode("RP12LC34")) is not None
+
+    # The second instance does not replicate here, so a replica read misses the row.
+    clock.now += 10
+    assert await repository.find_by_code(ReservationCode("RP12LC34")) is None
+    assert router.primary_reads == 1
+    assert router.replica_reads == 1
+
+
+@pytest.mark.asyncio
+async def test_find_by_code_falls_back_to_primary_when_replica_lags(
+    mysql_async_session_factory: async_sessionmaker[AsyncSession],
+    mysql_replica_async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    clock = FakeClock()
+    router = _router(
+        mysql_async_session_factory,
+        mysql_replica_async_session_factory,
+        clock,
+        lag_seconds=30.0,
+    )
+    await MySQLReservationRepository(mysql_async_session_factory).save(
+        _build_reservation("RP56LG78")
+    )
+    repository = MySQLReservationRepository(mysql_async_session_factory, router)
+
+    assert await repository.find_by_code(ReservationCode("RP56LG78")) is not None
+    assert router.replica_lag_seconds == 30.0
+    assert router.replica_reads == 0
+
+
+@pytest.mark.asyncio
+async def test_status_store_reads_the_primary_even_when_the_replica_is_stale(
+    mysql_async_session_factory: async_sessionmaker[AsyncSession],
+    mysql_replica_async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    clock = FakeClock()
+    router = _router(
+        mysql_async_session_factory,
+        mysql_replica_async_session_factory,
+        clock,
+        lag_seconds=0.0,
+    )
+    code = ReservationCode("RP90ST12")
+    # Another process moved the reservation on; the replica still holds the old status.
+    await MySQLReservationRepository(mysql_replica_async_session_factory).save(
+        _build_reservation(code.value)
+    )
+    primary_repository = MySQLReservationRepository(mysql_async_session_factory)
+    await primary_repository.save(_build_reservation(code.value))
+    await primary_repository.update_status(code, ReservationStatus.PAID)
+    store = MySQLReservationStatusStore(mysql_async_session_factory, session_router=router)
+
+    assert await store.get_status(code) == ReservationStatus.PAID
+    assert await store.has_successful_request(code, "PAYMENT") is False
+    assert router.replica_reads == 0
@@ -0,0 +1,163 @@
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from reservas_api.application.use_cases import (
+    AddonItem,
+    CreateReservationRequest,
+    CreateReservationUseCase,
+    GenerateReservationCodeUseCase,
+)
+from reservas_api.domain import DomainEvent
+from reservas_api.domain.enums import AddonCategory
+from reservas_api.infrastructure.db.models import (
+    ProviderOutboxEventModel,
+    RentalAddonModel,
+    ReservationAddonModel,
+    ReservationModel,
+)
+from reservas_api.infrastructure.outbox import OutboxEventPublisher
+from reservas_api.infrastructure.repositories import MySQLReservationRepository
+from reservas_api.infrastructure.unit_of_work import SQLUnitOfWork
+
+
+def _build_request(addons: list[AddonItem] | None = None) -> CreateReservationRequest:
+    pickup = datetime(2026, 4, 1, 10, 0, tzinfo=UTC)
+    return CreateReservationRequest(
+        supplier_code="SUP01",
+        pickup_office_code="OFF001",
+        dropoff_office_code="OFF002",
+        pickup_datetime=pickup,
+        dropoff_datetime=pickup + timedelta(days=2),
+        total_amount=Decimal("180.50"),
+        customer={"first_name": "Ana", "last_name": "Perez", "email": "ana@example.com"},
+        vehicle={"vehicle_code": "VH001", "model": "Corolla", "category": "Economy"},
+        addons=addons or [],
+    )
+
+
+def _build_use_case(
+    session_factory: async_sessionmaker[AsyncSession],
+    on_committed=None,
+    code: str = "UW12AB34",
+    read_session_factory: async_sessionmaker[AsyncSession] | None = None,
+) -> CreateReservationUseCase:
+    return CreateReservationUseCase(
+        generate_code_use_case=GenerateReservationCodeUseCase(
+            repository=MySQLReservationRepository(session_factory),
+            code_generator=lambda: code,
+        ),
+        outbox_writer=OutboxEventPublisher(session_factory),
+        unit_of_work_factory=lambda: SQLUnitOfWork(
+            session_factory,
+            on_committed=on_committed,
+            read_session_factory=read_session_factory,
+        ),
+    )
+
+
+def _count_checkouts(session_factory: async_sessionmaker[AsyncSession]) -> list[object]:
+    checkouts: list[object] = []
+    engine = session_factory.kw["bind"]
+    event.listen(engine.sync_engine, "checkout", lambda *_: checkouts.append(object()))
+    return checkouts
+
+
+@pytest.mark.asyncio
+async def test_create_reservation_checks_out_one_connection_per_request(
+    mysql_async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    checkouts = _count_checkouts(mysql_async_session_factory)
+    commits: list[bool] = []
+    use_case = _build_use_case(
+        mysql_async_session_factory,
+        on_committed=lambda: commits.append(True),
+    )
+
+    created = await use_case.execute(_build_request())
+
+    assert len(checkouts) == 1
+    assert commits == [True]
+    assert created.reservation_code.value == "UW12AB34"
+    async with mysql_async_session_factory() as session:
+        reservations = (await session.exec(select(ReservationModel))).all()
+        events = (await session.exec(select(ProviderOutboxEventModel))).all()
+    assert [reservation.reservation_code for reservation in reservations] == ["UW12AB34"]
+    assert {outbox_event.event_type for outbox_event in events} == {
+        "PAYMENT_REQUESTED",
+        "BOOKING_REQUESTED",
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("addons", "expected_read_checkouts"),
+    [
+        ([], 0),
+        ([AddonItem(addon_code="UWG", quantity=2, unit_price=Decimal("5.00"))], 1),
+    ],
+)
+async def test_create_reservation_bounds_checkouts_per_pool(
+    mysql_async_session_factory: async_sessionmaker[AsyncSession],
+    addons: list[AddonItem],
+    expected_read_checkouts: int,
+) -> None:
+    async with mysql_async_session_factory() as session:
+        async with session.begin():
+            session.add(RentalAddonModel(code="UWG", name="GPS", category=AddonCategory.EQUIPMENT))
+    # A separate engine on the same database stands in for the `api_read` pool.
+    read_engine = create_async_engine(
+        mysql_async_session_factory.kw["bind"].url,
+        poolclass=NullPool,
+    )
+    read_session_factory = async_sessionmaker(
+        read_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    write_checkouts = _count_checkouts(mysql_async_session_factory)
+    read_checkouts = _count_checkouts(read_session_factory)
+    try:
+        created = await _build_use_case(
+            mysql_async_session_factory,
+            read_session_factory=read_session_factory,
+        ).execute(_build_request(addons))
+    finally:
+        await read_engine.dispose()
+
+    # The transaction takes one write connection; only the catalog read uses the read pool.
+    assert len(write_checkouts) == 1
+    assert len(read_checkouts) == expected_read_checkouts
+    assert [addon.addon_name_snapshot for addon in created.addons] == ["GPS" for _ in addons]
+    async with mysql_async_session_factory() as session:
+        stored_addons = (await session.exec(select(ReservationAddonModel))).all()
+    assert [(addon.addon_code, addon.total_price) for addon in stored_addons] == [
+        ("UWG", Decimal("10.00")) for _ in addons
+    ]
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_rolls_back_when_left_without_commit(
+    mysql_async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    commits: list[bool] = []
+    unit_of_work = SQLUnitOfWork(
+        mysql_async_session_factory,
+        on_committed=lambda: commits.append(True),
+    )
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async with unit_of_work:
+            await unit_of_work.outbox_writer.publish_many(
+                [DomainEvent(event_type="PAYMENT_REQUESTED", aggregate_id="UW99ROLL", payload={})]
+            )
+            raise RuntimeError("boom")
+
+    assert commits == []
+    async with mysql_async_session_factory() as session:
+        events = (await session.exec(select(ProviderOutboxEventModel))).all()
+    assert events == []
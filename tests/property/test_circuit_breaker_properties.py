@@ -8,6 +8,7 @@ from reservas_api.infrastructure.resilience import (
     CircuitBreaker,
     CircuitBreakerOpenError,
     CircuitState,
+    SlidingWindowCircuitBreaker,
 )
 
 
@@ -45,3 +46,45 @@ def test_property_20_circuit_breaker_opens_after_repeated_failures(
     asyncio.run(run_scenario())
     assert executions == failure_threshold
 
+
+
+@settings(max_examples=50, deadline=None)
+@given(
+    failure_threshold=st.integers(min_value=1, max_value=20),
+    successes=st.integers(min_value=0, max_value=20),
+)
+def test_property_20_sliding_window_breaker_opens_at_failure_rate(
+    failure_threshold: int,
+    successes: int,
+) -> None:
+    """
+    Feature: reservas-api, Property 20: Circuit breaker abre despues de fallos repetidos
+    Validates: Requirements 10.5
+    """
+    breaker = SlidingWindowCircuitBreaker(
+        failure_threshold=failure_threshold,
+        failure_rate_threshold=0.5,
+        window_seconds=60.0,
+        recovery_timeout_seconds=60.0,
+    )
+
+    async def ok_call() -> None:
+        return None
+
+    async def failing_call() -> None:
+        raise RuntimeError("external service failed")
+
+    async def run_scenario() -> None:
+        for _ in range(successes):
+            await breaker.call(ok_call)
+        failures = 0
+        while breaker.state == CircuitState.CLOSED:
+            with pytest.raises(RuntimeError):
+                await breaker.call(failing_call)
+            failures += 1
+
+        assert failures == max(failure_threshold, successes)
+        with pytest.raises(CircuitBreakerOpenError):
+            await breaker.call(failing_call)
+
+    asyncio.run(run_scenario())
@@ -1,4 +1,5 @@
 import asyncio
+import json
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
@@ -15,21 +16,30 @@ from reservas_api.application.use_cases import (
     GenerateReservationCodeUseCase,
 )
 from reservas_api.domain import PaymentResult, ProviderResult
-from reservas_api.domain.entities import Reservation
 from reservas_api.infrastructure.outbox import OutboxEventProcessor, OutboxEventPublisher
 from reservas_api.infrastructure.repositories import MySQLReservationRepository
+from reservas_api.shared.resilience import Deadline
+
+
+def _reservation_code(body: bytes) -> str:
+    return json.loads(body)["reservation_code"]
 
 
 class SpyPaymentGateway:
     def __init__(self) -> None:
         self.calls = 0
 
-    async def process_payment(self, reservation: Reservation) -> PaymentResult:
+    async def process_payment_request(
+        self,
+        body: bytes,
+        idempotency_key: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> PaymentResult:
         self.calls += 1
         return PaymentResult(
             success=True,
             status="PAID",
-            payload={"reservation_code": reservation.reservation_code.value},
+            payload={"reservation_code": _reservation_code(body)},
         )
 
 
@@ -37,12 +47,18 @@ class SpyProviderGateway:
     def __init__(self) -> None:
         self.calls = 0
 
-    async def create_booking(self, reservation: Reservation) -> ProviderResult:
+    async def create_booking_request(
+        self,
+        body: bytes,
+        supplier_code: str | None = None,
+        idempotency_key: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> ProviderResult:
         self.calls += 1
         return ProviderResult(
             success=True,
             status="CONFIRMED",
-            payload={"reservation_code": reservation.reservation_code.value},
+            payload={"reservation_code": _reservation_code(body)},
         )
 
 
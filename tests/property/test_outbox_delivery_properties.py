@@ -1,4 +1,5 @@
 import asyncio
+import json
 import uuid
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
@@ -17,6 +18,11 @@ from reservas_api.domain.value_objects import ReservationCode
 from reservas_api.infrastructure.db.models import ProviderOutboxEventModel
 from reservas_api.infrastructure.outbox import OutboxEventProcessor, OutboxEventPublisher
 from reservas_api.infrastructure.repositories import MySQLReservationRepository
+from reservas_api.shared.resilience import Deadline
+
+
+def _reservation_code(body: bytes) -> str:
+    return json.loads(body)["reservation_code"]
 
 
 class ControlledPaymentGateway:
@@ -24,11 +30,16 @@ class ControlledPaymentGateway:
         self._failures_before_success = failures_before_success
         self.calls = 0
 
-    async def process_payment(self, reservation: Reservation) -> PaymentResult:
+    async def process_payment_request(
+        self,
+        body: bytes,
+        idempotency_key: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> PaymentResult:
         self.calls += 1
         if self.calls <= self._failures_before_success:
             raise RuntimeError("payment gateway unavailable")
-        return PaymentResult(success=True, status="PAID", payload={"reservation": reservation.reservation_code.value})
+        return PaymentResult(success=True, status="PAID", payload={"reservation": _reservation_code(body)})
 
 
 class ControlledProviderGateway:
@@ -36,14 +47,20 @@ class ControlledProviderGateway:
         self._failures_before_success = failures_before_success
         self.calls = 0
 
-    async def create_booking(self, reservation: Reservation) -> ProviderResult:
+    async def create_booking_request(
+        self,
+        body: bytes,
+        supplier_code: str | None = None,
+        idempotency_key: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> ProviderResult:
         self.calls += 1
         if self.calls <= self._failures_before_success:
             raise RuntimeError("provider gateway unavailable")
         return ProviderResult(
             success=True,
             status="CONFIRMED",
-            payload={"reservation": reservation.reservation_code.value},
+            payload={"reservation": _reservation_code(body)},
         )
 
 
@@ -139,14 +156,17 @@ def test_property_21_pending_reservations_processed_when_service_recovers(
             publisher = OutboxEventPublisher(session_factory)
             await publisher.save_reservation_with_outbox(reservation)
 
+            clock_state = {"now": datetime.now(UTC) + timedelta(seconds=1)}
             processor = OutboxEventProcessor(
                 session_factory=session_factory,
                 payment_gateway=ControlledPaymentGateway(failures_before_success=failure_attempts),
                 provider_gateway=ControlledProviderGateway(failures_before_success=0),
+                clock=lambda: clock_state["now"],
             )
 
             for _ in range(failure_attempts + 2):
                 await processor.process_pending_once()
+                clock_state["now"] += timedelta(hours=1)
 
             async with session_factory() as session:
                 result = await session.exec(select(ProviderOutboxEventModel))
@@ -8,6 +8,8 @@ def test_create_app_registers_health_and_reservations_routes() -> None:
     route_paths = {route.path for route in application.routes}
 
     assert "/api/v1/health" in route_paths
+    assert "/api/v1/health/ready" in route_paths
+    assert "/api/v1/metrics" in route_paths
     assert "/api/v1/reservations" in route_paths
 
 
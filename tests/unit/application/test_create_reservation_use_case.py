@@ -1,9 +1,12 @@
+import asyncio
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
+from typing import Self
 
 import pytest
 
 from reservas_api.application.use_cases import (
+    AddonItem,
     CreateReservationPersistenceError,
     CreateReservationRequest,
     CreateReservationUseCase,
@@ -48,6 +51,61 @@ class FailingOutboxWriter:
         raise RuntimeError("database unavailable")
 
 
+class RecordingGenerateReservationCodeUseCase:
+    def __init__(self) -> None:
+        self.repositories: list[object] = []
+
+    async def execute(self, repository=None) -> ReservationCode:
+        self.repositories.append(repository)
+        return ReservationCode("UW12AB34")
+
+
+class FakeUnitOfWork:
+    def __init__(self, outbox_writer) -> None:
+        self.reservations = object()
+        self.addon_catalog = None
+        self.outbox_writer = outbox_writer
+        self.events: list[str] = []
+
+    async def __aenter__(self) -> Self:
+        self.events.append("enter")
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback) -> None:
+        self.events.append("exit")
+
+    async def commit(self) -> None:
+        self.events.append("commit")
+
+
+class BlockingGenerateReservationCodeUseCase:
+    def __init__(self, started: asyncio.Event, release: asyncio.Event) -> None:
+        self._started = started
+        self._release = release
+        self.cancelled = False
+
+    async def execute(self, repository=None) -> ReservationCode:
+        self._started.set()
+        try:
+            await self._release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return ReservationCode("AB12CD34")
+
+
+class WaitingAddonCatalog:
+    def __init__(self, wait_for: asyncio.Event, started: asyncio.Event | None = None) -> None:
+        self._wait_for = wait_for
+        self._started = started
+
+    async def get_active_addons_by_codes(self, codes: list[str]) -> dict[str, dict[str, str]]:
+        if self._started is not None:
+            self._started.set()
+        await self._wait_for.wait()
+        return {"GPS": {"name": "GPS", "category": "equipment"}}
+
+
 def _build_request() -> CreateReservationRequest:
     pickup = datetime(2026, 4, 1, 10, 0, tzinfo=UTC)
     dropoff = pickup + timedelta(days=2)
@@ -106,6 +164,81 @@ async def test_create_reservation_use_case_propagates_code_generation_error() ->
         await use_case.execute(_build_request())
 
 
+@pytest.mark.asyncio
+async def test_create_reservation_use_case_runs_inside_one_unit_of_work() -> None:
+    generate_code = RecordingGenerateReservationCodeUseCase()
+    unit_of_work = FakeUnitOfWork(SpyOutboxWriter())
+    unused_writer = SpyOutboxWriter()
+    use_case = CreateReservationUseCase(
+        generate_code_use_case=generate_code,
+        outbox_writer=unused_writer,
+        unit_of_work_factory=lambda: unit_of_work,
+    )
+
+    result = await use_case.execute(_build_request())
+
+    assert result.reservation_code.value == "UW12AB34"
+    assert generate_code.repositories == [unit_of_work.reservations]
+    assert unit_of_work.outbox_writer.saved_reservation is not None
+    assert unused_writer.saved_reservation is None
+    assert unit_of_work.events == ["enter", "commit", "exit"]
+
+
+@pytest.mark.asyncio
+async def test_create_reservation_use_case_skips_commit_when_persistence_fails() -> None:
+    unit_of_work = FakeUnitOfWork(FailingOutboxWriter())
+    use_case = CreateReservationUseCase(
+        generate_code_use_case=RecordingGenerateReservationCodeUseCase(),
+        outbox_writer=SpyOutboxWriter(),
+        unit_of_work_factory=lambda: unit_of_work,
+    )
+
+    with pytest.raises(CreateReservationPersistenceError, match="Unable to persist reservation"):
+        await use_case.execute(_build_request())
+
+    assert unit_of_work.events == ["enter", "exit"]
+
+
+@pytest.mark.asyncio
+async def test_create_reservation_use_case_resolves_addons_while_generating_the_code() -> None:
+    code_started = asyncio.Event()
+    addons_started = asyncio.Event()
+    outbox_writer = SpyOutboxWriter()
+    use_case = CreateReservationUseCase(
+        # Each lookup waits for the other one to start, so running them in sequence deadlocks.
+        generate_code_use_case=BlockingGenerateReservationCodeUseCase(code_started, addons_started),
+        outbox_writer=outbox_writer,
+        addon_catalog=WaitingAddonCatalog(code_started, addons_started),
+    )
+    request = _build_request()
+    request.addons.append(AddonItem(addon_code="GPS", quantity=1, unit_price=Decimal("5.00")))
+
+    result = await asyncio.wait_for(use_case.execute(request), timeout=1)
+
+    assert result.reservation_code.value == "AB12CD34"
+    assert [addon.addon_code for addon in result.addons] == ["GPS"]
+
+
+@pytest.mark.asyncio
+async def test_create_reservation_use_case_cancels_code_generation_when_addons_fail() -> None:
+    code_started = asyncio.Event()
+    generate_code = BlockingGenerateReservationCodeUseCase(code_started, asyncio.Event())
+    outbox_writer = SpyOutboxWriter()
+    use_case = CreateReservationUseCase(
+        generate_code_use_case=generate_code,
+        outbox_writer=outbox_writer,
+        addon_catalog=WaitingAddonCatalog(code_started),
+    )
+    request = _build_request()
+    request.addons.append(AddonItem(addon_code="XYZ", quantity=1, unit_price=Decimal("5.00")))
+
+    with pytest.raises(ValueError, match="Add-on 'XYZ' not found or inactive"):
+        await asyncio.wait_for(use_case.execute(request), timeout=1)
+
+    assert generate_code.cancelled is True
+    assert outbox_writer.saved_reservation is None
+
+
 def test_create_reservation_request_rejects_invalid_input_data() -> None:
     pickup = datetime(2026, 4, 1, 10, 0, tzinfo=UTC)
 
@@ -0,0 +1,198 @@
+import asyncio
+
+import httpx
+import pytest
+
+from reservas_api.infrastructure.gateways import StripePaymentGateway, is_overload_http_error
+from reservas_api.infrastructure.resilience import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    CircuitBreakerOpenError,
+    ConcurrencyLimitExceededError,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_limiter_queues_calls_above_the_limit() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_queue_size=10)
+    release = asyncio.Event()
+    peak = 0
+
+    async def _call() -> None:
+        nonlocal peak
+        peak = max(peak, limiter.in_flight)
+        await release.wait()
+
+    tasks = [asyncio.create_task(limiter.call(_call)) for _ in range(5)]
+    await asyncio.sleep(0)
+
+    assert limiter.in_flight == 2
+    assert limiter.queued == 3
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_sheds_calls_when_queue_is_full() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_queue_size=0)
+    release = asyncio.Event()
+
+    async def _call() -> None:
+        await release.wait()
+
+    running = asyncio.create_task(limiter.call(_call))
+    await asyncio.sleep(0)
+
+    with pytest.raises(ConcurrencyLimitExceededError):
+        await limiter.call(_call)
+
+    release.set()
+    await running
+    assert limiter.shed_count == 1
+
+
+@pytest.mark.asyncio
+async def test_limiter_backs_off_on_errors_and_slow_calls() -> None:
+    clock = FakeClock()
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, backoff_ratio=0.5, time_provider=clock)
+
+    async def _failing() -> None:
+        raise RuntimeError("upstream error")
+
+    with pytest.raises(RuntimeError):
+        await limiter.call(_failing)
+    assert limiter.limit == 5
+
+    async def _timed(latency: float) -> None:
+        clock.now += latency
+
+    await limiter.call(lambda: _timed(0.1))
+    await limiter.call(lambda: _timed(1.0))
+
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_limiter_ignores_circuit_open_rejections() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, backoff_ratio=0.5)
+
+    async def _rejected() -> None:
+        raise CircuitBreakerOpenError("Circuit breaker is open")
+
+    for _ in range(30):
+        with pytest.raises(CircuitBreakerOpenError):
+            await limiter.call(_rejected)
+
+    assert limiter.limit == 10
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_only_backs_off_on_overload_http_errors() -> None:
+    limiter = AdaptiveConcurrencyLimiter(
+        initial_limit=10,
+        backoff_ratio=0.5,
+        overload=is_overload_http_error,
+    )
+    request = httpx.Request("POST", "https://provider.test/bookings")
+
+    async def _respond(status_code: int) -> None:
+        response = httpx.Response(status_code, request=request)
+        response.raise_for_status()
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await limiter.call(lambda: _respond(422))
+    assert limiter.limit == 10
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await limiter.call(lambda: _respond(503))
+    assert limiter.limit == 5
+
+
+@pytest.mark.asyncio
+async def test_limiter_releases_slot_handed_over_as_the_wait_times_out(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, queue_timeout_seconds=1.0)
+    release = asyncio.Event()
+    running = asyncio.create_task(limiter.call(release.wait))
+    await asyncio.sleep(0)
+
+    async def _wait_for_handover_then_time_out(waiter: asyncio.Future[None], **_: object):
+        release.set()
+        await asyncio.shield(waiter)
+        raise TimeoutError
+
+    monkeypatch.setattr(asyncio, "wait_for", _wait_for_handover_then_time_out)
+    with pytest.raises(ConcurrencyLimitExceededError):
+        await limiter.call(release.wait)
+    monkeypatch.undo()
+    await running
+
+    assert limiter.in_flight == 0
+    assert limiter.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_grows_while_the_limit_is_used() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=3, time_provider=lambda: 0.0)
+
+    async def _call() -> None:
+        await asyncio.sleep(0)
+
+    for _ in range(20):
+        await asyncio.gather(limiter.call(_call), limiter.call(_call), limiter.call(_call))
+
+    assert limiter.limit == 3
+
+
+@pytest.mark.asyncio
+async def test_payment_gateway_reports_throttled_when_shed() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_queue_size=0)
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200, json={"status": "succeeded"})
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        base_url="https://stripe.test",
+    ) as client:
+        gateway = StripePaymentGateway(
+            client=client,
+            circuit_breaker=CircuitBreaker(failure_threshold=3, recovery_timeout_seconds=60),
+            concurrency_limiter=limiter,
+        )
+        first = asyncio.create_task(gateway.process_payment_request(b"{}"))
+        await asyncio.sleep(0)
+        second = await gateway.process_payment_request(b"{}")
+        release.set()
+        first_result = await first
+
+    assert second.status == "THROTTLED"
+    assert first_result.status == "SUCCEEDED"
+
+
+def test_try_acquire_takes_a_free_slot_without_queueing() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, min_limit=1)
+
+    assert limiter.try_acquire() is True
+    assert limiter.try_acquire() is False
+    assert limiter.in_flight == 1
+
+    limiter.release()
+
+    assert limiter.in_flight == 0
@@ -0,0 +1,235 @@
+import asyncio
+
+import httpx
+import pytest
+
+from reservas_api.infrastructure.gateways import ProviderAPIGateway
+from reservas_api.infrastructure.resilience import CircuitBreaker, HedgingPolicy, RetryPolicy
+
+
+def _warmed_policy(latency_seconds: float = 0.01, **kwargs) -> HedgingPolicy:
+    policy = HedgingPolicy(min_samples=5, min_delay_seconds=0.0, **kwargs)
+    for _ in range(5):
+        policy.record_latency(latency_seconds)
+    return policy
+
+
+def test_hedge_delay_requires_enough_samples() -> None:
+    policy = HedgingPolicy(percentile=0.5, min_samples=3, min_delay_seconds=0.0)
+    policy.record_latency(0.1)
+    policy.record_latency(0.3)
+
+    assert policy.hedge_delay_seconds() is None
+
+    policy.record_latency(0.2)
+
+    assert policy.hedge_delay_seconds() == pytest.approx(0.2)
+    assert policy.hedge_delay_seconds("other") is None
+
+
+def test_constructor_rejects_invalid_percentile() -> None:
+    with pytest.raises(ValueError, match="percentile"):
+        HedgingPolicy(percentile=1.0)
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_cancelled() -> None:
+    policy = _warmed_policy(budget_ratio=1.0)
+    calls = 0
+    cancelled = asyncio.Event()
+
+    async def _call() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "primary"
+        return "hedge"
+
+    result = await policy.execute(_call)
+
+    assert result == "hedge"
+    assert policy.hedges_sent == 1
+    assert policy.hedges_won == 1
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_hedge_is_skipped_when_budget_is_exhausted() -> None:
+    policy = _warmed_policy(budget_ratio=0.1)
+    calls = 0
+
+    async def _call() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.03)
+        return "primary"
+
+    assert await policy.execute(_call) == "primary"
+    assert calls == 1
+    assert policy.hedges_sent == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_attempt_waits_for_the_other_one() -> None:
+    policy = _warmed_policy(budget_ratio=1.0)
+    calls = 0
+
+    async def _call() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(0.05)
+            return "primary"
+        raise RuntimeError("hedge failed")
+
+    assert await policy.execute(_call) == "primary"
+    assert policy.hedges_won == 0
+
+
+@pytest.mark.asyncio
+async def test_provider_gateway_hedges_with_idempotency_key() -> None:
+    policy = _warmed_policy(budget_ratio=1.0)
+    keys: list[str | None] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        keys.append(request.headers.get("Idempotency-Key"))
+        if len(keys) == 1:
+            await asyncio.sleep(10)
+        return httpx.Response(200, json={"status": "confirmed"})
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        base_url="https://provider.test",
+    ) as client:
+        gateway = ProviderAPIGateway(
+            client=client,
+            circuit_breaker=CircuitBreaker(failure_threshold=3, recovery_timeout_seconds=60),
+            retry_policy=RetryPolicy(max_retries=0),
+            hedging_policy=policy,
+        )
+        result = await gateway.create_booking_request(
+            b"{}",
+            supplier_code="default",
+            idempotency_key="ZX98CV76",
+        )
+
+    assert result.status == "CONFIRMED"
+    assert keys == ["ZX98CV76", "ZX98CV76"]
+    assert policy.hedges_won == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_caller_cancels_the_primary_request() -> None:
+    policy = _warmed_policy(latency_seconds=1.0, budget_ratio=1.0)
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def _call() -> str:
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "primary"
+
+    caller = asyncio.create_task(policy.execute(_call))
+    await started.wait()
+    caller.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    assert policy.hedges_sent == 0
+
+
+class FakePermits:
+    def __init__(self, available: int) -> None:
+        self.available = available
+        self.released = 0
+
+    def try_acquire(self) -> bool:
+        if self.available <= 0:
+            return False
+        self.available -= 1
+        return True
+
+    def release(self) -> None:
+        self.available += 1
+        self.released += 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_is_skipped_without_a_free_permit() -> None:
+    policy = _warmed_policy(budget_ratio=1.0)
+    calls = 0
+
+    async def _call() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.03)
+        return "primary"
+
+    assert await policy.execute(_call, permits=FakePermits(available=0)) == "primary"
+    assert calls == 1
+    assert policy.hedges_sent == 0
+
+
+@pytest.mark.asyncio
+async def test_hedge_releases_its_permit_when_it_finishes() -> None:
+    policy = _warmed_policy(budget_ratio=1.0)
+    permits = FakePermits(available=1)
+    calls = 0
+
+    async def _call() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(10)
+        return "hedge"
+
+    assert await policy.execute(_call, permits=permits) == "hedge"
+    await asyncio.sleep(0)
+
+    assert policy.hedges_sent == 1
+    assert permits.released == 1
+    assert permits.available == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_attempts_feed_the_latency_window() -> None:
+    policy = HedgingPolicy(percentile=0.5, min_samples=2, min_delay_seconds=0.0)
+
+    async def _call() -> str:
+        await asyncio.sleep(0.02)
+        raise RuntimeError("provider timed out")
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await policy.execute(_call)
+
+    delay = policy.hedge_delay_seconds()
+    assert delay is not None and delay >= 0.02
+
+
+@pytest.mark.asyncio
+async def test_primary_error_is_raised_when_both_attempts_fail() -> None:
+    policy = _warmed_policy(budget_ratio=1.0)
+    calls = 0
+
+    async def _call() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(0.05)
+            raise RuntimeError("primary failed")
+        raise RuntimeError("hedge failed")
+
+    with pytest.raises(RuntimeError, match="primary failed"):
+        await policy.execute(_call)
+    assert policy.hedges_sent == 1
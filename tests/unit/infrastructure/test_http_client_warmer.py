@@ -0,0 +1,61 @@
+import asyncio
+
+import httpx
+import pytest
+
+from reservas_api.infrastructure.gateways import HttpClientWarmer
+
+
+@pytest.mark.asyncio
+async def test_prewarm_probes_each_client_concurrently() -> None:
+    probes: list[tuple[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        probes.append((request.method, request.url.host))
+        return httpx.Response(404)
+
+    transport = httpx.MockTransport(handler)
+    async with (
+        httpx.AsyncClient(transport=transport, base_url="https://stripe.test") as stripe,
+        httpx.AsyncClient(transport=transport, base_url="https://provider.test") as provider,
+    ):
+        warmed = await HttpClientWarmer([stripe, provider], connections_per_client=3).prewarm()
+
+    assert warmed == 6
+    assert sorted(probes) == [("HEAD", "provider.test")] * 3 + [("HEAD", "stripe.test")] * 3
+
+
+@pytest.mark.asyncio
+async def test_prewarm_tolerates_unreachable_clients() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        base_url="https://down.test",
+    ) as client:
+        warmed = await HttpClientWarmer([client], connections_per_client=2).prewarm()
+
+    assert warmed == 0
+
+
+@pytest.mark.asyncio
+async def test_keepalive_probes_until_stopped() -> None:
+    probes = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal probes
+        probes += 1
+        return httpx.Response(200)
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        base_url="https://provider.test",
+    ) as client:
+        warmer = HttpClientWarmer([client])
+        task = asyncio.create_task(warmer.run_keepalive(interval_seconds=0.01))
+        await asyncio.sleep(0.05)
+        warmer.stop()
+        await task
+
+    assert probes >= 2
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from reservas_api.infrastructure.outbox import OutboxEventProcessor
+
+
+def _processor(random_value: float) -> OutboxEventProcessor:
+    return OutboxEventProcessor(
+        session_factory=None,  # type: ignore[arg-type]
+        payment_gateway=None,  # type: ignore[arg-type]
+        provider_gateway=None,  # type: ignore[arg-type]
+        retry_base_delay_seconds=2.0,
+        retry_max_delay_seconds=60.0,
+        random_func=lambda: random_value,
+    )
+
+
+def test_retry_delay_grows_exponentially_within_jitter_bounds() -> None:
+    low = _processor(0.0)
+    high = _processor(1.0)
+
+    assert [low.retry_delay_seconds(attempt) for attempt in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 8.0]
+    assert [high.retry_delay_seconds(attempt) for attempt in (1, 2, 3, 4)] == [2.0, 4.0, 8.0, 16.0]
+
+
+def test_retry_delay_is_capped_by_max_delay() -> None:
+    processor = _processor(1.0)
+
+    assert processor.retry_delay_seconds(20) == 60.0
+
+
+def test_processor_rejects_invalid_retry_configuration() -> None:
+    with pytest.raises(ValueError, match="max_attempts"):
+        OutboxEventProcessor(
+            session_factory=None,  # type: ignore[arg-type]
+            payment_gateway=None,  # type: ignore[arg-type]
+            provider_gateway=None,  # type: ignore[arg-type]
+            max_attempts=0,
+        )
+
+
+def test_processor_rejects_a_claim_lease_shorter_than_the_dispatch_deadline() -> None:
+    with pytest.raises(ValueError, match="claim_lease_seconds"):
+        OutboxEventProcessor(
+            session_factory=None,  # type: ignore[arg-type]
+            payment_gateway=None,  # type: ignore[arg-type]
+            provider_gateway=None,  # type: ignore[arg-type]
+            dispatch_deadline_seconds=30.0,
+            claim_lease_seconds=30.0,
+        )
+
+
+class CountingProcessor(OutboxEventProcessor):
+    def __init__(self) -> None:
+        super().__init__(
+            session_factory=None,  # type: ignore[arg-type]
+            payment_gateway=None,  # type: ignore[arg-type]
+            provider_gateway=None,  # type: ignore[arg-type]
+            poll_interval_seconds=60.0,
+        )
+        self.batches = 0
+        self.batch_done = asyncio.Event()
+
+    async def process_pending_once(self, limit: int | None = None) -> int:
+        self.batches += 1
+        self.batch_done.set()
+        return 0
+
+
+@pytest.mark.asyncio
+async def test_notify_wakes_processing_loop_before_poll_interval() -> None:
+    processor = CountingProcessor()
+    worker = asyncio.create_task(processor.run_forever())
+
+    await asyncio.wait_for(processor.batch_done.wait(), timeout=1)
+    processor.batch_done.clear()
+    processor.notify()
+    await asyncio.wait_for(processor.batch_done.wait(), timeout=1)
+
+    processor.stop()
+    await asyncio.wait_for(worker, timeout=1)
+    assert processor.batches == 2
+
+
+def test_processor_rejects_shard_index_outside_shard_count() -> None:
+    with pytest.raises(ValueError, match="shard_index"):
+        OutboxEventProcessor(
+            session_factory=None,  # type: ignore[arg-type]
+            payment_gateway=None,  # type: ignore[arg-type]
+            provider_gateway=None,  # type: ignore[arg-type]
+            shard_index=2,
+            shard_count=2,
+        )
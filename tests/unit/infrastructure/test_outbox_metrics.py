@@ -0,0 +1,76 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from reservas_api.infrastructure.outbox import OutboxMetrics
+from reservas_api.shared.metrics import LatencyHistogram, RateCounter
+
+
+class FakeTime:
+    def __init__(self) -> None:
+        self.value = 1000.0
+
+    def __call__(self) -> float:
+        return self.value
+
+
+def test_latency_histogram_reports_bucket_quantiles() -> None:
+    histogram = LatencyHistogram(buckets=(0.1, 0.5, 1.0))
+    for value in (0.05, 0.05, 0.2, 0.7, 3.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot["count"] == 5
+    assert snapshot["buckets"] == {"0.1": 2, "0.5": 3, "1": 4, "+Inf": 5}
+    assert histogram.quantile(0.4) == 0.1
+    assert histogram.quantile(0.6) == 0.5
+    assert histogram.quantile(1.0) == 3.0
+
+
+def test_latency_histogram_rejects_unsorted_buckets() -> None:
+    with pytest.raises(ValueError, match="strictly increasing"):
+        LatencyHistogram(buckets=(1.0, 0.5))
+
+
+def test_rate_counter_only_counts_events_inside_window() -> None:
+    time_provider = FakeTime()
+    counter = RateCounter(window_seconds=10, time_provider=time_provider)
+
+    counter.add(20)
+    time_provider.value += 5
+    counter.add(10)
+    assert counter.per_second() == 3.0
+
+    time_provider.value += 6
+    assert counter.per_second() == 1.0
+    assert counter.total == 30
+
+
+def test_outbox_metrics_snapshot_includes_backlog_age_and_throughput() -> None:
+    now = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+    metrics = OutboxMetrics(rate_window_seconds=10, time_provider=FakeTime(), clock=lambda: now)
+
+    metrics.record_backlog(
+        pending_count=7,
+        failed_count=2,
+        oldest_pending_created_at=now - timedelta(seconds=90),
+    )
+    metrics.record_dispatch("PAYMENT_REQUESTED", 0.02)
+    metrics.record_outcome("PAYMENT_REQUESTED", "processed", amount=5)
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot["backlog"]["pending"] == 7
+    assert snapshot["backlog"]["failed"] == 2
+    assert snapshot["backlog"]["oldest_pending_age_seconds"] == 90.0
+    assert snapshot["throughput"] == [
+        {
+            "event_type": "PAYMENT_REQUESTED",
+            "outcome": "processed",
+            "total": 5,
+            "per_second": 0.5,
+            "window_seconds": 10,
+        }
+    ]
+    assert snapshot["dispatch_latency"]["PAYMENT_REQUESTED"]["count"] == 1
@@ -0,0 +1,127 @@
+import pytest
+from sqlalchemy import literal_column, select, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from reservas_api.infrastructure.db import InstrumentedAsyncQueuePool, PoolMetrics
+from reservas_api.shared.config import ApplicationContainer
+from reservas_api.shared.config.settings import Settings
+
+
+def _settings() -> Settings:
+    return Settings(
+        DATABASE_URL="sqlite+aiosqlite://",
+        APP_DEBUG=False,
+        DB_POOL_SIZE=3,
+        DB_MAX_OVERFLOW=2,
+        DB_READ_POOL_SIZE=1,
+        DB_READ_MAX_OVERFLOW=0,
+        DB_READ_POOL_TIMEOUT_SECONDS=0.05,
+        DB_WORKER_POOL_SIZE=2,
+        DB_WORKER_MAX_OVERFLOW=1,
+    )
+
+
+def test_pool_metrics_snapshot_reports_wait_and_timeouts_per_pool() -> None:
+    metrics = PoolMetrics()
+
+    metrics.record_checkout("api_read", 0.002)
+    metrics.record_timeout("api_read", 5.0)
+    metrics.record_checkout("worker", 0.0001)
+
+    snapshot = metrics.snapshot()
+    assert list(snapshot) == ["api_read", "worker"]
+    assert snapshot["api_read"]["checkout_wait"]["count"] == 2
+    assert snapshot["api_read"]["timeouts"] == 1
+    assert snapshot["worker"]["timeouts"] == 0
+
+
+@pytest.mark.asyncio
+async def test_container_creates_independent_pools_per_workload() -> None:
+    container = ApplicationContainer(_settings())
+    pools = {
+        name: factory.kw["bind"].sync_engine.pool
+        for name, factory in (
+            ("api_write", container.session_factory),
+            ("api_read", container.read_session_factory),
+            ("worker", container.worker_session_factory),
+        )
+    }
+    try:
+        assert all(isinstance(pool, InstrumentedAsyncQueuePool) for pool in pools.values())
+        assert {name: pool.size() for name, pool in pools.items()} == {
+            "api_write": 3,
+            "api_read": 1,
+            "worker": 2,
+        }
+        assert {pool.pool_name for pool in pools.values()} == {"api_write", "api_read", "worker"}
+        assert container.session_router.primary is container.read_session_factory
+    finally:
+        await container.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_named_pool_records_checkout_wait_and_timeouts() -> None:
+    container = ApplicationContainer(_settings())
+    engine = container.read_session_factory.kw["bind"]
+    try:
+        async with engine.connect() as held:
+            await held.execute(text("SELECT 1"))
+            with pytest.raises(PoolTimeoutError):
+                async with engine.connect():
+                    pass
+    finally:
+        await container.shutdown()
+
+    stats = container.pool_metrics.snapshot()["api_read"]
+    assert stats["checkout_wait"]["count"] == 2
+    assert stats["timeouts"] == 1
+    recreated = engine.sync_engine.pool
+    assert isinstance(recreated, InstrumentedAsyncQueuePool)
+    assert recreated.metrics is container.pool_metrics
+    assert recreated.pool_name == "api_read"
+
+
+@pytest.mark.asyncio
+async def test_pool_events_track_in_use_overflow_hold_time_and_lifetime() -> None:
+    container = ApplicationContainer(_settings())
+    engine = container.worker_session_factory.kw["bind"]
+    try:
+        async with engine.connect() as first, engine.connect() as second:
+            async with engine.connect() as third:
+                await third.execute(text("SELECT 1"))
+                stats = container.pool_metrics.snapshot()["worker"]
+                assert stats["in_use"] == 3
+                assert stats["open_connections"] == 3
+                assert stats["overflow"] == 1
+            await first.execute(text("SELECT 1"))
+            await second.execute(text("SELECT 1"))
+    finally:
+        await container.shutdown()
+
+    stats = container.pool_metrics.snapshot()["worker"]
+    assert stats["pool_size"] == 2
+    assert stats["in_use"] == 0
+    assert stats["peak_in_use"] == 3
+    assert stats["checkout_hold"]["count"] == 3
+    assert stats["connections_opened"] == 3
+    assert stats["connections_closed"] == 3
+    assert stats["open_connections"] == 0
+    assert stats["connection_lifetime"]["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_reports_compiled_statement_cache_usage() -> None:
+    container = ApplicationContainer(_settings().model_copy(update={"db_query_cache_size": 7}))
+    engine = container.session_factory.kw["bind"]
+    statement = select(literal_column("1"))
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(statement)
+            await connection.execute(statement)
+    finally:
+        await container.shutdown()
+
+    cache = container.pool_metrics.snapshot()["api_write"]["statement_cache"]
+    assert cache["capacity"] == 7
+    assert cache["entries"] >= 1
+    assert (cache["misses"], cache["hits"]) == (1, 1)
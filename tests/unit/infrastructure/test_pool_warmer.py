@@ -0,0 +1,155 @@
+import asyncio
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from reservas_api.infrastructure.db import DatabasePoolWarmer
+from reservas_api.shared.config import WORKER_PROCESS_ROLE, ApplicationContainer
+from reservas_api.shared.config.settings import Settings
+
+
+@pytest.mark.asyncio
+async def test_prewarm_opens_distinct_connections_up_to_the_pool_size() -> None:
+    engines = [
+        create_async_engine("sqlite+aiosqlite://", poolclass=AsyncAdaptedQueuePool, pool_size=size)
+        for size in (2, 5)
+    ]
+    opened: list[int] = []
+    for index, engine in enumerate(engines):
+        event.listen(engine.sync_engine, "connect", lambda *_, index=index: opened.append(index))
+    try:
+        warmed = await DatabasePoolWarmer(engines, connections_per_pool=3).prewarm()
+    finally:
+        for engine in engines:
+            await engine.dispose()
+
+    assert warmed == 5
+    assert sorted(opened) == [0, 0, 1, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_prewarm_tolerates_unreachable_databases() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:////nonexistent-dir/reservas.db")
+    try:
+        warmed = await DatabasePoolWarmer([engine], connections_per_pool=2).prewarm()
+    finally:
+        await engine.dispose()
+
+    assert warmed == 0
+
+
+@pytest.mark.asyncio
+async def test_container_reports_ready_after_background_warmup() -> None:
+    container = ApplicationContainer(
+        Settings(
+            DATABASE_URL="sqlite+aiosqlite://",
+            APP_DEBUG=False,
+            DB_PREWARM_CONNECTIONS=2,
+            DB_READ_POOL_SIZE=1,
+            PROVIDER_CLIENT_POOLS_ENABLED=False,
+            OUTBOX_EMBEDDED_WORKER_ENABLED=False,
+        )
+    )
+    try:
+        await container.startup()
+        assert container.ready is False
+
+        await container.wait_until_ready()
+
+        assert container.ready is True
+        assert container.warmup_connections == {"db": 3, "http": 0}
+        pools = container.pool_metrics.snapshot()
+        assert pools["api_write"]["connections_opened"] == 2
+        assert pools["api_read"]["connections_opened"] == 1
+        assert pools["worker"]["connections_opened"] == 0
+    finally:
+        await container.shutdown()
+
+    assert container.ready is False
+
+
+@pytest.mark.asyncio
+async def test_worker_process_warms_only_the_worker_pool() -> None:
+    container = ApplicationContainer(
+        Settings(
+            DATABASE_URL="sqlite+aiosqlite://",
+            APP_DEBUG=False,
+            DB_PREWARM_CONNECTIONS=2,
+            PROVIDER_CLIENT_POOLS_ENABLED=False,
+            OUTBOX_EMBEDDED_WORKER_ENABLED=False,
+        ),
+        process_role=WORKER_PROCESS_ROLE,
+    )
+    try:
+        await container.startup()
+        await container.wait_until_ready()
+
+        pools = container.pool_metrics.snapshot()
+        assert pools["worker"]["connections_opened"] == 2
+        assert pools["api_write"]["connections_opened"] == 0
+        assert pools["api_read"]["connections_opened"] == 0
+    finally:
+        await container.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_container_stays_degraded_while_no_db_connection_can_be_opened() -> None:
+    container = ApplicationContainer(
+        Settings(
+            DATABASE_URL="sqlite+aiosqlite:////nonexistent-dir/reservas.db",
+            APP_DEBUG=False,
+            DB_PREWARM_CONNECTIONS=1,
+            STARTUP_WARMUP_RETRY_SECONDS=60,
+            PROVIDER_CLIENT_POOLS_ENABLED=False,
+            OUTBOX_EMBEDDED_WORKER_ENABLED=False,
+        )
+    )
+    try:
+        await container.startup()
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(container.wait_until_ready(), timeout=1)
+
+        assert container.warmup_status == "degraded"
+        assert container.ready is False
+    finally:
+        await container.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_container_retries_db_warmup_after_a_timeout(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    container = ApplicationContainer(
+        Settings(
+            DATABASE_URL="sqlite+aiosqlite://",
+            APP_DEBUG=False,
+            DB_PREWARM_CONNECTIONS=1,
+            STARTUP_WARMUP_TIMEOUT_SECONDS=0.05,
+            STARTUP_WARMUP_RETRY_SECONDS=0,
+            PROVIDER_CLIENT_POOLS_ENABLED=False,
+            OUTBOX_EMBEDDED_WORKER_ENABLED=False,
+        )
+    )
+    statuses: list[str] = []
+    attempts = 0
+
+    async def prewarm_db_pools() -> int:
+        nonlocal attempts
+        statuses.append(container.warmup_status)
+        attempts += 1
+        if attempts == 1:
+            await asyncio.sleep(1)
+        return 3
+
+    monkeypatch.setattr(container, "_prewarm_db_pools", prewarm_db_pools)
+    try:
+        await container.startup()
+        await container.wait_until_ready()
+
+        assert statuses == ["warming", "degraded"]
+        assert container.ready is True
+        assert container.warmup_connections["db"] == 3
+    finally:
+        await container.shutdown()
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
@@ -6,8 +7,20 @@ import pytest
 
 from reservas_api.domain.entities import Reservation
 from reservas_api.domain.value_objects import ReservationCode
-from reservas_api.infrastructure.gateways import ProviderAPIGateway
-from reservas_api.infrastructure.resilience import CircuitBreaker, RetryPolicy
+from reservas_api.infrastructure.gateways import (
+    ProviderAPIGateway,
+    is_retryable_http_error,
+    retry_after_seconds,
+)
+from reservas_api.infrastructure.resilience import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    RetryBudget,
+    RetryBudgetRegistry,
+    RetryPolicy,
+    SlidingWindowCircuitBreaker,
+)
+from reservas_api.shared.resilience import Deadline
 
 
 def _reservation() -> Reservation:
@@ -127,3 +140,139 @@ async def test_provider_gateway_returns_circuit_open_when_breaker_opened() -> No
     assert second.status == "CIRCUIT_OPEN"
     assert attempts == 1
 
+
+@pytest.mark.asyncio
+async def test_provider_gateway_isolates_circuit_breakers_per_supplier() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.content == b"flaky":
+            return httpx.Response(503, json={"error": "unavailable"})
+        return httpx.Response(200, json={"status": "confirmed"})
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        base_url="https://provider.test",
+    ) as client:
+        gateway = ProviderAPIGateway(
+            client=client,
+            circuit_breaker=SlidingWindowCircuitBreaker(failure_threshold=1),
+            retry_policy=RetryPolicy(max_retries=0),
+            supplier_circuit_breakers=CircuitBreakerRegistry(
+                lambda: SlidingWindowCircuitBreaker(
+                    failure_threshold=2, recovery_timeout_seconds=60
+                )
+            ),
+        )
+        flaky_results = [
+            await gateway.create_booking_request(b"flaky", supplier_code="SUP001") for _ in range(3)
+        ]
+        healthy = await gateway.create_booking_request(b"{}", supplier_code="SUP002")
+
+    assert [result.status for result in flaky_results] == ["FAILED", "FAILED", "CIRCUIT_OPEN"]
+    assert healthy.status == "CONFIRMED"
+
+
+@pytest.mark.asyncio
+async def test_provider_gateway_isolates_retry_budgets_per_supplier() -> None:
+    recovering_attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal recovering_attempts
+        if request.content == b"recovering":
+            recovering_attempts += 1
+            if recovering_attempts == 1:
+                return httpx.Response(503, json={"error": "unavailable"})
+            return httpx.Response(200, json={"status": "confirmed"})
+        return httpx.Response(503, json={"error": "unavailable"})
+
+    def budget() -> RetryBudget:
+        return RetryBudget(ratio=0.1, max_tokens=1, min_retries_per_second=0)
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        base_url="https://provider.test",
+    ) as client:
+        gateway = ProviderAPIGateway(
+            client=client,
+            circuit_breaker=CircuitBreaker(failure_threshold=100, recovery_timeout_seconds=60),
+            retry_policy=RetryPolicy(
+                max_retries=1,
+                sleep_func=lambda _: _immediate_sleep(),
+                retryable=is_retryable_http_error,
+                budget=budget(),
+            ),
+            supplier_retry_budgets=RetryBudgetRegistry(budget),
+        )
+        outage = [
+            await gateway.create_booking_request(b"flaky", supplier_code="SUP001") for _ in range(3)
+        ]
+        healthy = await gateway.create_booking_request(b"recovering", supplier_code="SUP002")
+
+    assert [result.status for result in outage] == ["FAILED", "FAILED", "FAILED"]
+    assert healthy.status == "CONFIRMED"
+    assert recovering_attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_provider_gateway_retries_only_retryable_http_errors() -> None:
+    attempts = 0
+    delays: list[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            return httpx.Response(429, headers={"Retry-After": "2"})
+        return httpx.Response(422, json={"error": "invalid office"})
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        base_url="https://provider.test",
+    ) as client:
+        gateway = ProviderAPIGateway(
+            client=client,
+            circuit_breaker=CircuitBreaker(failure_threshold=5, recovery_timeout_seconds=60),
+            retry_policy=RetryPolicy(
+                max_retries=3,
+                base_delay_seconds=0.1,
+                sleep_func=fake_sleep,
+                retryable=is_retryable_http_error,
+                retry_after=retry_after_seconds,
+            ),
+        )
+        result = await gateway.create_booking(_reservation())
+
+    assert result.status == "FAILED"
+    assert attempts == 2
+    assert delays == [2.0]
+
+
+@pytest.mark.asyncio
+async def test_provider_gateway_clips_attempt_timeout_to_the_deadline() -> None:
+    timeouts: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"])
+        return httpx.Response(200, json={"status": "confirmed"})
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        base_url="https://provider.test",
+    ) as client:
+        gateway = ProviderAPIGateway(
+            client=client,
+            circuit_breaker=CircuitBreaker(failure_threshold=5, recovery_timeout_seconds=60),
+            retry_policy=RetryPolicy(max_retries=0),
+            timeout_seconds=10.0,
+        )
+        result = await gateway.create_booking_request(b"{}", deadline=Deadline(2.0))
+        expired = Deadline(0.001)
+        await asyncio.sleep(0.01)
+        expired_result = await gateway.create_booking_request(b"{}", deadline=expired)
+
+    assert result.status == "CONFIRMED"
+    assert 0 < timeouts[0]["read"] <= 2.0
+    assert expired_result.status == "TIMEOUT"
+    assert len(timeouts) == 1
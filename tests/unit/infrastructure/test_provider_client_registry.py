@@ -0,0 +1,142 @@
+import httpx
+import pytest
+
+from reservas_api.infrastructure.gateways import (
+    ProviderAPIGateway,
+    ProviderClientRegistry,
+    ProviderClientSettings,
+)
+from reservas_api.infrastructure.repositories import ProviderEntity
+from reservas_api.infrastructure.resilience import CircuitBreaker, RetryPolicy
+
+DEFAULT_SETTINGS = ProviderClientSettings(
+    base_url="https://provider.test",
+    timeout_seconds=10.0,
+    max_connections=20,
+)
+
+
+async def _immediate_sleep() -> None:
+    return None
+
+
+def _client_factory(hits: list[str]):
+    def _factory(client_settings: ProviderClientSettings) -> httpx.AsyncClient:
+        def handler(request: httpx.Request) -> httpx.Response:
+            hits.append(str(request.url.host))
+            return httpx.Response(200, json={"status": "confirmed"})
+
+        return httpx.AsyncClient(
+            transport=httpx.MockTransport(handler),
+            base_url=client_settings.base_url,
+            timeout=client_settings.timeout_seconds,
+        )
+
+    return _factory
+
+
+@pytest.mark.asyncio
+async def test_registry_builds_dedicated_client_settings_from_provider_entities() -> None:
+    created: list[ProviderClientSettings] = []
+
+    def factory(client_settings: ProviderClientSettings) -> httpx.AsyncClient:
+        created.append(client_settings)
+        return httpx.AsyncClient(base_url=client_settings.base_url)
+
+    async with httpx.AsyncClient(base_url="https://provider.test") as default_client:
+        registry = ProviderClientRegistry(default_client, DEFAULT_SETTINGS, factory)
+        registry.register_entities(
+            [
+                ProviderEntity(
+                    entity_code="FAST01",
+                    default_timeout_ms=1800,
+                    config={"base_url": "https://fast.test", "max_connections": 50},
+                ),
+                ProviderEntity(entity_code="SLOW01", default_timeout_ms=8000),
+            ]
+        )
+
+        fast_client, fast_timeout = registry.resolve("FAST01")
+        fallback_client, fallback_timeout = registry.resolve("UNKNOWN")
+        await registry.aclose()
+
+    assert registry.supplier_codes == []
+    assert created == [
+        ProviderClientSettings(
+            base_url="https://fast.test",
+            timeout_seconds=1.8,
+            max_connections=50,
+        ),
+        ProviderClientSettings(
+            base_url="https://provider.test",
+            timeout_seconds=8.0,
+            max_connections=20,
+        ),
+    ]
+    assert fast_client is not default_client
+    assert fast_timeout == 1.8
+    assert fallback_client is default_client
+    assert fallback_timeout == 10.0
+
+
+@pytest.mark.asyncio
+async def test_provider_gateway_routes_booking_through_supplier_client() -> None:
+    hits: list[str] = []
+
+    def default_handler(request: httpx.Request) -> httpx.Response:
+        hits.append("default")
+        return httpx.Response(200, json={"status": "confirmed"})
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(default_handler),
+        base_url="https://provider.test",
+    ) as default_client:
+        registry = ProviderClientRegistry(default_client, DEFAULT_SETTINGS, _client_factory(hits))
+        registry.register_entities(
+            [ProviderEntity("SUP001", 1800, {"base_url": "https://sup001.test"})]
+        )
+        gateway = ProviderAPIGateway(
+            client=default_client,
+            circuit_breaker=CircuitBreaker(failure_threshold=3, recovery_timeout_seconds=60),
+            retry_policy=RetryPolicy(max_retries=0, sleep_func=lambda _: _immediate_sleep()),
+            client_registry=registry,
+        )
+
+        supplier_result = await gateway.create_booking_request(b"{}", supplier_code="SUP001")
+        default_result = await gateway.create_booking_request(b"{}", supplier_code="SUP999")
+        await registry.aclose()
+
+    assert supplier_result.success is True
+    assert default_result.success is True
+    assert hits == ["sup001.test", "default"]
+
+
+@pytest.mark.asyncio
+async def test_registry_falls_back_to_defaults_for_malformed_provider_config(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    created: list[ProviderClientSettings] = []
+
+    def factory(client_settings: ProviderClientSettings) -> httpx.AsyncClient:
+        created.append(client_settings)
+        return httpx.AsyncClient(base_url=client_settings.base_url)
+
+    async with httpx.AsyncClient(base_url="https://provider.test") as default_client:
+        registry = ProviderClientRegistry(default_client, DEFAULT_SETTINGS, factory)
+        registry.register_entities(
+            [
+                ProviderEntity("BAD01", 1800, {"max_connections": "lots"}),
+                ProviderEntity("BAD02", 1800, {"max_keepalive_connections": -1}),
+                ProviderEntity("BAD03", 1800, ["not", "a", "mapping"]),  # type: ignore[arg-type]
+                ProviderEntity("GOOD01", 1800, {"max_connections": 5}),
+            ]
+        )
+        await registry.aclose()
+
+    assert created[:3] == [DEFAULT_SETTINGS] * 3
+    assert created[3].max_connections == 5
+    assert [
+        record.supplier_code
+        for record in caplog.records
+        if record.message == "provider_client_config_invalid"
+    ] == ["BAD01", "BAD02", "BAD03"]
@@ -2,7 +2,8 @@ from collections import deque
 
 import pytest
 
-from reservas_api.infrastructure.resilience import RetryPolicy
+from reservas_api.infrastructure.resilience import RetryBudget, RetryBudgetRegistry, RetryPolicy
+from reservas_api.shared.resilience import Deadline
 
 
 @pytest.mark.asyncio
@@ -60,3 +61,175 @@ async def test_retry_policy_raises_after_max_retries() -> None:
     assert attempts == 3
     assert delays == [0.5, 1.0]
 
+
+@pytest.mark.asyncio
+async def test_retry_policy_full_jitter_draws_below_the_exponential_cap() -> None:
+    delays: list[float] = []
+    outcomes = deque([RuntimeError("first"), RuntimeError("second"), "ok"])
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    async def flaky_call() -> str:
+        result = outcomes.popleft()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    policy = RetryPolicy(
+        max_retries=3,
+        base_delay_seconds=1.0,
+        sleep_func=fake_sleep,
+        full_jitter=True,
+        random_func=lambda: 0.25,
+    )
+
+    assert await policy.execute(flaky_call) == "ok"
+    assert delays == [0.25, 0.5]
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_does_not_retry_non_retryable_errors() -> None:
+    attempts = 0
+
+    async def invalid_request() -> None:
+        nonlocal attempts
+        attempts += 1
+        raise ValueError("invalid")
+
+    policy = RetryPolicy(
+        max_retries=3,
+        sleep_func=lambda _: _no_sleep(),
+        retryable=lambda exc: not isinstance(exc, ValueError),
+    )
+
+    with pytest.raises(ValueError):
+        await policy.execute(invalid_request)
+    assert attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_honours_retry_after_up_to_max_delay() -> None:
+    delays: list[float] = []
+    outcomes = deque([RuntimeError("throttled"), RuntimeError("throttled"), "ok"])
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    async def throttled_call() -> str:
+        result = outcomes.popleft()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    requested = deque([3.0, 30.0])
+    policy = RetryPolicy(
+        max_retries=3,
+        base_delay_seconds=1.0,
+        max_delay_seconds=10.0,
+        sleep_func=fake_sleep,
+        retry_after=lambda _: requested.popleft(),
+    )
+
+    assert await policy.execute(throttled_call) == "ok"
+    assert delays == [3.0, 10.0]
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_stops_retries_once_spent() -> None:
+    attempts = 0
+
+    async def always_fail() -> None:
+        nonlocal attempts
+        attempts += 1
+        raise RuntimeError("fail")
+
+    budget = RetryBudget(ratio=0.5, max_tokens=2, min_retries_per_second=0)
+    policy = RetryPolicy(max_retries=5, sleep_func=lambda _: _no_sleep(), budget=budget)
+
+    with pytest.raises(RuntimeError):
+        await policy.execute(always_fail)
+    assert attempts == 3
+
+    async def succeed() -> str:
+        return "ok"
+
+    await policy.execute(succeed)
+    await policy.execute(succeed)
+    assert budget.tokens == pytest.approx(1.0)
+
+
+async def _no_sleep() -> None:
+    return None
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_skips_retries_that_do_not_fit_the_deadline() -> None:
+    clock = FakeClock()
+    attempts = 0
+
+    async def fake_sleep(delay: float) -> None:
+        clock.now += delay
+
+    async def slow_failure() -> None:
+        nonlocal attempts
+        attempts += 1
+        clock.now += 2.0
+        raise RuntimeError("timeout")
+
+    policy = RetryPolicy(
+        max_retries=5,
+        base_delay_seconds=1.0,
+        sleep_func=fake_sleep,
+        min_attempt_seconds=1.0,
+    )
+
+    with pytest.raises(RuntimeError):
+        await policy.execute(slow_failure, Deadline(6.0, time_provider=clock))
+
+    assert attempts == 2
+    assert clock.now == pytest.approx(5.0)
+
+
+def test_budget_registry_shares_one_budget_per_upstream_and_evicts_idle_ones() -> None:
+    clock = FakeClock()
+    registry = RetryBudgetRegistry(RetryBudget, idle_seconds=60, time_provider=clock)
+    idle = registry.get("SUP001")
+
+    assert registry.get("SUP001") is idle
+    assert registry.get("SUP002") is not idle
+
+    clock.now += 61
+    registry.get("SUP002")
+
+    assert len(registry) == 1
+    assert registry.get("SUP001") is not idle
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_uses_the_budget_passed_to_execute() -> None:
+    attempts = 0
+
+    async def always_fail() -> None:
+        nonlocal attempts
+        attempts += 1
+        raise RuntimeError("fail")
+
+    shared = RetryBudget(ratio=0.1, max_tokens=1, min_retries_per_second=0)
+    supplier = RetryBudget(ratio=0.1, max_tokens=1, min_retries_per_second=0)
+    policy = RetryPolicy(max_retries=1, sleep_func=lambda _: _no_sleep(), budget=shared)
+
+    with pytest.raises(RuntimeError):
+        await policy.execute(always_fail, budget=supplier)
+
+    assert attempts == 2
+    assert supplier.tokens == pytest.approx(0.0)
+    assert shared.tokens == pytest.approx(1.0)
@@ -0,0 +1,135 @@
+from contextlib import asynccontextmanager
+
+import pytest
+
+from reservas_api.infrastructure.db import SessionRouter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeSessionFactory:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.opened = 0
+
+    @asynccontextmanager
+    async def __call__(self):
+        self.opened += 1
+        yield self
+
+
+class LagProbe:
+    def __init__(self, *values: float | None | Exception) -> None:
+        self._values = list(values)
+        self.calls = 0
+
+    async def __call__(self, _: object) -> float | None:
+        self.calls += 1
+        value = self._values[min(self.calls, len(self._values)) - 1]
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+@pytest.mark.asyncio
+async def test_reads_use_primary_without_replica() -> None:
+    primary = FakeSessionFactory("primary")
+    router = SessionRouter(primary)
+
+    router.record_write("AB12CD34")
+
+    assert await router.reader("AB12CD34") is primary
+    assert await router.reader() is primary
+    assert router.replica_reads == 0
+
+
+@pytest.mark.asyncio
+async def test_reads_use_replica_when_lag_is_within_limit() -> None:
+    primary = FakeSessionFactory("primary")
+    replica = FakeSessionFactory("replica")
+    probe = LagProbe(0.5)
+    router = SessionRouter(primary, replica, max_replica_lag_seconds=1.0, lag_probe=probe)
+
+    assert await router.reader("AB12CD34") is replica
+    assert await router.reader() is replica
+    assert router.replica_lag_seconds == 0.5
+    assert probe.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_recent_writes_read_from_primary_until_window_passes() -> None:
+    clock = FakeClock()
+    primary = FakeSessionFactory("primary")
+    replica = FakeSessionFactory("replica")
+    router = SessionRouter(
+        primary,
+        replica,
+        read_your_writes_seconds=5.0,
+        lag_probe=LagProbe(0.0),
+        time_provider=clock,
+    )
+
+    router.record_write("AB12CD34")
+
+    assert await router.reader("AB12CD34") is primary
+    assert await router.reader("ZX98CV76") is replica
+    clock.now = 5.0
+    assert await router.reader("AB12CD34") is replica
+
+
+@pytest.mark.asyncio
+async def test_lagging_or_unknown_replica_falls_back_to_primary_until_next_probe() -> None:
+    clock = FakeClock()
+    primary = FakeSessionFactory("primary")
+    replica = FakeSessionFactory("replica")
+    probe = LagProbe(10.0, RuntimeError("replica down"), None, 0.0)
+    router = SessionRouter(
+        primary,
+        replica,
+        max_replica_lag_seconds=2.0,
+        lag_check_interval_seconds=5.0,
+        lag_probe=probe,
+        time_provider=clock,
+    )
+
+    assert await router.reader() is primary
+    clock.now = 4.0
+    assert await router.reader() is primary
+    assert probe.calls == 1
+    clock.now = 5.0
+    assert await router.reader() is primary
+    assert router.replica_lag_seconds is None
+    clock.now = 10.0
+    assert await router.reader() is primary
+    clock.now = 15.0
+    assert await router.reader() is replica
+    assert probe.calls == 4
+    assert router.primary_reads == 4
+
+
+@pytest.mark.asyncio
+async def test_oldest_tracked_write_is_evicted_beyond_limit() -> None:
+    primary = FakeSessionFactory("primary")
+    replica = FakeSessionFactory("replica")
+    router = SessionRouter(primary, replica, max_tracked_writes=2, lag_probe=LagProbe(0.0))
+
+    for key in ("A", "B", "C"):
+        router.record_write(key)
+
+    assert await router.reader("A") is replica
+    assert await router.reader("B") is primary
+    assert await router.reader("C") is primary
+
+
+def test_router_validates_arguments() -> None:
+    primary = FakeSessionFactory("primary")
+    with pytest.raises(ValueError, match="lag_check_interval_seconds"):
+        SessionRouter(primary, lag_check_interval_seconds=0)
+    with pytest.raises(ValueError, match="max_tracked_writes"):
+        SessionRouter(primary, max_tracked_writes=0)
@@ -0,0 +1,179 @@
+import asyncio
+
+import pytest
+
+from reservas_api.infrastructure.resilience import (
+    CircuitBreakerOpenError,
+    CircuitBreakerRegistry,
+    CircuitState,
+    SlidingWindowCircuitBreaker,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _ok() -> str:
+    return "ok"
+
+
+async def _fail() -> None:
+    raise RuntimeError("upstream error")
+
+
+async def _record(breaker: SlidingWindowCircuitBreaker, successes: int, failures: int) -> None:
+    for _ in range(successes):
+        await breaker.call(_ok)
+    for _ in range(failures):
+        with pytest.raises(RuntimeError):
+            await breaker.call(_fail)
+
+
+@pytest.mark.asyncio
+async def test_breaker_ignores_failures_below_the_rate_threshold() -> None:
+    breaker = SlidingWindowCircuitBreaker(failure_threshold=3, failure_rate_threshold=0.5)
+
+    await _record(breaker, successes=10, failures=4)
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.failure_count == 4
+    assert breaker.failure_rate == pytest.approx(4 / 14)
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_when_the_failure_rate_is_reached() -> None:
+    breaker = SlidingWindowCircuitBreaker(failure_threshold=3, failure_rate_threshold=0.5)
+
+    await _record(breaker, successes=3, failures=3)
+
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitBreakerOpenError):
+        await breaker.call(_ok)
+
+
+@pytest.mark.asyncio
+async def test_old_failures_slide_out_of_the_window() -> None:
+    clock = FakeClock()
+    breaker = SlidingWindowCircuitBreaker(
+        failure_threshold=3,
+        window_seconds=10,
+        bucket_count=5,
+        time_provider=clock,
+    )
+
+    await _record(breaker, successes=0, failures=2)
+    clock.now += 11
+    await _record(breaker, successes=0, failures=2)
+
+    assert breaker.failure_count == 2
+    assert breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_half_open_admits_limited_probes_then_closes() -> None:
+    clock = FakeClock()
+    breaker = SlidingWindowCircuitBreaker(
+        failure_threshold=1,
+        recovery_timeout_seconds=5,
+        half_open_max_calls=2,
+        time_provider=clock,
+    )
+    await _record(breaker, successes=0, failures=1)
+    clock.now += 5
+    release = asyncio.Event()
+
+    async def _slow_ok() -> str:
+        await release.wait()
+        return "ok"
+
+    probes = [asyncio.create_task(breaker.call(_slow_ok)) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    with pytest.raises(CircuitBreakerOpenError):
+        await breaker.call(_ok)
+
+    release.set()
+    await asyncio.gather(*probes)
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.failure_count == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_probe_reopens_the_circuit() -> None:
+    clock = FakeClock()
+    breaker = SlidingWindowCircuitBreaker(
+        failure_threshold=1,
+        recovery_timeout_seconds=5,
+        time_provider=clock,
+    )
+    await _record(breaker, successes=0, failures=1)
+    clock.now += 5
+
+    await _record(breaker, successes=0, failures=1)
+
+    assert breaker.state == CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_frees_its_half_open_slot() -> None:
+    clock = FakeClock()
+    breaker = SlidingWindowCircuitBreaker(
+        failure_threshold=1,
+        recovery_timeout_seconds=5,
+        time_provider=clock,
+    )
+    await _record(breaker, successes=0, failures=1)
+    clock.now += 5
+
+    probe = asyncio.create_task(breaker.call(asyncio.Event().wait))
+    await asyncio.sleep(0)
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert await breaker.call(_ok) == "ok"
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_registry_shares_one_breaker_per_upstream() -> None:
+    registry = CircuitBreakerRegistry(SlidingWindowCircuitBreaker)
+
+    assert registry.get("stripe") is registry.get("stripe")
+    assert registry.get("stripe") is not registry.get("provider")
+    assert registry.states() == {"provider": CircuitState.CLOSED, "stripe": CircuitState.CLOSED}
+
+
+def test_registry_evicts_least_recently_used_breakers_above_max_keys() -> None:
+    registry = CircuitBreakerRegistry(SlidingWindowCircuitBreaker, max_keys=2)
+    first = registry.get("SUP001")
+    registry.get("SUP002")
+    registry.get("SUP001")
+    registry.get("SUP003")
+
+    assert len(registry) == 2
+    assert registry.get("SUP001") is first
+    assert set(registry.states()) == {"SUP001", "SUP003"}
+
+
+def test_registry_evicts_idle_breakers() -> None:
+    clock = FakeClock()
+    registry = CircuitBreakerRegistry(
+        SlidingWindowCircuitBreaker, idle_seconds=60, time_provider=clock
+    )
+    idle = registry.get("SUP001")
+    clock.now += 30
+    registry.get("SUP002")
+    clock.now += 31
+
+    registry.get("SUP002")
+
+    assert list(registry.states()) == ["SUP002"]
+    assert registry.get("SUP001") is not idle
@@ -1,3 +1,4 @@
+import json
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
@@ -84,3 +85,45 @@ async def test_stripe_gateway_returns_circuit_open_when_breaker_opened() -> None
     assert second.status == "CIRCUIT_OPEN"
     assert attempts == 1
 
+
+
+@pytest.mark.asyncio
+async def test_stripe_gateway_posts_prebuilt_request_body_unchanged() -> None:
+    body = StripePaymentGateway.build_request_body(_reservation())
+    captured: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured.append(request)
+        return httpx.Response(200, json={"status": "paid"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="https://stripe.test") as client:
+        gateway = StripePaymentGateway(
+            client=client,
+            circuit_breaker=CircuitBreaker(failure_threshold=2, recovery_timeout_seconds=60),
+        )
+        result = await gateway.process_payment_request(body)
+
+    assert result.success is True
+    assert captured[0].content == body
+    assert captured[0].headers["Content-Type"] == "application/json"
+    assert json.loads(body)["amount"] == "250.00"
+
+
+@pytest.mark.asyncio
+async def test_stripe_gateway_sends_idempotency_key_header() -> None:
+    captured: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured.append(request)
+        return httpx.Response(200, json={"status": "paid"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="https://stripe.test") as client:
+        gateway = StripePaymentGateway(
+            client=client,
+            circuit_breaker=CircuitBreaker(failure_threshold=2, recovery_timeout_seconds=60),
+        )
+        await gateway.process_payment_request(b"{}", idempotency_key="key-001")
+        await gateway.process_payment(_reservation())
+
+    assert captured[0].headers["Idempotency-Key"] == "key-001"
+    assert captured[1].headers["Idempotency-Key"] == "AB12CD34"